@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Benchmarks for configuration loading: ``load_config_from_path`` on single
+files, folders of many files, deep and wide JSON, and ``Config.load``/``save``.
+"""
+
+import json
+import os
+from typing import Any, Dict
+
+from harness import benchmark
+
+from python_sample_app.config import Config
+from python_sample_app.main import load_config_from_path
+
+
+def _write_json(path: str, data: Any) -> None:
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f)
+
+
+def _single_file(tmp_dir: str) -> str:
+    path = os.path.join(tmp_dir, "config.json")
+    _write_json(path, {"test": "Hello World", "output_dir": "./output"})
+    return path
+
+
+def _folder(num_files: int):
+    def setup(tmp_dir: str) -> str:
+        for i in range(num_files):
+            _write_json(os.path.join(tmp_dir, f"part_{i:06d}.json"), {f"key_{i}": i, "test": f"value {i}"})
+        return tmp_dir
+
+    return setup
+
+
+def _deep_file(tmp_dir: str) -> str:
+    data: Dict[str, Any] = {"leaf": "value"}
+    for depth in range(200):
+        data = {f"level_{depth}": data, "test": "deep"}
+    path = os.path.join(tmp_dir, "deep.json")
+    _write_json(path, data)
+    return path
+
+
+def _wide_file(tmp_dir: str) -> str:
+    data = {f"key_{i}": {"value": i, "name": f"item-{i}"} for i in range(100_000)}
+    data["test"] = "wide"
+    path = os.path.join(tmp_dir, "wide.json")
+    _write_json(path, data)
+    return path
+
+
+@benchmark("load_config.single_file", setup=_single_file)
+def bench_single_file(path: str) -> None:
+    load_config_from_path(path)
+
+
+@benchmark("load_config.folder_10", setup=_folder(10))
+def bench_folder_10(path: str) -> None:
+    load_config_from_path(path)
+
+
+@benchmark("load_config.folder_1k", setup=_folder(1_000))
+def bench_folder_1k(path: str) -> None:
+    load_config_from_path(path)
+
+
+@benchmark("load_config.folder_100k", setup=_folder(100_000), heavy=True)
+def bench_folder_100k(path: str) -> None:
+    load_config_from_path(path)
+
+
+@benchmark("load_config.deep_json", setup=_deep_file)
+def bench_deep_json(path: str) -> None:
+    load_config_from_path(path)
+
+
+@benchmark("load_config.wide_json", setup=_wide_file)
+def bench_wide_json(path: str) -> None:
+    load_config_from_path(path)
+
+
+@benchmark("config.load", setup=_single_file)
+def bench_config_load(path: str) -> None:
+    Config.load(path)
+
+
+@benchmark("config.save", setup=lambda tmp_dir: os.path.join(tmp_dir, "saved.json"))
+def bench_config_save(path: str) -> None:
+    Config(output_dir="./output").save(path)
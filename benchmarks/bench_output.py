@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Benchmarks for writing output.txt at several payload sizes, and for writing
+many small output files plainly, with an fsync per file and through the
+group-committing OutputWriter.
+"""
+
+import os
+
+from harness import benchmark
+
+from python_sample_app.core.output_writer import OutputWriter
+from python_sample_app.main import write_output
+
+PAYLOAD_SIZES = {
+    "1KiB": (1 << 10, False),
+    "1MiB": (1 << 20, False),
+    "64MiB": (64 << 20, True),
+}
+
+
+def _payload(size: int):
+    def setup(tmp_dir: str):
+        return os.path.join(tmp_dir, "output.txt"), "x" * size
+
+    return setup
+
+
+def _register(label: str, size: int, heavy: bool) -> None:
+    @benchmark(f"write_output.{label}", setup=_payload(size), heavy=heavy)
+    def bench(context) -> None:
+        output_file, text = context
+        write_output(output_file, text)
+
+
+for _label, (_size, _heavy) in PAYLOAD_SIZES.items():
+    _register(_label, _size, _heavy)
+
+
+MANY_FILES = 200
+
+
+def _fsync_directory(directory: str) -> None:
+    if not hasattr(os, "O_DIRECTORY"):
+        return
+    fd = os.open(directory, os.O_RDONLY | os.O_DIRECTORY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def _many_files(tmp_dir: str):
+    return [(os.path.join(tmp_dir, f"output_{i:04d}.txt"), f"value {i}\n") for i in range(MANY_FILES)]
+
+
+@benchmark(f"output_files.{MANY_FILES}.plain", setup=_many_files)
+def bench_many_plain(outputs) -> None:
+    for path, text in outputs:
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(text)
+
+
+@benchmark(f"output_files.{MANY_FILES}.fsync_each", setup=_many_files)
+def bench_many_fsync_each(outputs) -> None:
+    for path, text in outputs:
+        temp_path = path + ".tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            f.write(text)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, path)
+        # Same durability as the writer: the rename itself must reach the disk
+        _fsync_directory(os.path.dirname(path))
+
+
+@benchmark(f"output_files.{MANY_FILES}.group_commit", setup=_many_files)
+def bench_many_group_commit(outputs) -> None:
+    with OutputWriter() as writer:
+        for path, text in outputs:
+            writer.submit(path, text)
@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+Benchmarks for config schema validation: the compiled batch validator against
+a naive check that interprets the schema key by key for every record.
+"""
+
+from typing import Any, Dict, List
+
+from harness import benchmark
+
+from python_sample_app.core.schema import CONFIG_SCHEMA, Field, config_validator
+
+BATCH_SIZES = {"1k": 1_000, "100k": 100_000}
+
+
+def _records(count: int):
+    def setup(tmp_dir: str) -> List[Dict[str, Any]]:
+        records: List[Dict[str, Any]] = []
+        for i in range(count):
+            if i % 4 == 3:
+                records.append({"test": i, "output_dir": None})
+            else:
+                records.append({"test": f"value {i}", "output_dir": f"./output/{i}", "extra": i})
+        return records
+
+    return setup
+
+
+def naive_validate(schema: Dict[str, Field], records: List[Any]) -> List[str]:
+    """Reference check: walk the schema for every record, one key at a time."""
+    errors = []
+    for index, record in enumerate(records):
+        if not isinstance(record, dict):
+            errors.append(f"{index}: Configuration must be a JSON object. Got: {type(record)!r}")
+            continue
+        for key, field in schema.items():
+            if key not in record or (field.nullable and record[key] is None):
+                if field.required:
+                    errors.append(f"{index}: Configuration {key!r} is required")
+                continue
+            value = record[key]
+            types = field.type_tuple()
+            if not isinstance(value, types) or (isinstance(value, bool) and bool not in types):
+                errors.append(f"{index}: Configuration {key!r} must be {field.describe()}. Got: {type(value)!r}")
+            elif field.choices is not None and value not in field.choices:
+                errors.append(f"{index}: Configuration {key!r} must be one of {field.choices!r}. Got: {value!r}")
+    return errors
+
+
+def _register(label: str, count: int) -> None:
+    @benchmark(f"schema.compiled.{label}", setup=_records(count))
+    def bench_compiled(records) -> None:
+        config_validator.validate_many(records)
+
+    @benchmark(f"schema.naive.{label}", setup=_records(count))
+    def bench_naive(records) -> None:
+        naive_validate(CONFIG_SCHEMA, records)
+
+
+for _label, _count in BATCH_SIZES.items():
+    _register(_label, _count)
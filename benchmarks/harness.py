@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+"""
+Minimal micro-benchmark harness (stdlib only).
+
+Benchmarks are registered with the ``@benchmark`` decorator. Each one gets a
+fresh temporary directory for its ``setup`` callable, runs untimed warmup calls
+and then a fixed number of timed repetitions. Results are plain JSON so they
+can be stored as baselines and compared later with a Mann-Whitney U test.
+"""
+
+import gc
+import json
+import math
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SRC_DIR = os.path.join(PROJECT_ROOT, "src")
+if SRC_DIR not in sys.path:
+    sys.path.insert(0, SRC_DIR)
+
+
+@dataclass
+class Benchmark:
+    """A registered benchmark case."""
+
+    name: str
+    func: Callable[[Any], Any]
+    setup: Optional[Callable[[str], Any]] = None
+    heavy: bool = False
+
+
+@dataclass
+class BenchmarkResult:
+    """Timing samples (seconds per call) and summary statistics for one case."""
+
+    name: str
+    samples: List[float] = field(default_factory=list)
+
+    def summary(self) -> Dict[str, Any]:
+        samples = self.samples
+        return {
+            "samples": samples,
+            "min": min(samples),
+            "median": statistics.median(samples),
+            "mean": statistics.mean(samples),
+            "stdev": statistics.stdev(samples) if len(samples) > 1 else 0.0,
+        }
+
+
+REGISTRY: List[Benchmark] = []
+
+
+def benchmark(name: str, setup: Optional[Callable[[str], Any]] = None, heavy: bool = False):
+    """Register ``func(context)`` as a benchmark; ``setup(tmp_dir)`` builds the context.
+
+    Heavy cases (large fixtures) only run when the runner is given ``--full``.
+    """
+
+    def decorator(func: Callable[[Any], Any]) -> Callable[[Any], Any]:
+        REGISTRY.append(Benchmark(name=name, func=func, setup=setup, heavy=heavy))
+        return func
+
+    return decorator
+
+
+def run_benchmark(bench: Benchmark, warmup: int, repeat: int) -> BenchmarkResult:
+    """Run one benchmark with warmup and repetitions; GC is disabled while timing."""
+    result = BenchmarkResult(bench.name)
+    with tempfile.TemporaryDirectory(prefix="bench-") as tmp_dir:
+        context = bench.setup(tmp_dir) if bench.setup else None
+        for _ in range(warmup):
+            bench.func(context)
+        gc_was_enabled = gc.isenabled()
+        gc.collect()
+        gc.disable()
+        try:
+            for _ in range(repeat):
+                start = time.perf_counter()
+                bench.func(context)
+                result.samples.append(time.perf_counter() - start)
+        finally:
+            if gc_was_enabled:
+                gc.enable()
+    return result
+
+
+def environment_metadata() -> Dict[str, Any]:
+    """Describe the machine and interpreter the results were recorded on."""
+    from python_sample_app.core import json_codec
+
+    return {
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "python": sys.version.split()[0],
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "cpu_count": os.cpu_count(),
+        "json_backend": json_codec.get_backend(),
+    }
+
+
+def save_results(path: str, results: List[BenchmarkResult]) -> None:
+    """Write results and environment metadata as a JSON baseline file."""
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    data = {
+        "meta": environment_metadata(),
+        "benchmarks": {r.name: r.summary() for r in results},
+    }
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2)
+
+
+def load_results(path: str) -> Dict[str, Any]:
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def mann_whitney_u(a: List[float], b: List[float]) -> float:
+    """Two-sided p-value of the Mann-Whitney U test (normal approximation, tie-corrected)."""
+    n1, n2 = len(a), len(b)
+    if n1 == 0 or n2 == 0:
+        return 1.0
+    combined = sorted([(v, 0) for v in a] + [(v, 1) for v in b])
+    ranks = [0.0] * len(combined)
+    tie_term = 0.0
+    i = 0
+    while i < len(combined):
+        j = i
+        while j + 1 < len(combined) and combined[j + 1][0] == combined[i][0]:
+            j += 1
+        rank = (i + j) / 2 + 1
+        for k in range(i, j + 1):
+            ranks[k] = rank
+        ties = j - i + 1
+        tie_term += ties ** 3 - ties
+        i = j + 1
+    rank_sum_a = sum(r for r, (_, group) in zip(ranks, combined) if group == 0)
+    u = rank_sum_a - n1 * (n1 + 1) / 2
+    n = n1 + n2
+    variance = n1 * n2 / 12 * ((n + 1) - tie_term / (n * (n - 1)))
+    if variance <= 0:
+        return 1.0
+    z = (abs(u - n1 * n2 / 2) - 0.5) / math.sqrt(variance)
+    return math.erfc(max(z, 0.0) / math.sqrt(2))
+
+
+def compare_results(
+    baseline: Dict[str, Any],
+    current: Dict[str, Any],
+    alpha: float = 0.01,
+    min_change: float = 0.05,
+) -> List[Dict[str, Any]]:
+    """Compare two result files case by case.
+
+    A case is a regression when its median slowed down by more than
+    ``min_change`` and the difference is significant at ``alpha``.
+    """
+    rows = []
+    for name, new in current["benchmarks"].items():
+        old = baseline["benchmarks"].get(name)
+        if old is None:
+            continue
+        ratio = new["median"] / old["median"] if old["median"] else float("inf")
+        p_value = mann_whitney_u(old["samples"], new["samples"])
+        significant = p_value < alpha and abs(ratio - 1) > min_change
+        if significant and ratio > 1:
+            status = "REGRESSION"
+        elif significant:
+            status = "improved"
+        else:
+            status = "same"
+        rows.append(
+            {
+                "name": name,
+                "baseline_median": old["median"],
+                "current_median": new["median"],
+                "ratio": ratio,
+                "p_value": p_value,
+                "status": status,
+            }
+        )
+    return rows
@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+Run the python_sample_app micro-benchmark suite or compare two result files.
+
+Examples:
+  python benchmarks/run_benchmarks.py run                          # quick cases
+  python benchmarks/run_benchmarks.py run --full -o base.json      # include heavy cases
+  python benchmarks/run_benchmarks.py run --baseline base.json     # run, then compare
+  python benchmarks/run_benchmarks.py compare base.json new.json   # compare stored runs
+"""
+
+import argparse
+import os
+import sys
+from typing import List
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import harness  # noqa: E402
+import bench_config  # noqa: E402,F401  (registers benchmarks)
+import bench_output  # noqa: E402,F401  (registers benchmarks)
+import bench_schema  # noqa: E402,F401  (registers benchmarks)
+
+DEFAULT_OUTPUT = os.path.join(harness.PROJECT_ROOT, "benchmarks", "results", "latest.json")
+
+
+def print_header(text: str) -> None:
+    """Print a header with formatting."""
+    print(f"\n{'=' * 60}")
+    print(f"  {text}")
+    print(f"{'=' * 60}\n")
+
+
+def print_comparison(rows: List[dict]) -> int:
+    """Print a comparison table and return the number of regressions."""
+    print(f"  {'benchmark':<32}{'base ms':>11}{'new ms':>11}{'ratio':>8}{'p':>9}  status")
+    regressions = 0
+    for row in rows:
+        print(
+            f"  {row['name']:<32}{row['baseline_median'] * 1000:>11.3f}"
+            f"{row['current_median'] * 1000:>11.3f}{row['ratio']:>8.2f}"
+            f"{row['p_value']:>9.4f}  {row['status']}"
+        )
+        if row["status"] == "REGRESSION":
+            regressions += 1
+    return regressions
+
+
+def compare(baseline_path: str, current_path: str, alpha: float, min_change: float) -> int:
+    print_header("Benchmark Comparison")
+    print(f"Baseline: {baseline_path}\nCurrent:  {current_path}\n")
+    rows = harness.compare_results(
+        harness.load_results(baseline_path),
+        harness.load_results(current_path),
+        alpha=alpha,
+        min_change=min_change,
+    )
+    regressions = print_comparison(rows)
+    if regressions:
+        print(f"\n❌ {regressions} significant regression(s)")
+        return 1
+    print("\n✅ No significant regressions")
+    return 0
+
+
+def run(args: argparse.Namespace) -> int:
+    selected = [
+        b
+        for b in harness.REGISTRY
+        if (args.full or not b.heavy) and (not args.filter or args.filter in b.name)
+    ]
+    print_header("Benchmark Run")
+    print(f"{len(selected)} benchmark(s), warmup={args.warmup}, repeat={args.repeat}\n")
+    print(f"  {'benchmark':<32}{'median ms':>12}{'min ms':>12}{'stdev ms':>12}")
+    results = []
+    for bench in selected:
+        result = harness.run_benchmark(bench, args.warmup, args.repeat)
+        summary = result.summary()
+        print(
+            f"  {bench.name:<32}{summary['median'] * 1000:>12.3f}"
+            f"{summary['min'] * 1000:>12.3f}{summary['stdev'] * 1000:>12.3f}"
+        )
+        results.append(result)
+    harness.save_results(args.output, results)
+    print(f"\nResults written to {args.output}")
+    if args.baseline:
+        return compare(args.baseline, args.output, args.alpha, args.min_change)
+    return 0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="python_sample_app micro-benchmarks",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=__doc__.split("Examples:")[1],
+    )
+    sub = parser.add_subparsers(dest="mode", required=True)
+
+    run_parser = sub.add_parser("run", help="Run benchmarks and store results")
+    run_parser.add_argument("--output", "-o", default=DEFAULT_OUTPUT, help="Result file")
+    run_parser.add_argument("--warmup", type=int, default=3, help="Untimed calls per case")
+    run_parser.add_argument("--repeat", type=int, default=30, help="Timed calls per case")
+    run_parser.add_argument("--filter", "-k", default=None, help="Only run cases containing this text")
+    run_parser.add_argument("--full", action="store_true", help="Include heavy cases")
+    run_parser.add_argument("--baseline", default=None, help="Compare against this result file")
+
+    compare_parser = sub.add_parser("compare", help="Compare two result files")
+    compare_parser.add_argument("baseline")
+    compare_parser.add_argument("current")
+
+    for p in (run_parser, compare_parser):
+        p.add_argument("--alpha", type=float, default=0.01, help="Significance level")
+        p.add_argument(
+            "--min-change",
+            type=float,
+            default=0.05,
+            help="Ignore median changes smaller than this fraction",
+        )
+
+    args = parser.parse_args()
+    if args.mode == "compare":
+        return compare(args.baseline, args.current, args.alpha, args.min_change)
+    return run(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
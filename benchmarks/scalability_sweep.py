@@ -0,0 +1,390 @@
+#!/usr/bin/env python3
+"""
+Scalability sweep: run the CLI on synthetic configs of growing size and fit the growth curve.
+
+Axes (each swept geometrically, other dimensions kept minimal):
+  files       number of JSON files in a config folder (load_config_from_path merge)
+  keys        number of keys in one config file
+  value_size  bytes in one config value that is loaded but not written
+  depth       nesting depth of one config value
+  payload     bytes in the 'test' value, i.e. loaded and written to output.txt
+
+Every point is timed end to end (``python main.py --config ...``, median of
+--repeat runs). The median of a minimal config is subtracted so the fit sees the
+cost that grows with the input rather than interpreter start-up; the exponent b
+of time ~ n^b is the slope of a least-squares line in log-log space, fitted over
+the points whose excess clearly stands out of the start-up noise. An axis is
+flagged SUPERLINEAR when b exceeds 1 + --tolerance, and the first segment whose
+local slope does so is reported as where linear scaling stops.
+
+Writes sweep.csv, sweep.json and sweep.svg (log-log chart per axis) into the
+output directory. The exit code is 1 when any axis is superlinear.
+
+Examples:
+  python benchmarks/scalability_sweep.py                                  # default ranges
+  python benchmarks/scalability_sweep.py --axes files --max-files 1000000
+  python benchmarks/scalability_sweep.py --axes payload --max-payload 1G
+"""
+
+import argparse
+import csv
+import json
+import math
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from dataclasses import asdict, dataclass, field
+from typing import Callable, Dict, List, Optional, Sequence
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import harness  # noqa: E402
+
+DEFAULT_OUTPUT_DIR = os.path.join(harness.PROJECT_ROOT, "benchmarks", "results", "scalability")
+MAIN_PY = os.path.join(harness.PROJECT_ROOT, "main.py")
+AXES = ("files", "keys", "value_size", "depth", "payload")
+_SIZE_SUFFIXES = {"K": 1 << 10, "M": 1 << 20, "G": 1 << 30}
+# Excess time below this is indistinguishable from start-up jitter
+MIN_SIGNAL = 0.002
+# Only points whose excess is this many noise floors high are fitted
+FIT_SIGNAL_FACTOR = 3
+
+
+@dataclass
+class Point:
+    """Timing of the CLI at one size of one axis (seconds)."""
+
+    axis: str
+    size: int
+    median: float
+    minimum: float
+    stdev: float
+    excess: float
+    samples: List[float] = field(default_factory=list)
+
+
+@dataclass
+class Fit:
+    """Power-law fit time ~ n^exponent of an axis' excess times."""
+
+    axis: str
+    exponent: Optional[float]
+    r_squared: Optional[float]
+    points_used: int
+    breakpoint: Optional[int]
+    superlinear: bool
+    note: str = ""
+
+
+def parse_size(text: str) -> int:
+    """'1000', '64M', '1G' -> int (binary suffixes for K/M/G)."""
+    text = text.strip().upper().rstrip("B")
+    if text and text[-1] in _SIZE_SUFFIXES:
+        return int(float(text[:-1]) * _SIZE_SUFFIXES[text[-1]])
+    return int(float(text))
+
+
+def geometric(start: int, stop: int, per_decade: int) -> List[int]:
+    """Sizes from start to stop (inclusive), per_decade log-spaced steps per factor of ten."""
+    sizes: List[int] = []
+    step = 0
+    while True:
+        size = round(start * 10 ** (step / per_decade))
+        if size > stop:
+            break
+        if not sizes or size != sizes[-1]:
+            sizes.append(size)
+        step += 1
+    if sizes and sizes[-1] != stop:
+        sizes.append(stop)
+    return sizes
+
+
+def _write_json(path: str, data) -> None:
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f)
+
+
+def _base_config(output_dir: str) -> Dict:
+    return {"test": "sweep", "output_dir": output_dir}
+
+
+class FolderBuilder:
+    """Grows one config folder file by file, so the largest point is written only once."""
+
+    def __init__(self, directory: str, output_dir: str):
+        self.directory = directory
+        self.count = 1
+        os.makedirs(directory, exist_ok=True)
+        _write_json(os.path.join(directory, "part_0000000.json"), _base_config(output_dir))
+
+    def __call__(self, size: int) -> str:
+        while self.count < size:
+            _write_json(os.path.join(self.directory, f"part_{self.count:07d}.json"), {f"key_{self.count}": self.count})
+            self.count += 1
+        return self.directory
+
+
+def _single_file_builder(directory: str, output_dir: str, make: Callable[[int, Dict], None]) -> Callable[[int], str]:
+    os.makedirs(directory, exist_ok=True)
+
+    def build(size: int) -> str:
+        config = _base_config(output_dir)
+        make(size, config)
+        path = os.path.join(directory, "config.json")
+        _write_json(path, config)
+        return path
+
+    return build
+
+
+def _nested(depth: int) -> Dict:
+    value: Dict = {"leaf": 1}
+    for _ in range(depth - 1):
+        value = {"child": value}
+    return value
+
+
+def builders(work_dir: str, output_dir: str) -> Dict[str, Callable[[int], str]]:
+    """Axis name -> build(size) returning the --config path for that size."""
+    def keys(size: int, config: Dict) -> None:
+        config.update({f"key_{i}": i for i in range(size)})
+
+    def value_size(size: int, config: Dict) -> None:
+        config["blob"] = "x" * size
+
+    def depth(size: int, config: Dict) -> None:
+        config["nested"] = _nested(size)
+
+    def payload(size: int, config: Dict) -> None:
+        config["test"] = "x" * size
+
+    return {
+        "files": FolderBuilder(os.path.join(work_dir, "files"), output_dir),
+        "keys": _single_file_builder(os.path.join(work_dir, "keys"), output_dir, keys),
+        "value_size": _single_file_builder(os.path.join(work_dir, "value_size"), output_dir, value_size),
+        "depth": _single_file_builder(os.path.join(work_dir, "depth"), output_dir, depth),
+        "payload": _single_file_builder(os.path.join(work_dir, "payload"), output_dir, payload),
+    }
+
+
+def time_cli(config_path: str, repeat: int) -> List[float]:
+    """Wall time of `python main.py --config config_path`, repeat times (one untimed warmup)."""
+    cmd = [sys.executable, MAIN_PY, "--config", config_path]
+    samples = []
+    for iteration in range(repeat + 1):
+        start = time.perf_counter()
+        result = subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
+        elapsed = time.perf_counter() - start
+        if result.returncode != 0:
+            raise RuntimeError(f"CLI failed on {config_path}: {result.stderr.strip()[-500:]}")
+        if iteration:
+            samples.append(elapsed)
+    return samples
+
+
+def fit_power_law(points: Sequence[Point], threshold: float, tolerance: float) -> Fit:
+    """Least-squares fit of log(excess) on log(size) over points whose excess exceeds threshold."""
+    axis = points[0].axis if points else ""
+    usable = [p for p in points if p.excess > threshold and p.size > 0]
+    breakpoint = None
+    for previous, current in zip(usable, usable[1:]):
+        local = math.log(current.excess / previous.excess) / math.log(current.size / previous.size)
+        if local > 1 + tolerance:
+            breakpoint = previous.size
+            break
+    if len(usable) < 3:
+        return Fit(axis, None, None, len(usable), breakpoint, False,
+                   note="too few points above start-up noise; raise the axis maximum")
+    xs = [math.log10(p.size) for p in usable]
+    ys = [math.log10(p.excess) for p in usable]
+    mean_x, mean_y = statistics.mean(xs), statistics.mean(ys)
+    sxx = sum((x - mean_x) ** 2 for x in xs)
+    slope = sum((x - mean_x) * (y - mean_y) for x, y in zip(xs, ys)) / sxx
+    intercept = mean_y - slope * mean_x
+    ss_res = sum((y - (intercept + slope * x)) ** 2 for x, y in zip(xs, ys))
+    ss_tot = sum((y - mean_y) ** 2 for y in ys)
+    r_squared = 1 - ss_res / ss_tot if ss_tot else 1.0
+    return Fit(axis, slope, r_squared, len(usable), breakpoint, slope > 1 + tolerance)
+
+
+def _svg_panel(x0: int, y0: int, width: int, height: int, points: List[Point], fit: Fit,
+               threshold: float) -> List[str]:
+    usable = [p for p in points if p.excess > 0]
+    out = [f'<g transform="translate({x0},{y0})">',
+           f'<rect width="{width}" height="{height}" fill="#fff" stroke="#ccc"/>']
+    exponent = f"b = {fit.exponent:.2f}" if fit.exponent is not None else "no fit"
+    colour = "#c0392b" if fit.superlinear else "#2c3e50"
+    out.append(f'<text x="10" y="18" font-size="13" fill="{colour}">{fit.axis}: {exponent}'
+               f'{" SUPERLINEAR" if fit.superlinear else ""}</text>')
+    if not usable:
+        out.append("</g>")
+        return out
+    left, top, right, bottom = 55, 30, width - 15, height - 35
+    lx = [math.log10(p.size) for p in usable]
+    ly = [math.log10(p.excess) for p in usable]
+    x_min, x_max = math.floor(min(lx)), math.ceil(max(lx))
+    y_min, y_max = math.floor(min(ly + [math.log10(threshold)])), math.ceil(max(ly))
+    x_max, y_max = max(x_max, x_min + 1), max(y_max, y_min + 1)
+
+    def sx(v: float) -> float:
+        return left + (v - x_min) / (x_max - x_min) * (right - left)
+
+    def sy(v: float) -> float:
+        return bottom - (v - y_min) / (y_max - y_min) * (bottom - top)
+
+    for decade in range(x_min, x_max + 1):
+        out.append(f'<line x1="{sx(decade):.1f}" y1="{top}" x2="{sx(decade):.1f}" y2="{bottom}" stroke="#eee"/>')
+        out.append(f'<text x="{sx(decade):.1f}" y="{bottom + 14}" font-size="10" text-anchor="middle">1e{decade}</text>')
+    for decade in range(y_min, y_max + 1):
+        out.append(f'<line x1="{left}" y1="{sy(decade):.1f}" x2="{right}" y2="{sy(decade):.1f}" stroke="#eee"/>')
+        out.append(f'<text x="{left - 4}" y="{sy(decade) + 3:.1f}" font-size="10" text-anchor="end">1e{decade}s</text>')
+    out.append(f'<line x1="{left}" y1="{sy(math.log10(threshold)):.1f}" x2="{right}" '
+               f'y2="{sy(math.log10(threshold)):.1f}" stroke="#bbb" stroke-dasharray="2,3"/>')
+    polyline = " ".join(f"{sx(x):.1f},{sy(y):.1f}" for x, y in zip(lx, ly))
+    out.append(f'<polyline points="{polyline}" fill="none" stroke="#2980b9" stroke-width="1.5"/>')
+    for x, y in zip(lx, ly):
+        out.append(f'<circle cx="{sx(x):.1f}" cy="{sy(y):.1f}" r="3" fill="#2980b9"/>')
+    if fit.exponent is not None:
+        fitted = [p for p in usable if p.excess > threshold]
+        xs = [math.log10(p.size) for p in fitted]
+        ys = [math.log10(p.excess) for p in fitted]
+        intercept = statistics.mean(ys) - fit.exponent * statistics.mean(xs)
+        x1, x2 = min(xs), max(xs)
+        out.append(f'<line x1="{sx(x1):.1f}" y1="{sy(intercept + fit.exponent * x1):.1f}" '
+                   f'x2="{sx(x2):.1f}" y2="{sy(intercept + fit.exponent * x2):.1f}" '
+                   f'stroke="{colour}" stroke-dasharray="5,4"/>')
+    out.append(f'<text x="{(left + right) / 2:.0f}" y="{height - 5}" font-size="10" text-anchor="middle">'
+               f'size (log)  - excess time over a minimal config (log)</text>')
+    out.append("</g>")
+    return out
+
+
+def write_svg(path: str, results: Dict[str, List[Point]], fits: Dict[str, Fit], threshold: float) -> None:
+    """One log-log panel per axis: measured excess time, fitted line and the fit threshold."""
+    width, height, columns = 420, 280, 2
+    rows = math.ceil(len(results) / columns)
+    parts = [f'<svg xmlns="http://www.w3.org/2000/svg" width="{width * columns}" height="{height * rows}" '
+             f'font-family="sans-serif">']
+    for index, (axis, points) in enumerate(results.items()):
+        parts.extend(_svg_panel((index % columns) * width, (index // columns) * height,
+                                width - 10, height - 10, points, fits[axis], threshold))
+    parts.append("</svg>")
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("\n".join(parts))
+
+
+def write_reports(output_dir: str, results: Dict[str, List[Point]], fits: Dict[str, Fit],
+                  baseline: List[float], noise: float) -> None:
+    os.makedirs(output_dir, exist_ok=True)
+    with open(os.path.join(output_dir, "sweep.csv"), "w", encoding="utf-8", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(["axis", "size", "median_s", "min_s", "stdev_s", "excess_s"])
+        for points in results.values():
+            for p in points:
+                writer.writerow([p.axis, p.size, f"{p.median:.6f}", f"{p.minimum:.6f}",
+                                 f"{p.stdev:.6f}", f"{p.excess:.6f}"])
+    data = {
+        "meta": harness.environment_metadata(),
+        "baseline": {"median": statistics.median(baseline), "samples": baseline, "noise_floor": noise,
+                     "fit_threshold": noise * FIT_SIGNAL_FACTOR},
+        "fits": {axis: asdict(fit) for axis, fit in fits.items()},
+        "points": {axis: [asdict(p) for p in points] for axis, points in results.items()},
+    }
+    with open(os.path.join(output_dir, "sweep.json"), "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2)
+    write_svg(os.path.join(output_dir, "sweep.svg"), results, fits, noise * FIT_SIGNAL_FACTOR)
+
+
+def axis_sizes(args: argparse.Namespace) -> Dict[str, List[int]]:
+    steps = args.points_per_decade
+    return {
+        "files": geometric(1, args.max_files, steps),
+        "keys": geometric(10, args.max_keys, steps),
+        "value_size": geometric(1 << 10, args.max_value_size, steps),
+        "depth": geometric(1, args.max_depth, steps),
+        "payload": geometric(1 << 10, args.max_payload, steps),
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Sweep config/payload sizes through the CLI and fit the growth curve",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=__doc__.split("Examples:")[1],
+    )
+    parser.add_argument("--axes", default=",".join(AXES), help=f"Comma-separated subset of {', '.join(AXES)}")
+    parser.add_argument("--repeat", type=int, default=3, help="Timed CLI runs per point (median is used)")
+    parser.add_argument("--points-per-decade", type=int, default=3, help="Sizes per factor of ten on each axis")
+    parser.add_argument("--max-files", type=parse_size, default=10_000, help="Largest folder (up to 1e6)")
+    parser.add_argument("--max-keys", type=parse_size, default=1_000_000, help="Most keys in one file")
+    parser.add_argument("--max-value-size", type=parse_size, default=64 << 20, help="Largest value, e.g. 64M")
+    parser.add_argument("--max-depth", type=int, default=512,
+                        help="Deepest nesting (the JSON decoder's recursion limit caps this near 1000)")
+    parser.add_argument("--max-payload", type=parse_size, default=64 << 20, help="Largest 'test' value, e.g. 1G")
+    parser.add_argument("--tolerance", type=float, default=0.2,
+                        help="Exponent above 1 + tolerance is flagged superlinear")
+    parser.add_argument("--output-dir", "-o", default=DEFAULT_OUTPUT_DIR, help="Report directory")
+    parser.add_argument("--work-dir", default=None, help="Where fixtures are generated (default: temp dir)")
+    args = parser.parse_args()
+
+    selected = [a.strip() for a in args.axes.split(",") if a.strip()]
+    unknown = set(selected) - set(AXES)
+    if unknown:
+        parser.error(f"unknown axes: {', '.join(sorted(unknown))}")
+
+    work_dir = tempfile.mkdtemp(prefix="sweep-", dir=args.work_dir)
+    try:
+        output_dir = os.path.join(work_dir, "output")
+        build = builders(work_dir, output_dir)
+        baseline_config = os.path.join(work_dir, "baseline.json")
+        _write_json(baseline_config, _base_config(output_dir))
+        baseline = time_cli(baseline_config, max(args.repeat, 5))
+        baseline_median = statistics.median(baseline)
+        noise = max(MIN_SIGNAL, 3 * statistics.stdev(baseline))
+        print(f"Baseline CLI run: {baseline_median * 1000:.1f} ms (noise floor {noise * 1000:.1f} ms)\n")
+
+        results: Dict[str, List[Point]] = {}
+        fits: Dict[str, Fit] = {}
+        sizes = axis_sizes(args)
+        for axis in selected:
+            print(f"{axis}:")
+            points = []
+            for size in sizes[axis]:
+                samples = time_cli(build[axis](size), args.repeat)
+                median = statistics.median(samples)
+                point = Point(axis, size, median, min(samples),
+                              statistics.stdev(samples) if len(samples) > 1 else 0.0,
+                              max(median - baseline_median, 0.0), samples)
+                points.append(point)
+                print(f"  {size:>12,}  {median * 1000:>10.1f} ms  (+{point.excess * 1000:.1f} ms)")
+            results[axis] = points
+            fits[axis] = fit_power_law(points, noise * FIT_SIGNAL_FACTOR, args.tolerance)
+            fit = fits[axis]
+            if fit.exponent is None:
+                print(f"  -> {fit.note}\n")
+            else:
+                status = "SUPERLINEAR" if fit.superlinear else "ok"
+                where = f", local slope exceeds {1 + args.tolerance:.2f} after {fit.breakpoint:,}" \
+                    if fit.breakpoint else ""
+                print(f"  -> time ~ n^{fit.exponent:.2f} (r^2 {fit.r_squared:.3f}, {fit.points_used} points){where}"
+                      f"  {status}\n")
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+    write_reports(args.output_dir, results, fits, baseline, noise)
+    print(f"Reports written to {args.output_dir} (sweep.csv, sweep.json, sweep.svg)")
+    superlinear = [axis for axis, fit in fits.items() if fit.superlinear]
+    if superlinear:
+        print(f"\n❌ Superlinear growth: {', '.join(superlinear)}")
+        return 1
+    print("\n✅ No superlinear growth detected")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Benchmark the JSON decoding backends used for config loading.
+
+Generates representative config files (small, medium, large) and times
+``json_codec.load_file`` for every installed backend, alongside the previous
+stdlib text-mode ``json.load`` path as a baseline.
+"""
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import tempfile
+import time
+from typing import Callable, Dict, List
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(PROJECT_ROOT, "src"))
+
+from python_sample_app.core import json_codec  # noqa: E402
+
+# name -> approximate number of top-level keys
+SIZES = {
+    "small": 10,
+    "medium": 2_000,
+    "large": 200_000,
+}
+
+
+def print_header(text: str) -> None:
+    """Print a header with formatting."""
+    print(f"\n{'=' * 60}")
+    print(f"  {text}")
+    print(f"{'=' * 60}\n")
+
+
+def make_config(num_keys: int) -> Dict:
+    """Build a config dict with a mix of strings, numbers and nested objects."""
+    config: Dict = {"test": "Hello World", "output_dir": "./output"}
+    for i in range(num_keys):
+        config[f"key_{i}"] = {
+            "name": f"value-{i}",
+            "enabled": i % 2 == 0,
+            "weight": i * 0.5,
+            "tags": ["alpha", "beta", "gamma"][: i % 3 + 1],
+        }
+    return config
+
+
+def stdlib_text_load(path: str):
+    """Previous config read path: text-mode file object + json.load."""
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def time_loader(loader: Callable[[str], object], path: str, repeat: int) -> List[float]:
+    """Return per-call timings in seconds (after one warmup call)."""
+    loader(path)
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        loader(path)
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark JSON decoding backends")
+    parser.add_argument("--repeat", type=int, default=20, help="Timed calls per case")
+    parser.add_argument(
+        "--sizes",
+        nargs="*",
+        choices=list(SIZES),
+        default=list(SIZES),
+        help="Config sizes to benchmark",
+    )
+    args = parser.parse_args()
+
+    backends = json_codec.available_backends()
+    print_header("JSON Backend Benchmark")
+    print(f"Installed backends: {', '.join(backends)}")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for size in args.sizes:
+            path = os.path.join(tmp, f"config_{size}.json")
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(make_config(SIZES[size]), f, indent=2)
+            size_kb = os.path.getsize(path) / 1024
+
+            print(f"\n{size} ({size_kb:,.1f} KiB)")
+            print(f"  {'backend':<16}{'median ms':>12}{'min ms':>12}{'speedup':>10}")
+            results = {"json (text)": time_loader(stdlib_text_load, path, args.repeat)}
+            for name in backends:
+                json_codec.set_backend(name)
+                results[name] = time_loader(json_codec.load_file, path, args.repeat)
+
+            baseline = statistics.median(results["json (text)"])
+            for name, timings in results.items():
+                median = statistics.median(timings)
+                print(
+                    f"  {name:<16}{median * 1000:>12.3f}{min(timings) * 1000:>12.3f}"
+                    f"{baseline / median:>9.2f}x"
+                )
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+Compare CLI cold-start latency across invocation styles.
+
+Each mode runs the same config end-to-end in a fresh interpreter:
+- pyz:   the zipapp built by scripts/build_zipapp.py
+- wheel: the installed package (console script or ``-m python_sample_app.main``)
+- main:  the repository ``main.py`` wrapper that patches ``sys.path`` to ``src/``
+"""
+
+import argparse
+import json
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT / "scripts"))
+
+from build_zipapp import DEFAULT_OUTPUT, build_zipapp  # noqa: E402
+
+
+def print_header(text: str) -> None:
+    """Print a header with formatting."""
+    print(f"\n{'=' * 60}")
+    print(f"  {text}")
+    print(f"{'=' * 60}\n")
+
+
+def print_warning(text: str) -> None:
+    """Print warning message."""
+    print(f"⚠️  {text}")
+
+
+def installed_command() -> Optional[List[str]]:
+    """Return a command running the installed package, or None if not installed."""
+    script = shutil.which("python_sample_app")
+    if script:
+        return [script]
+    # Probe from a neutral directory so the repository checkout is not on sys.path
+    probe = subprocess.run(
+        [sys.executable, "-c", "import python_sample_app"],
+        cwd=tempfile.gettempdir(),
+        capture_output=True,
+    )
+    if probe.returncode == 0:
+        return [sys.executable, "-m", "python_sample_app.main"]
+    return None
+
+
+def time_command(command: List[str], cwd: str, runs: int, warmup: int) -> List[float]:
+    """Run command warmup + runs times and return wall-clock timings in seconds."""
+    timings = []
+    for i in range(warmup + runs):
+        start = time.perf_counter()
+        result = subprocess.run(command, cwd=cwd, capture_output=True)
+        elapsed = time.perf_counter() - start
+        if result.returncode != 0:
+            raise RuntimeError(
+                f"{' '.join(command)} exited with {result.returncode}: "
+                f"{result.stderr.decode(errors='replace')}"
+            )
+        if i >= warmup:
+            timings.append(elapsed)
+    return timings
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark CLI startup latency")
+    parser.add_argument("--runs", type=int, default=20, help="Timed runs per mode")
+    parser.add_argument("--warmup", type=int, default=3, help="Untimed runs per mode")
+    parser.add_argument(
+        "--pyz", type=Path, default=DEFAULT_OUTPUT, help="Zipapp to benchmark"
+    )
+    parser.add_argument(
+        "--rebuild", action="store_true", help="Rebuild the zipapp before benchmarking"
+    )
+    args = parser.parse_args()
+
+    if args.rebuild or not args.pyz.exists():
+        build_zipapp(args.pyz)
+
+    with tempfile.TemporaryDirectory() as workdir:
+        config_path = os.path.join(workdir, "config.json")
+        with open(config_path, "w", encoding="utf-8") as f:
+            json.dump({"test": "Startup Benchmark", "output_dir": "./output"}, f)
+        cli_args = ["--config", config_path]
+
+        modes: Dict[str, Optional[List[str]]] = {
+            "pyz": [sys.executable, str(args.pyz)],
+            "wheel": installed_command(),
+            "main.py": [sys.executable, str(PROJECT_ROOT / "main.py")],
+        }
+
+        print_header("CLI Startup Benchmark")
+        print(f"Python: {sys.version.split()[0]}  runs={args.runs} warmup={args.warmup}\n")
+        print(f"  {'mode':<10}{'median ms':>12}{'min ms':>12}{'mean ms':>12}")
+        for name, command in modes.items():
+            if command is None:
+                print_warning(f"{name}: package not installed (pip install .), skipped")
+                continue
+            timings = time_command(command + cli_args, workdir, args.runs, args.warmup)
+            print(
+                f"  {name:<10}{statistics.median(timings) * 1000:>12.2f}"
+                f"{min(timings) * 1000:>12.2f}{statistics.mean(timings) * 1000:>12.2f}"
+            )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
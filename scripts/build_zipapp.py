@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+Build a self-contained zipapp (.pyz) of python_sample_app.
+
+The archive contains only precompiled bytecode for the package, laid out at the
+archive root next to a tiny ``__main__.py``:
+
+    python_sample_app.pyz
+    ├── __main__.py
+    └── python_sample_app/
+        ├── __init__.pyc
+        ├── main.pyc
+        └── ...
+
+Modules are compiled ahead of time (legacy ``module.pyc`` layout, which
+zipimport loads directly) so cold starts never compile or try to write a
+bytecode cache, and entries are stored uncompressed by default so imports are
+plain reads. Bytecode is specific to the interpreter version used for the
+build; run the archive with the same ``python3.X``.
+"""
+
+import argparse
+import os
+import py_compile
+import shutil
+import sys
+import tempfile
+import zipapp
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+PACKAGE_NAME = "python_sample_app"
+DEFAULT_OUTPUT = PROJECT_ROOT / "dist" / f"{PACKAGE_NAME}.pyz"
+
+MAIN_STUB = f"""import sys
+from {PACKAGE_NAME}.main import main
+sys.exit(main())
+"""
+
+
+def print_info(text: str) -> None:
+    """Print info message."""
+    print(f"ℹ️  {text}")
+
+
+def print_success(text: str) -> None:
+    """Print success message."""
+    print(f"✅ {text}")
+
+
+def stage_package(staging_dir: Path, optimize: int) -> int:
+    """Copy the package into staging_dir as bytecode only; return module count."""
+    source_pkg = PROJECT_ROOT / "src" / PACKAGE_NAME
+    count = 0
+    for source in sorted(source_pkg.rglob("*.py")):
+        if "__pycache__" in source.parts:
+            continue
+        relative = source.relative_to(source_pkg.parent)
+        target = staging_dir / relative.with_suffix(".pyc")
+        target.parent.mkdir(parents=True, exist_ok=True)
+        py_compile.compile(
+            str(source),
+            cfile=str(target),
+            dfile=str(relative),
+            doraise=True,
+            optimize=optimize,
+        )
+        count += 1
+    (staging_dir / "__main__.py").write_text(MAIN_STUB, encoding="utf-8")
+    return count
+
+
+def build_zipapp(
+    output: Path = DEFAULT_OUTPUT,
+    interpreter: str = None,
+    optimize: int = 2,
+    compressed: bool = False,
+) -> Path:
+    """Build the .pyz archive and return its path."""
+    if interpreter is None:
+        interpreter = f"/usr/bin/env python{sys.version_info.major}.{sys.version_info.minor}"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    staging_dir = Path(tempfile.mkdtemp(prefix="pyz-build-"))
+    try:
+        count = stage_package(staging_dir, optimize)
+        print_info(f"Compiled {count} modules (optimize={optimize})")
+        zipapp.create_archive(
+            staging_dir,
+            target=output,
+            interpreter=interpreter,
+            compressed=compressed,
+        )
+    finally:
+        shutil.rmtree(staging_dir, ignore_errors=True)
+    return output
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Build a python_sample_app zipapp")
+    parser.add_argument(
+        "--output",
+        "-o",
+        type=Path,
+        default=DEFAULT_OUTPUT,
+        help=f"Output archive (default: {DEFAULT_OUTPUT.relative_to(PROJECT_ROOT)})",
+    )
+    parser.add_argument(
+        "--python",
+        dest="interpreter",
+        default=None,
+        help="Shebang interpreter (default: /usr/bin/env python3.X of the build interpreter)",
+    )
+    parser.add_argument(
+        "--optimize",
+        type=int,
+        choices=[0, 1, 2],
+        default=2,
+        help="Bytecode optimization level (default: 2, strips asserts and docstrings)",
+    )
+    parser.add_argument(
+        "--compress", action="store_true", help="Deflate archive entries (smaller, slower to import)"
+    )
+    args = parser.parse_args()
+
+    output = build_zipapp(args.output, args.interpreter, args.optimize, args.compress)
+    size_kb = os.path.getsize(output) / 1024
+    print_success(f"Built {output} ({size_kb:.1f} KiB)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
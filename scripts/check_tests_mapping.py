@@ -8,7 +8,7 @@ ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
 TESTS_DIR = os.path.join(ROOT, 'tests')
 
 ID_PATTERN = re.compile(r"test[_-](.+)$")
-PY_RUN = re.compile(r"run_test\(\s*\"([^\"]+)\"\s*\)")
+PY_RUN = re.compile(r"run_(?:test|benchmark|matrix)\(\s*\"([^\"]+)\"\s*\)")
 PY_LOAD = re.compile(r"load_test_data\(\s*\"([^\"]+)\"\s*\)")
 PY_ASSIGN = re.compile(r"test_id\s*=\s*\"([^\"]+)\"")
 
@@ -2,13 +2,26 @@
 """
 Generate coverage reports using the standard coverage tool.
 This script runs tests with coverage and generates standard HTML reports.
+
+Collection runs the test suite and the example concurrently, each writing its
+own parallel data file (CLI subprocesses started by the tests are measured
+too), then combines them once. On Python 3.12+ coverage uses the
+sys.monitoring core, which is much cheaper than classic tracing.
 """
 
 import argparse
+import configparser
+import os
 import subprocess
 import sys
+import time
 from pathlib import Path
-from typing import Dict
+from typing import Dict, List, Optional, Tuple
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+GENERATED_RCFILE = PROJECT_ROOT / ".cache" / "coverage" / "coveragerc"
+# Automatic subprocess measurement via [run] patch needs coverage 7.10+
+PATCH_SUBPROCESS_VERSION = (7, 10)
 
 
 def print_header(text: str) -> None:
@@ -33,36 +46,131 @@ def print_info(text: str) -> None:
     print(f"ℹ️  {text}")
 
 
-def run_coverage_analysis() -> bool:
-    """Run coverage analysis on the project."""
+def coverage_version() -> Optional[Tuple[int, ...]]:
+    """Installed coverage.py version, or None when it is not installed."""
+    try:
+        import coverage
+    except ImportError:
+        return None
+    return tuple(coverage.version_info[:2])
+
+
+def write_rcfile(version: Tuple[int, ...], rcfile: Path = GENERATED_RCFILE) -> Path:
+    """Write the rcfile used for collection, derived from .coveragerc.
+
+    Paths are made absolute because the tests run the CLI from temporary
+    directories, and every process writes a parallel data file.
+    """
+    config = configparser.ConfigParser(interpolation=None)
+    config.read(PROJECT_ROOT / ".coveragerc")
+    if not config.has_section("run"):
+        config.add_section("run")
+    config.set("run", "source", str(PROJECT_ROOT / "src" / "python_sample_app"))
+    config.remove_option("run", "include")
+    config.set("run", "data_file", str(PROJECT_ROOT / ".coverage"))
+    config.set("run", "parallel", "True")
+    if version >= PATCH_SUBPROCESS_VERSION:
+        config.set("run", "patch", "subprocess")
+    rcfile.parent.mkdir(parents=True, exist_ok=True)
+    with open(rcfile, "w", encoding="utf-8") as f:
+        config.write(f)
+    return rcfile
+
+
+def _startup_hook_dir(rcfile: Path) -> Path:
+    """sitecustomize that starts coverage in child interpreters (coverage < 7.10)."""
+    hook_dir = rcfile.parent / "subprocess_hook"
+    hook_dir.mkdir(parents=True, exist_ok=True)
+    (hook_dir / "sitecustomize.py").write_text(
+        "import coverage\ncoverage.process_startup()\n", encoding="utf-8"
+    )
+    return hook_dir
+
+
+def coverage_environment(version: Tuple[int, ...], rcfile: Path) -> Dict[str, str]:
+    """Environment for the collection stages (and the processes they start)."""
+    env = os.environ.copy()
+    python_path = [str(PROJECT_ROOT / "src")]
+    if version < PATCH_SUBPROCESS_VERSION:
+        env["COVERAGE_PROCESS_START"] = str(rcfile)
+        python_path.insert(0, str(_startup_hook_dir(rcfile)))
+    if env.get("PYTHONPATH"):
+        python_path.append(env["PYTHONPATH"])
+    env["PYTHONPATH"] = os.pathsep.join(python_path)
+    # Cached passes would skip the runs we want to measure
+    env["TEST_RESULT_CACHE"] = "0"
+    # sys.monitoring based measurement (coverage 7.4+) on Python 3.12+
+    if sys.version_info >= (3, 12) and version >= (7, 4):
+        env.setdefault("COVERAGE_CORE", "sysmon")
+    return env
+
+
+def collection_stages(rcfile: Path) -> Dict[str, List[str]]:
+    """Commands that produce coverage data, all independent of each other."""
+    run = [sys.executable, "-m", "coverage", "run", f"--rcfile={rcfile}"]
+    return {
+        "tests": run + ["-m", "pytest", "tests/", "-v"],
+        "example": run + ["-m", "python_sample_app.main", "--config", "tests/example/config.json"],
+    }
+
+
+def run_coverage_analysis(tests_log: Optional[Path] = None) -> bool:
+    """Collect coverage from the test and example stages in parallel, then combine."""
     print_header("Running Coverage Analysis")
 
-    # Ensure coverage is installed
-    try:
-        subprocess.run(
-            ["python3", "-m", "coverage", "--version"], check=True, capture_output=True
-        )
-    except (subprocess.CalledProcessError, FileNotFoundError):
+    version = coverage_version()
+    if version is None:
         print_error("Coverage not installed. Install with: pip install coverage")
         return False
 
-    # Clean previous coverage data
+    rcfile = write_rcfile(version)
+    env = coverage_environment(version, rcfile)
+    print_info(f"Using generated rcfile {rcfile} (core: {env.get('COVERAGE_CORE', 'default')})")
+
+    # Clean previous coverage data (combined and parallel files)
     print_info("Cleaning previous coverage data...")
-    subprocess.run(["python3", "-m", "coverage", "erase"], check=True)
-
-    # Run tests with coverage
-    print_info("Running tests with coverage...")
-    result = subprocess.run(
-        ["python3", "-m", "coverage", "run", "-m", "pytest", "-v"],
-        capture_output=True,
-        text=True,
+    subprocess.run([sys.executable, "-m", "coverage", "erase", f"--rcfile={rcfile}"],
+                   cwd=PROJECT_ROOT, check=True)
+
+    log_dir = rcfile.parent / "logs"
+    log_dir.mkdir(parents=True, exist_ok=True)
+    logs = {name: log_dir / f"{name}.log" for name in collection_stages(rcfile)}
+    if tests_log is not None:
+        tests_log.parent.mkdir(parents=True, exist_ok=True)
+        logs["tests"] = tests_log
+
+    start = time.perf_counter()
+    running = {}
+    for name, cmd in collection_stages(rcfile).items():
+        print_info(f"Starting {name} stage: {' '.join(cmd)}")
+        log = open(logs[name], "w", encoding="utf-8")
+        running[name] = (subprocess.Popen(cmd, cwd=PROJECT_ROOT, env=env, stdout=log,
+                                          stderr=subprocess.STDOUT), log)
+    success = True
+    for name, (process, log) in running.items():
+        returncode = process.wait()
+        log.close()
+        if returncode == 0:
+            print_success(f"{name} stage completed (log: {logs[name]})")
+        else:
+            print_error(f"{name} stage failed with return code {returncode} (log: {logs[name]})")
+            success = False
+    print_info(f"Stages finished in {time.perf_counter() - start:.1f}s")
+
+    print_info("Combining coverage data...")
+    combined = subprocess.run(
+        [sys.executable, "-m", "coverage", "combine", f"--rcfile={rcfile}"],
+        cwd=PROJECT_ROOT, capture_output=True, text=True,
     )
-
-    if result.returncode != 0:
-        print_error("Tests failed. Coverage report may be incomplete.")
-        print(result.stderr)
+    if combined.returncode != 0:
+        print_error(f"coverage combine failed: {combined.stderr.strip() or combined.stdout.strip()}")
         return False
+    summary = (combined.stdout + combined.stderr).strip().splitlines()
+    print_info(summary[-1] if summary else "Coverage data combined")
 
+    if not success:
+        print_error("Some stages failed. Coverage report may be incomplete.")
+        return False
     print_success("Tests completed successfully")
     return True
 
@@ -115,7 +223,18 @@ def main():
     parser.add_argument(
         "--run-tests",
         action="store_true",
-        help="Run tests with coverage before generating reports",
+        help="Run tests and the example with coverage (in parallel) before generating reports",
+    )
+    parser.add_argument(
+        "--collect-only",
+        action="store_true",
+        help="Only collect and combine coverage data (implies --run-tests), skip reports",
+    )
+    parser.add_argument(
+        "--tests-log",
+        type=Path,
+        default=None,
+        help="Write the test stage output to this file",
     )
 
     args = parser.parse_args()
@@ -123,9 +242,11 @@ def main():
     print_header("Coverage Report Generator")
 
     # Run coverage analysis if requested
-    if args.run_tests:
-        if not run_coverage_analysis():
+    if args.run_tests or args.collect_only:
+        if not run_coverage_analysis(args.tests_log):
             return 1
+        if args.collect_only:
+            return 0
 
     # Generate coverage reports
     output_dir = Path(args.output_dir)
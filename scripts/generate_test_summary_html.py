@@ -5,6 +5,8 @@ This script reads test output and generates a beautiful HTML summary.
 """
 
 import argparse
+import html
+import json
 import re
 import sys
 from datetime import datetime
@@ -123,7 +125,54 @@ def parse_test_output(log_file: Path) -> Dict:
     return stats
 
 
-def generate_html_summary(stats: Dict, output_file: Path) -> None:
+def load_benchmarks(benchmarks_file: Path) -> List[Dict]:
+    """Load benchmark summaries written by run_all_tests.py (empty if absent)."""
+    if not benchmarks_file.exists():
+        return []
+    try:
+        data = json.loads(benchmarks_file.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return []
+    # Keep the last result per test id
+    latest = {}
+    for entry in data.get("benchmarks", []):
+        latest[entry.get("test_id")] = entry
+    return list(latest.values())
+
+
+def generate_benchmarks_section(benchmarks: List[Dict]) -> str:
+    """Render the benchmark table (median/p95 in milliseconds)."""
+    if not benchmarks:
+        return ""
+
+    def ms(value) -> str:
+        return f"{value * 1000:.1f}" if isinstance(value, (int, float)) else "-"
+
+    rows = []
+    for entry in benchmarks:
+        settings = entry.get("settings", {})
+        status = "PASSED" if entry.get("passed") else "FAILED"
+        color = "#4caf50" if entry.get("passed") else "#f44336"
+        rows.append(
+            f"<tr><td>{html.escape(str(entry.get('test_id')))}</td>"
+            f"<td>{entry.get('iterations')} (+{settings.get('warmup', 0)} warmup)</td>"
+            f"<td>{ms(entry.get('mean'))}</td><td>{ms(entry.get('stdev'))}</td>"
+            f"<td>{ms(entry.get('median'))}</td><td>{ms(entry.get('p95'))}</td>"
+            f"<td>{ms(settings.get('max_median'))}</td><td>{ms(settings.get('max_p95'))}</td>"
+            f"<td style=\"color: {color}; font-weight: bold\">{status}</td></tr>"
+        )
+    return f"""
+            <div class="test-details">
+                <h3>Benchmarks (ms)</h3>
+                <table class="benchmarks">
+                    <tr><th>Test</th><th>Iterations</th><th>Mean</th><th>Stdev</th><th>Median</th><th>p95</th><th>Max median</th><th>Max p95</th><th>Status</th></tr>
+                    {''.join(rows)}
+                </table>
+            </div>
+"""
+
+
+def generate_html_summary(stats: Dict, output_file: Path, benchmarks: Optional[List[Dict]] = None) -> None:
     """Generate HTML test summary."""
 
     # Calculate success rate
@@ -262,6 +311,18 @@ def generate_html_summary(stats: Dict, output_file: Path) -> None:
             margin: 5px 0;
             color: #666;
         }}
+        .benchmarks {{
+            border-collapse: collapse;
+            width: 100%;
+        }}
+        .benchmarks th, .benchmarks td {{
+            padding: 6px 10px;
+            border-bottom: 1px solid #e0e0e0;
+            text-align: right;
+        }}
+        .benchmarks th:first-child, .benchmarks td:first-child {{
+            text-align: left;
+        }}
         .nav {{ 
             background: #0366d6; 
             color: white; 
@@ -337,7 +398,7 @@ def generate_html_summary(stats: Dict, output_file: Path) -> None:
                 <p><strong>Execution Time:</strong> {stats['execution_time']:.2f} seconds</p>
                 <p><strong>Overall Status:</strong> {stats['status']}</p>
             </div>
-
+{generate_benchmarks_section(benchmarks or [])}
             {f'''
             <div class="failed-tests">
                 <div class="failed-header">Failed Tests Details</div>
@@ -368,6 +429,11 @@ def main():
         default="artifacts/test_reports/test_summary.html",
         help="Path to output HTML file (default: artifacts/test_reports/test_summary.html)",
     )
+    parser.add_argument(
+        "--benchmarks-file",
+        default="artifacts/test_reports/benchmarks.json",
+        help="Benchmark results to include, if present (default: artifacts/test_reports/benchmarks.json)",
+    )
 
     args = parser.parse_args()
 
@@ -381,7 +447,8 @@ def main():
     stats = parse_test_output(log_file)
 
     # Generate HTML summary
-    generate_html_summary(stats, output_file)
+    benchmarks = load_benchmarks(Path(args.benchmarks_file))
+    generate_html_summary(stats, output_file, benchmarks)
 
     print(f"✅ HTML test summary generated: {output_file}")
     print(f"📈 Test Statistics:")
@@ -3,20 +3,26 @@
 Enhanced Test Runner for C to PlantUML Converter
 
 This script provides comprehensive testing capabilities including:
-- Unittest and pytest support
+- pytest (parallel via pytest-xdist, the default) and unittest (fallback) support
 - Coverage reporting
 - Test categorization (unit, feature, integration)
 - Detailed reporting and styling
 """
 
 import argparse
+import importlib.util
+import json
 import os
+import shutil
+import sqlite3
 import subprocess
 import sys
+import tempfile
 import time
 import unittest
+import xml.etree.ElementTree as ET
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 
 def setup_environment():
@@ -98,14 +104,28 @@ def check_dependencies() -> bool:
     return True
 
 
+def _without_performance(suite: unittest.TestSuite) -> unittest.TestSuite:
+    """Copy of a discovered suite without the tests under tests/performance/."""
+    kept = unittest.TestSuite()
+    for test in suite:
+        if isinstance(test, unittest.TestSuite):
+            kept.addTest(_without_performance(test))
+        elif not test.id().startswith("performance."):
+            kept.addTest(test)
+    return kept
+
+
 def run_unittest_tests(test_pattern: str = "test_*.py", verbosity: int = 2) -> bool:
-    """Run tests using unittest framework sequentially (no parallel execution)."""
+    """Run tests using unittest framework sequentially (no parallel execution).
+
+    Performance tests are left out; they only run via run_performance_tests.
+    """
     print_subheader("Running Tests with unittest")
 
     # Use unittest discovery to find and run all tests sequentially
     # unittest runs tests in a single thread by default (no parallel execution)
     test_loader = unittest.TestLoader()
-    test_suite = test_loader.discover("tests", pattern=test_pattern)
+    test_suite = _without_performance(test_loader.discover("tests", pattern=test_pattern))
 
     # Run tests sequentially in a single thread
     runner = unittest.TextTestRunner(verbosity=verbosity, stream=sys.stdout)
@@ -135,15 +155,33 @@ def run_unittest_tests(test_pattern: str = "test_*.py", verbosity: int = 2) -> b
 
 
 def run_pytest_tests(
-    test_categories: List[str], verbosity: int = 1, with_coverage: bool = False
+    test_categories: List[str],
+    verbosity: int = 1,
+    with_coverage: bool = False,
+    jobs: str = "auto",
+    test_paths: Optional[List[str]] = None,
+    env: Optional[Dict[str, str]] = None,
+    junit_file: Optional[Path] = None,
+    history_kind: str = "pytest",
 ) -> bool:
-    """Run tests using pytest framework sequentially (no parallel execution)."""
+    """Run tests using pytest, in parallel via pytest-xdist when it is installed.
+
+    Every test works in its own per-worker workspace (see tests/framework/base.py),
+    so workers never touch each other's fixtures. Pass jobs="0" to run sequentially.
+    test_paths restricts the run to files or node ids (default: tests/).
+    Performance tests are deselected unless their category is requested; they
+    never share a run with other tests (see run_performance_tests).
+    """
     print_subheader("Running Tests with pytest")
 
     cmd = ["python", "-m", "pytest"]
 
-    # Ensure sequential execution (no parallel workers)
-    cmd.extend(["-n", "0"])  # Explicitly disable parallel execution
+    workers = 0
+    if importlib.util.find_spec("xdist") is not None:
+        cmd.extend(["-n", jobs])
+        workers = _xdist_workers(jobs)
+    elif jobs != "0":
+        print_warning("pytest-xdist not installed; running sequentially")
 
     # Add verbosity
     if verbosity >= 2:
@@ -162,25 +200,337 @@ def run_pytest_tests(
             ]
         )
 
-    # Add test categories/markers
-    if test_categories:
-        for category in test_categories:
-            cmd.extend(["-m", category])
+    # Add test categories/markers (pytest keeps only the last -m, so build one expression)
+    cmd.extend(["-m", " or ".join(test_categories) if test_categories else "not performance"])
+
+    # Duration history needs a junit report and the framework's CLI timings
+    history = _history_files(junit_file)
+    if history is not None:
+        env = dict(env or os.environ)
+        env[history["env_key"]] = history["timings"]
+        junit_file = history["junit"]
+
+    if junit_file is not None:
+        cmd.append(f"--junit-xml={junit_file}")
 
     # Add test directories
-    cmd.append("tests/")
+    cmd.extend(test_paths or ["tests/"])
 
     print_info(f"Running command: {' '.join(cmd)}")
 
     try:
-        result = subprocess.run(cmd, timeout=300)  # 5 minutes timeout
-        return result.returncode == 0
+        result = subprocess.run(cmd, timeout=300, env=env)  # 5 minutes timeout
+        success = result.returncode == 0
     except subprocess.TimeoutExpired:
         print_error("Tests timed out after 5 minutes")
-        return False
+        success = False
     except Exception as e:
         print_error(f"Error running pytest: {e}")
+        success = False
+    if history is not None:
+        # Coverage-instrumented runs are slower and kept apart from plain runs, and
+        # durations only compare between runs with the same number of workers
+        kind = "coverage" if with_coverage else history_kind
+        success = _record_history(f"{kind}-n{workers}", history, success)
+    return success
+
+
+def _xdist_workers(jobs: str) -> int:
+    """Number of pytest-xdist workers `-n jobs` starts (0: no workers, tests run in-process)."""
+    if jobs in ("auto", "logical"):
+        try:
+            import psutil
+
+            count = psutil.cpu_count(logical=jobs == "logical")
+        except ImportError:
+            count = None
+        return count or os.cpu_count() or 1
+    try:
+        return int(jobs)
+    except ValueError:
+        return 0
+
+
+def _history_files(junit_file: Optional[Path]) -> Optional[Dict]:
+    """Temporary files for recording a run in the duration history (None when disabled)."""
+    import test_history
+    from tests.framework.perf import CLI_TIMINGS_ENV
+
+    if not test_history.enabled():
+        return None
+    created = []
+    if junit_file is None:
+        fd, path = tempfile.mkstemp(prefix="junit-", suffix=".xml")
+        os.close(fd)
+        junit_file = Path(path)
+        created.append(path)
+    fd, timings = tempfile.mkstemp(prefix="cli-timings-", suffix=".jsonl")
+    os.close(fd)
+    created.append(timings)
+    return {"junit": junit_file, "timings": timings, "env_key": CLI_TIMINGS_ENV, "created": created}
+
+
+def _record_history(kind: str, history: Dict, success: bool) -> bool:
+    """Store the run in the duration history and apply the TEST_HISTORY_GATE check."""
+    import test_history
+
+    try:
+        run_id = test_history.record_from_files(kind, history["junit"], history["timings"], success)
+    except (sqlite3.Error, OSError, ET.ParseError, ValueError) as e:
+        print_warning(f"Could not record test history: {e}")
+        return success
+    finally:
+        for path in history["created"]:
+            if os.path.exists(path):
+                os.unlink(path)
+    if run_id is None:
+        return success
+    print_info(f"Recorded run {run_id} in {test_history.database_path()}")
+    threshold = os.environ.get(test_history.HISTORY_GATE_ENV)
+    if not threshold:
+        return success
+    window = int(os.environ.get(test_history.HISTORY_WINDOW_ENV) or test_history.DEFAULT_WINDOW)
+    conn = test_history.connect()
+    try:
+        regressions = test_history.gate(conn, run_id, float(threshold), window)
+    finally:
+        conn.close()
+    for r in regressions:
+        print_error(
+            f"{r['nodeid']} took {r['duration']:.3f}s, {test_history.format_change(r['change'])} over its "
+            f"median of {r['median']:.3f}s in the last {r['runs']} runs"
+        )
+    if regressions:
+        return False
+    print_success(f"No test slower than {float(threshold):.0%} over its rolling median")
+    return success
+
+
+def _pick_performance_cpu(requested: Optional[int]) -> Optional[int]:
+    """Choose the CPU to pin performance runs to (last allowed CPU by default)."""
+    if not hasattr(os, "sched_getaffinity"):
+        return None
+    allowed = sorted(os.sched_getaffinity(0))
+    if requested is None:
+        return allowed[-1]
+    if requested not in allowed:
+        raise ValueError(f"CPU {requested} is not available (allowed: {allowed})")
+    return requested
+
+
+def _read_junit_cases(junit_file: Path) -> List[dict]:
+    """Extract per-test name, duration and outcome from a junit XML report."""
+    if not junit_file.exists():
+        return []
+    cases = []
+    for case in ET.parse(junit_file).getroot().iter("testcase"):
+        outcome = "passed"
+        for child in case:
+            if child.tag in ("failure", "error", "skipped"):
+                outcome = "failed" if child.tag == "failure" else child.tag
+        cases.append(
+            {
+                "name": f"{case.get('classname')}.{case.get('name')}",
+                "time": float(case.get("time", 0.0)),
+                "outcome": outcome,
+            }
+        )
+    return cases
+
+
+def _read_jsonl(path: str) -> List[Dict]:
+    """Read and delete a JSONL results file written by the test process."""
+    entries = []
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                entries.append(json.loads(line))
+    os.unlink(path)
+    return entries
+
+
+def run_performance_tests(
+    verbosity: int = 1,
+    cpu: Optional[int] = None,
+    report_dir: str = "artifacts/test_reports",
+) -> bool:
+    """Run performance-marked tests alone and sequentially under controlled conditions.
+
+    The run is pinned to a single CPU (inherited by the CLI subprocesses), tests
+    disable GC in their measured sections (see tests/framework/perf.py), and a
+    JSON report with environment metadata, per-test durations and measurements
+    is written to report_dir.
+    """
+    print_subheader("Running Performance Tests")
+    from tests.framework.perf import BENCHMARK_RESULTS_ENV, PERF_RESULTS_ENV, environment_metadata
+    from tests.framework.result_cache import RESULT_CACHE_ENV
+
+    try:
+        pinned_cpu = _pick_performance_cpu(cpu)
+    except ValueError as e:
+        print_error(str(e))
+        return False
+    original_affinity = None
+    if pinned_cpu is not None:
+        original_affinity = os.sched_getaffinity(0)
+        os.sched_setaffinity(0, {pinned_cpu})
+        print_info(f"Pinned to CPU {pinned_cpu}")
+    else:
+        print_warning("CPU affinity is not supported on this platform; running unpinned")
+
+    report_path = Path(report_dir)
+    report_path.mkdir(parents=True, exist_ok=True)
+    junit_file = report_path / "performance-junit.xml"
+    fd, measurements_file = tempfile.mkstemp(prefix="perf-", suffix=".jsonl")
+    os.close(fd)
+    fd, benchmarks_file = tempfile.mkstemp(prefix="bench-", suffix=".jsonl")
+    os.close(fd)
+
+    env = os.environ.copy()
+    env[PERF_RESULTS_ENV] = measurements_file
+    env[BENCHMARK_RESULTS_ENV] = benchmarks_file
+    # Measurements need real runs, never cached passes
+    env[RESULT_CACHE_ENV] = "0"
+    env["PYTHONHASHSEED"] = "0"
+    history = _history_files(junit_file)
+    if history is not None:
+        env[history["env_key"]] = history["timings"]
+
+    cmd = [sys.executable, "-m", "pytest", "-m", "performance", "-p", "no:randomly"]
+    if importlib.util.find_spec("xdist") is not None:
+        cmd.extend(["-n", "0"])
+    if verbosity >= 2:
+        cmd.append("-v")
+    cmd.extend([f"--junit-xml={junit_file}", "tests/"])
+    print_info(f"Running command: {' '.join(cmd)}")
+
+    environment_before = environment_metadata()
+    try:
+        result = subprocess.run(cmd, env=env, timeout=600)
+        success = result.returncode == 0
+    except subprocess.TimeoutExpired:
+        print_error("Performance tests timed out after 10 minutes")
+        success = False
+    finally:
+        if original_affinity is not None:
+            os.sched_setaffinity(0, original_affinity)
+
+    measurements = _read_jsonl(measurements_file)
+    benchmarks = _read_jsonl(benchmarks_file)
+    if history is not None:
+        success = _record_history("performance", history, success)
+
+    report = {
+        "generated": time.strftime("%Y-%m-%d %H:%M:%S"),
+        "success": success,
+        "pinned_cpu": pinned_cpu,
+        "environment": environment_before,
+        "load_average_after": list(os.getloadavg()) if hasattr(os, "getloadavg") else None,
+        "tests": _read_junit_cases(junit_file),
+        "measurements": measurements,
+    }
+    report_file = report_path / "performance-report.json"
+    with open(report_file, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+    print_info(f"Performance report written to {report_file}")
+    benchmarks_report = report_path / "benchmarks.json"
+    with open(benchmarks_report, "w", encoding="utf-8") as f:
+        json.dump({"generated": report["generated"], "benchmarks": benchmarks}, f, indent=2)
+    print_info(f"Benchmark results written to {benchmarks_report}")
+    return success
+
+
+def record_impact(verbosity: int = 1, jobs: str = "auto") -> bool:
+    """Run the whole suite with per-test coverage contexts and rebuild the impact map."""
+    print_subheader("Recording Change Impact")
+    if importlib.util.find_spec("coverage") is None:
+        print_error("coverage is required to record change impact (pip install coverage)")
+        return False
+    from tests.framework.impact import IMPACT_RECORD_ENV
+    import test_impact
+
+    record_dir = tempfile.mkdtemp(prefix="impact-")
+    env = os.environ.copy()
+    env[IMPACT_RECORD_ENV] = record_dir
+    try:
+        success = run_pytest_tests([], verbosity=verbosity, jobs=jobs, env=env, history_kind="impact")
+        if not success:
+            print_warning("Some tests failed; their impact is still recorded")
+        revision = subprocess.run(
+            ["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+        count = test_impact.build_database(record_dir, test_impact.DEFAULT_DB, revision)
+        print_info(f"Recorded impact of {count} tests at {revision[:12]} into {test_impact.DEFAULT_DB}")
+        return success
+    finally:
+        shutil.rmtree(record_dir, ignore_errors=True)
+
+
+def run_affected_tests(revision: Optional[str], verbosity: int = 1, jobs: str = "auto") -> bool:
+    """Run only the tests affected by changes since revision (full suite if unknown)."""
+    print_subheader("Running Affected Tests")
+    import test_impact
+
+    try:
+        selection = test_impact.select_tests(revision)
+    except subprocess.CalledProcessError as e:
+        print_error(f"git diff failed: {e.stderr.strip() if e.stderr else e}")
         return False
+    if selection is None:
+        print_warning("Impact unknown (no map, or changes outside it); running the full suite")
+        return run_pytest_tests([], verbosity=verbosity, jobs=jobs)
+    if not selection:
+        print_success("No tests affected by the changes")
+        return True
+    print_info(f"{len(selection)} affected test(s)")
+    return run_pytest_tests([], verbosity=verbosity, jobs=jobs, test_paths=selection)
+
+
+def run_shard(
+    shard: str, history: List[str], test_categories: List[str], verbosity: int = 1, jobs: str = "auto"
+) -> bool:
+    """Run one duration-balanced shard ('i/N') and write its junit report for merging."""
+    import test_sharding
+
+    index, total = test_sharding.parse_shard(shard)
+    print_subheader(f"Running Shard {index}/{total}")
+    try:
+        selection, estimate = test_sharding.plan_shard(index, total, history, markers=test_categories)
+    except RuntimeError as e:
+        print_error(str(e))
+        return False
+    if not selection:
+        print_success("Shard has no tests")
+        return True
+    print_info(f"{len(selection)} test(s), ~{estimate:.1f}s estimated from history")
+    junit_file = test_sharding.shard_report_path(index, total)
+    junit_file.parent.mkdir(parents=True, exist_ok=True)
+    # Same marker expression as the plan, so no planned test is deselected
+    return run_pytest_tests(
+        test_categories, verbosity=verbosity, jobs=jobs, test_paths=selection, junit_file=junit_file
+    )
+
+
+def merge_shards(total: int) -> bool:
+    """Combine the reports of a run split into `total` shards and print the totals."""
+    print_subheader("Merging Shard Reports")
+    import test_sharding
+
+    reports, missing = test_sharding.shard_reports(total)
+    if missing:
+        print_error(
+            f"Missing reports of shard(s) {', '.join(map(str, missing))} of {total} "
+            f"in {test_sharding.REPORT_DIR}"
+        )
+        return False
+    output = test_sharding.REPORT_DIR / "junit-merged.xml"
+    totals = test_sharding.merge_reports(reports, output)
+    passed = totals["tests"] - totals["failures"] - totals["errors"] - totals["skipped"]
+    print_info(f"Merged {len(reports)} shard report(s) into {output}")
+    print(f"Tests: {totals['tests']}  Passed: {passed}  Failed: {totals['failures']}  "
+          f"Errors: {totals['errors']}  Skipped: {totals['skipped']}  "
+          f"Time: {totals['time']:.2f}s")
+    return totals["failures"] == 0 and totals["errors"] == 0
 
 
 def run_coverage_only() -> bool:
@@ -223,6 +573,7 @@ def get_test_statistics() -> dict:
         "unit_tests": 0,
         "feature_tests": 0,
         "integration_tests": 0,
+        "performance_tests": 0,
         "total_test_files": 0,
         "total_lines": 0,
     }
@@ -244,6 +595,8 @@ def get_test_statistics() -> dict:
             stats["feature_tests"] += 1
         elif "integration" in str(test_file):
             stats["integration_tests"] += 1
+        elif "performance" in str(test_file):
+            stats["performance_tests"] += 1
 
     return stats
 
@@ -261,6 +614,7 @@ def print_test_statistics():
     print(f"Unit tests: {stats['unit_tests']}")
     print(f"Feature tests: {stats['feature_tests']}")
     print(f"Integration tests: {stats['integration_tests']}")
+    print(f"Performance tests: {stats['performance_tests']}")
     print(f"Total lines of test code: {stats['total_lines']}")
 
 
@@ -271,16 +625,29 @@ def main():
         formatter_class=argparse.RawDescriptionHelpFormatter,
         epilog="""
 Examples:
-  python run_all_tests.py                      # Run all tests with unittest
-  python run_all_tests.py --pytest           # Run all tests with pytest
+  python run_all_tests.py                      # Run all tests with pytest in parallel (unittest if pytest is missing)
+  python run_all_tests.py --unittest         # Run all tests sequentially with unittest
   python run_all_tests.py --coverage         # Run with coverage
   python run_all_tests.py --category unit    # Run only unit tests
+  python run_all_tests.py --category performance  # Run performance tests (pinned, sequential)
+  python run_all_tests.py --record-impact    # Record which tests cover which lines/inputs
+  python run_all_tests.py --affected main    # Run only tests affected by changes since main
+  python run_all_tests.py --no-cache         # Re-run tests with cached passes too
+  python run_all_tests.py --shard 2/4 --shard-history 'history/junit-*.xml'  # Second of four shards
+  python run_all_tests.py --merge-shards 4   # Combine the four shard reports into one summary
+  python run_all_tests.py --pytest --history-gate 0.25  # Fail if a test got >25% slower than usual
   python run_all_tests.py --stats            # Show test statistics
         """,
     )
 
     parser.add_argument(
-        "--pytest", action="store_true", help="Use pytest instead of unittest"
+        "--pytest",
+        action="store_true",
+        help="Use pytest (the default when it is installed; pytest-xdist runs it in parallel)",
+    )
+
+    parser.add_argument(
+        "--unittest", action="store_true", help="Use unittest (sequential) instead of pytest"
     )
 
     parser.add_argument(
@@ -295,8 +662,95 @@ Examples:
         "--category",
         "--categories",
         nargs="*",
-        choices=["unit", "feature", "integration"],
-        help="Run specific test categories (pytest only)",
+        choices=["unit", "feature", "integration", "performance"],
+        help="Run specific test categories (pytest only; 'performance' runs alone, "
+        "sequentially and pinned to one CPU)",
+    )
+
+    parser.add_argument(
+        "--jobs",
+        "-j",
+        default="auto",
+        help="pytest-xdist worker count ('auto' = one per core, '0' = sequential)",
+    )
+
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Execute every test even if an unchanged passing result is cached "
+        "(.cache/test_results)",
+    )
+
+    parser.add_argument(
+        "--record-impact",
+        action="store_true",
+        help="Run all tests under per-test coverage and rebuild the change-impact map "
+        "(.cache/test_impact.sqlite)",
+    )
+
+    parser.add_argument(
+        "--affected",
+        nargs="?",
+        const="",
+        default=None,
+        metavar="REV",
+        help="Run only tests affected by changes since REV (default: the revision the "
+        "impact map was recorded at)",
+    )
+
+    parser.add_argument(
+        "--shard",
+        metavar="I/N",
+        default=None,
+        help="Run shard I of N, balanced by past per-test durations from the "
+        "--shard-history reports",
+    )
+
+    parser.add_argument(
+        "--shard-history",
+        action="append",
+        default=[],
+        metavar="GLOB",
+        help="junit report glob(s) with past durations for --shard (required; must name "
+        "the same reports on every machine, e.g. a shared CI artifact)",
+    )
+
+    parser.add_argument(
+        "--merge-shards",
+        type=int,
+        default=None,
+        metavar="N",
+        help="Merge artifacts/test_reports/junit-shard-I-of-N.xml (I = 1..N) into junit-merged.xml",
+    )
+
+    parser.add_argument(
+        "--no-history",
+        action="store_true",
+        help="Do not record per-test durations and CLI timings in .cache/test_history.sqlite",
+    )
+
+    parser.add_argument(
+        "--history-gate",
+        type=float,
+        default=None,
+        metavar="FRACTION",
+        help="Fail the run when a test is slower than its rolling median by more than "
+        "FRACTION (e.g. 0.25) and at least 50 ms; see scripts/test_history.py",
+    )
+
+    parser.add_argument(
+        "--history-window",
+        type=int,
+        default=None,
+        metavar="N",
+        help="Number of previous runs in the rolling median (default: 10)",
+    )
+
+    parser.add_argument(
+        "--perf-cpu",
+        type=int,
+        default=None,
+        help="CPU to pin performance runs to (default: last available CPU)",
     )
 
     parser.add_argument(
@@ -335,6 +789,21 @@ Examples:
         if not any([args.pytest, args.coverage, args.coverage_only]):
             return 0
 
+    if args.no_cache:
+        from tests.framework.result_cache import RESULT_CACHE_ENV
+
+        # Inherited by every test process started below
+        os.environ[RESULT_CACHE_ENV] = "0"
+
+    import test_history
+
+    if args.no_history:
+        os.environ[test_history.HISTORY_ENV] = "0"
+    if args.history_gate is not None:
+        os.environ[test_history.HISTORY_GATE_ENV] = str(args.history_gate)
+    if args.history_window is not None:
+        os.environ[test_history.HISTORY_WINDOW_ENV] = str(args.history_window)
+
     # Check dependencies for advanced features
     deps_available = check_dependencies()
 
@@ -350,17 +819,49 @@ Examples:
     start_time = time.time()
     success = False
 
-    if args.pytest and deps_available:
+    categories = args.category or []
+    if args.merge_shards is not None:
+        success = merge_shards(args.merge_shards)
+    elif args.shard:
+        try:
+            success = run_shard(
+                args.shard, args.shard_history, categories, verbosity=args.verbosity, jobs=args.jobs
+            )
+        except argparse.ArgumentTypeError as e:
+            print_error(str(e))
+            success = False
+    elif args.record_impact:
+        success = record_impact(verbosity=args.verbosity, jobs=args.jobs)
+    elif args.affected is not None:
+        success = run_affected_tests(args.affected or None, verbosity=args.verbosity, jobs=args.jobs)
+    elif "performance" in categories:
+        # Timing-sensitive tests never share a run with other categories
+        success = run_performance_tests(verbosity=args.verbosity, cpu=args.perf_cpu)
+        other_categories = [c for c in categories if c != "performance"]
+        if other_categories:
+            success = (
+                run_pytest_tests(
+                    test_categories=other_categories,
+                    verbosity=args.verbosity,
+                    with_coverage=args.coverage,
+                    jobs=args.jobs,
+                )
+                and success
+            )
+    elif not args.unittest and importlib.util.find_spec("pytest") is not None:
+        if args.coverage and not deps_available:
+            print_warning("Coverage not available, running without coverage")
         success = run_pytest_tests(
             test_categories=args.category or [],
             verbosity=args.verbosity,
-            with_coverage=args.coverage,
+            with_coverage=args.coverage and deps_available,
+            jobs=args.jobs,
         )
     else:
-        if args.pytest and not deps_available:
+        if args.pytest:
             print_warning("pytest not available, falling back to unittest")
-        if args.coverage and not deps_available:
-            print_warning("Coverage not available, running without coverage")
+        if args.coverage:
+            print_warning("Coverage needs pytest, running without coverage")
 
         success = run_unittest_tests(
             test_pattern=args.pattern, verbosity=args.verbosity
@@ -36,9 +36,13 @@ def run_example():
 		"coverage", "run", "-a", "-m", "python_sample_app.main",
 		"--config", "tests/example/config.json",
 	]
+	env = os.environ.copy()
+	if sys.version_info >= (3, 12):
+		# sys.monitoring based measurement instead of classic tracing
+		env.setdefault("COVERAGE_CORE", "sysmon")
 	print_info(f"Running: {' '.join(cmd)}")
 	try:
-		result = subprocess.run(cmd, capture_output=True, text=True)
+		result = subprocess.run(cmd, capture_output=True, text=True, env=env)
 		if result.returncode == 0:
 			print_success("Command completed successfully")
 			if result.stdout:
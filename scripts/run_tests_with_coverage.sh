@@ -76,18 +76,11 @@ fi
 if [ "$HAS_COVERAGE" = true ]; then
     print_header "Step 1: Collecting Coverage Data from All Tests and Examples"
     
-    # Clear any existing coverage data
-    print_status "Clearing any existing coverage data..."
-    python3 -m coverage erase
-    
-    # Check if pytest is available, otherwise use unittest
-    if python3 -m pytest --version &>/dev/null; then
-        print_status "Running all tests with coverage using pytest..."
-        python3 -m coverage run -m pytest tests/ -v 2>&1 | tee artifacts/test_reports/test-output.log
-    else
-        print_status "pytest not available, running tests with coverage using unittest discovery..."
-        python3 -m coverage run scripts/run_all_tests.py 2>&1 | tee artifacts/test_reports/test-output.log
-    fi
+    # Tests and example run concurrently, each process writing its own data file
+    # (CLI subprocesses included); the data is combined once at the end
+    print_status "Collecting coverage from tests and example in parallel..."
+    python3 scripts/generate_combined_coverage.py --collect-only \
+        --tests-log artifacts/test_reports/test-output.log || print_warning "Some coverage stages failed"
     
     # Run examples if they exist
     if [ -d "examples" ]; then
@@ -100,12 +93,6 @@ if [ "$HAS_COVERAGE" = true ]; then
         done
     fi
     
-    # Run the C to PlantUML example with coverage
-    if [ -f "scripts/run_example_with_coverage.py" ]; then
-        print_status "Running C to PlantUML example with coverage..."
-        python3 -m coverage run -a scripts/run_example_with_coverage.py
-    fi
-    
     # Step 2: Generate comprehensive coverage reports
     print_header "Step 2: Generating Comprehensive Coverage Reports"
     
@@ -119,17 +106,17 @@ if [ "$HAS_COVERAGE" = true ]; then
     fi
     
     # Check if coverage data exists before generating reports
-    if python3 -m coverage report &>/dev/null; then
+    if python3 -m coverage report --fail-under=0 &>/dev/null; then
         print_status "Coverage data found, generating HTML coverage reports..."
-        python3 -m coverage html -d artifacts/coverage/htmlcov
+        python3 -m coverage html --fail-under=0 -d artifacts/coverage/htmlcov
     else
         print_warning "No coverage data found. Running a simple test to generate some coverage data..."
         # Run a simple test with coverage to ensure we have some data
         python3 -m coverage run -c "import python_sample_app; print('✅ Basic import test passed')" 2>/dev/null || true
         # Try generating reports again
-        if python3 -m coverage report &>/dev/null; then
+        if python3 -m coverage report --fail-under=0 &>/dev/null; then
             print_status "Generating HTML coverage reports with basic data..."
-            python3 -m coverage html -d artifacts/coverage/htmlcov
+            python3 -m coverage html --fail-under=0 -d artifacts/coverage/htmlcov
         else
             print_error "Unable to generate coverage data. Creating minimal reports..."
             mkdir -p artifacts/coverage/htmlcov
@@ -145,13 +132,13 @@ if [ "$HAS_COVERAGE" = true ]; then
     
     # Generate XML and JSON reports
     print_status "Generating XML and JSON reports..."
-    if python3 -m coverage report &>/dev/null; then
-        python3 -m coverage xml -o artifacts/coverage/coverage.xml 2>/dev/null || echo "Failed to generate XML report" > artifacts/coverage/coverage.xml
-        python3 -m coverage json -o artifacts/coverage/coverage.json 2>/dev/null || echo '{"error": "Failed to generate JSON report"}' > artifacts/coverage/coverage.json
+    if python3 -m coverage report --fail-under=0 &>/dev/null; then
+        python3 -m coverage xml --fail-under=0 -o artifacts/coverage/coverage.xml 2>/dev/null || echo "Failed to generate XML report" > artifacts/coverage/coverage.xml
+        python3 -m coverage json --fail-under=0 -o artifacts/coverage/coverage.json 2>/dev/null || echo '{"error": "Failed to generate JSON report"}' > artifacts/coverage/coverage.json
         
         # Generate terminal report
         print_status "Generating terminal coverage report..."
-        python3 -m coverage report -m > artifacts/coverage/coverage_report.txt 2>/dev/null || echo "No coverage data available" > artifacts/coverage/coverage_report.txt
+        python3 -m coverage report --fail-under=0 -m > artifacts/coverage/coverage_report.txt 2>/dev/null || echo "No coverage data available" > artifacts/coverage/coverage_report.txt
     else
         # Create placeholder files
         echo "No coverage data available" > artifacts/coverage/coverage.xml
@@ -0,0 +1,283 @@
+#!/usr/bin/env python3
+"""
+Test duration history.
+
+Every pytest run made through run_all_tests.py appends its per-test durations
+(from the junit report), the CLI timings recorded by the framework
+(TEST_CLI_TIMINGS: wall time, CPU time, peak RSS per CLI run) and environment
+metadata to a local SQLite database, so slow creep stays visible across runs.
+
+The gate compares each passed test of a run with the rolling median of its
+previous passed durations in runs of the same kind, and flags it when it is
+slower by more than the threshold (relative) and the minimum delta (absolute).
+Kinds separate runs that are not comparable: pytest, coverage and impact runs
+carry their pytest-xdist worker count (e.g. pytest-n4, pytest-n0 for serial),
+since parallel workers compete for the CPU.
+
+Environment (set by run_all_tests.py options):
+  TEST_HISTORY=0          do not record (--no-history)
+  TEST_HISTORY_DB         database path (default: .cache/test_history.sqlite)
+  TEST_HISTORY_GATE       fail the run above this relative slowdown, e.g. 0.25 (--history-gate)
+  TEST_HISTORY_WINDOW     runs in the rolling median (default: 10)
+
+Usage:
+  python scripts/test_history.py runs                    # recent runs
+  python scripts/test_history.py trend [--test TEXT]     # per-test trend
+  python scripts/test_history.py gate --threshold 0.25   # check the latest run
+"""
+
+import argparse
+import json
+import os
+import sqlite3
+import statistics
+import subprocess
+import sys
+import time
+import xml.etree.ElementTree as ET
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+DEFAULT_DB = PROJECT_ROOT / ".cache" / "test_history.sqlite"
+
+HISTORY_ENV = "TEST_HISTORY"
+HISTORY_DB_ENV = "TEST_HISTORY_DB"
+HISTORY_GATE_ENV = "TEST_HISTORY_GATE"
+HISTORY_WINDOW_ENV = "TEST_HISTORY_WINDOW"
+
+DEFAULT_WINDOW = 10
+# A test needs this many earlier passes before the gate judges it
+MIN_RUNS = 3
+# Slowdowns below this many seconds are noise for millisecond-scale tests
+MIN_DELTA = 0.05
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    started TEXT, kind TEXT, revision TEXT, success INTEGER, environment TEXT
+);
+CREATE TABLE IF NOT EXISTS durations (run_id INTEGER, nodeid TEXT, duration REAL, outcome TEXT);
+CREATE TABLE IF NOT EXISTS cli_runs (
+    run_id INTEGER, nodeid TEXT, test_id TEXT, execution_time REAL, cpu_time REAL, peak_rss_mb REAL
+);
+CREATE INDEX IF NOT EXISTS durations_nodeid ON durations (nodeid, run_id);
+CREATE INDEX IF NOT EXISTS cli_runs_nodeid ON cli_runs (nodeid, run_id);
+"""
+
+_SPARKS = "▁▂▃▄▅▆▇█"
+
+
+def enabled() -> bool:
+    return os.environ.get(HISTORY_ENV, "1") != "0"
+
+
+def database_path() -> Path:
+    return Path(os.environ.get(HISTORY_DB_ENV) or DEFAULT_DB)
+
+
+def connect(db_path: Optional[Path] = None) -> sqlite3.Connection:
+    db_path = db_path or database_path()
+    db_path.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(str(db_path), timeout=30)
+    conn.executescript(SCHEMA)
+    return conn
+
+
+def junit_nodeid(classname: str, name: str) -> str:
+    """tests.unit.test_x.TestX + test_y -> tests/unit/test_x.py::TestX::test_y"""
+    parts = classname.split(".")
+    if len(parts) > 1 and parts[-1][:1].isupper():
+        return f"{'/'.join(parts[:-1])}.py::{parts[-1]}::{name}"
+    return f"{'/'.join(parts)}.py::{name}"
+
+
+def read_junit(junit_file: Path) -> List[Dict]:
+    """Per-test node id, duration and outcome (passed/failed/error/skipped)."""
+    if not junit_file.exists():
+        return []
+    cases = []
+    for case in ET.parse(junit_file).getroot().iter("testcase"):
+        outcome = "passed"
+        for child in case:
+            if child.tag in ("failure", "error", "skipped"):
+                outcome = "failed" if child.tag == "failure" else child.tag
+        cases.append({
+            "nodeid": junit_nodeid(case.get("classname", ""), case.get("name", "")),
+            "duration": float(case.get("time", 0.0)),
+            "outcome": outcome,
+        })
+    return cases
+
+
+def _revision() -> str:
+    result = subprocess.run(["git", "rev-parse", "HEAD"], cwd=PROJECT_ROOT, capture_output=True, text=True)
+    return result.stdout.strip() if result.returncode == 0 else ""
+
+
+def record_run(conn: sqlite3.Connection, kind: str, cases: Iterable[Dict], cli_runs: Iterable[Dict],
+               environment: Dict, success: bool) -> int:
+    """Store one run; return its id."""
+    cursor = conn.execute(
+        "INSERT INTO runs (started, kind, revision, success, environment) VALUES (?, ?, ?, ?, ?)",
+        (time.strftime("%Y-%m-%d %H:%M:%S"), kind, _revision(), int(success), json.dumps(environment)),
+    )
+    run_id = cursor.lastrowid
+    conn.executemany(
+        "INSERT INTO durations VALUES (?, ?, ?, ?)",
+        [(run_id, c["nodeid"], c["duration"], c["outcome"]) for c in cases],
+    )
+    conn.executemany(
+        "INSERT INTO cli_runs VALUES (?, ?, ?, ?, ?, ?)",
+        [(run_id, r["nodeid"], r["test_id"], r["execution_time"], r.get("cpu_time"), r.get("peak_rss_mb"))
+         for r in cli_runs],
+    )
+    conn.commit()
+    return run_id
+
+
+def _previous_durations(conn: sqlite3.Connection, nodeid: str, run_id: int, kind: str, window: int) -> List[float]:
+    rows = conn.execute(
+        "SELECT d.duration FROM durations d JOIN runs r ON r.id = d.run_id "
+        "WHERE d.nodeid = ? AND d.outcome = 'passed' AND r.id < ? AND r.kind = ? "
+        "ORDER BY r.id DESC LIMIT ?",
+        (nodeid, run_id, kind, window),
+    )
+    return [row[0] for row in rows]
+
+
+def gate(conn: sqlite3.Connection, run_id: Optional[int] = None, threshold: float = 0.25,
+         window: int = DEFAULT_WINDOW, min_delta: float = MIN_DELTA) -> List[Dict]:
+    """Tests of run_id (default: latest run) slower than (1 + threshold) x their rolling median."""
+    if run_id is None:
+        row = conn.execute("SELECT MAX(id) FROM runs").fetchone()
+        run_id = row[0] if row else None
+        if run_id is None:
+            return []
+    kind = conn.execute("SELECT kind FROM runs WHERE id = ?", (run_id,)).fetchone()[0]
+    regressions = []
+    current = conn.execute(
+        "SELECT nodeid, duration FROM durations WHERE run_id = ? AND outcome = 'passed'", (run_id,)
+    ).fetchall()
+    for nodeid, duration in current:
+        previous = _previous_durations(conn, nodeid, run_id, kind, window)
+        if len(previous) < MIN_RUNS:
+            continue
+        median = statistics.median(previous)
+        if duration > median * (1 + threshold) and duration - median >= min_delta:
+            regressions.append({"nodeid": nodeid, "duration": duration, "median": median,
+                                "runs": len(previous), "change": duration / median - 1 if median else None})
+    return sorted(regressions, key=lambda r: r["duration"] - r["median"], reverse=True)
+
+
+def format_change(change: Optional[float]) -> str:
+    """Relative change as '+25%'; 'n/a' when there is no baseline (median 0)."""
+    return "n/a" if change is None else f"{change:+.0%}"
+
+
+def _sparkline(values: List[float]) -> str:
+    if not values:
+        return ""
+    low, high = min(values), max(values)
+    span = (high - low) or 1.0
+    return "".join(_SPARKS[int((v - low) / span * (len(_SPARKS) - 1))] for v in values)
+
+
+def trend(conn: sqlite3.Connection, text: Optional[str] = None, last: int = 20, kind: Optional[str] = None) -> List[Dict]:
+    """Per-test history of passed durations (oldest first) with CLI time averages."""
+    query = "SELECT DISTINCT nodeid FROM durations WHERE outcome = 'passed'"
+    params: List = []
+    if text:
+        query += " AND nodeid LIKE ?"
+        params.append(f"%{text}%")
+    rows = []
+    for (nodeid,) in conn.execute(query + " ORDER BY nodeid", params).fetchall():
+        history = conn.execute(
+            "SELECT d.duration, d.run_id FROM durations d JOIN runs r ON r.id = d.run_id "
+            "WHERE d.nodeid = ? AND d.outcome = 'passed' AND (? IS NULL OR r.kind = ?) "
+            "ORDER BY r.id DESC LIMIT ?",
+            (nodeid, kind, kind, last),
+        ).fetchall()[::-1]
+        if not history:
+            continue
+        durations = [d for d, _ in history]
+        cli = conn.execute(
+            "SELECT AVG(execution_time) FROM cli_runs WHERE nodeid = ? AND run_id >= ?",
+            (nodeid, history[0][1]),
+        ).fetchone()[0]
+        baseline = statistics.median(durations[:-1]) if len(durations) > 1 else durations[0]
+        rows.append({
+            "nodeid": nodeid, "runs": len(durations), "median": statistics.median(durations),
+            "latest": durations[-1], "change": durations[-1] / baseline - 1 if baseline else None,
+            "cli_mean": cli, "spark": _sparkline(durations),
+        })
+    return rows
+
+
+def record_from_files(kind: str, junit_file: Path, cli_timings_file: Optional[str], success: bool) -> Optional[int]:
+    """Runner helper: store a finished run from its junit report and CLI timings file."""
+    sys.path.insert(0, str(PROJECT_ROOT))
+    from tests.framework.perf import environment_metadata
+
+    cli_runs = []
+    if cli_timings_file and os.path.exists(cli_timings_file):
+        with open(cli_timings_file, "r", encoding="utf-8") as f:
+            cli_runs = [json.loads(line) for line in f if line.strip()]
+    cases = read_junit(junit_file)
+    if not cases:
+        return None
+    conn = connect()
+    try:
+        return record_run(conn, kind, cases, cli_runs, environment_metadata(), success)
+    finally:
+        conn.close()
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Test duration history")
+    parser.add_argument("--db", type=Path, default=None, help=f"History database (default: {DEFAULT_DB})")
+    sub = parser.add_subparsers(dest="command", required=True)
+    runs = sub.add_parser("runs", help="List recent runs")
+    runs.add_argument("--last", type=int, default=20)
+    trend_cmd = sub.add_parser("trend", help="Show per-test duration trends")
+    trend_cmd.add_argument("--test", default=None, help="Only node ids containing this text")
+    trend_cmd.add_argument("--last", type=int, default=20, help="Runs per test (default: 20)")
+    trend_cmd.add_argument("--kind", default=None, help="Only runs of this kind (e.g. pytest-n4, performance)")
+    gate_cmd = sub.add_parser("gate", help="Fail if a run's tests slowed down beyond the threshold")
+    gate_cmd.add_argument("--run", type=int, default=None, help="Run id (default: latest)")
+    gate_cmd.add_argument("--threshold", type=float, default=0.25, help="Relative slowdown (default: 0.25)")
+    gate_cmd.add_argument("--window", type=int, default=DEFAULT_WINDOW, help="Runs in the rolling median")
+    gate_cmd.add_argument("--min-delta", type=float, default=MIN_DELTA, help="Ignore slowdowns below N seconds")
+    args = parser.parse_args()
+
+    conn = connect(args.db)
+    try:
+        if args.command == "runs":
+            for run in conn.execute(
+                "SELECT r.id, r.started, r.kind, r.revision, r.success, COUNT(d.nodeid) FROM runs r "
+                "LEFT JOIN durations d ON d.run_id = r.id GROUP BY r.id ORDER BY r.id DESC LIMIT ?",
+                (args.last,),
+            ):
+                run_id, started, kind, revision, success, tests = run
+                print(f"{run_id:>5}  {started}  {kind:<12} {revision[:10]:<10}  "
+                      f"{'ok  ' if success else 'FAIL'}  {tests} tests")
+            return 0
+        if args.command == "trend":
+            for row in trend(conn, args.test, args.last, args.kind):
+                cli = f"{row['cli_mean']:.3f}s" if row["cli_mean"] is not None else "-"
+                print(f"{row['spark']:<{args.last}}  median {row['median']:.3f}s  latest {row['latest']:.3f}s "
+                      f"({format_change(row['change'])})  cli {cli}  n={row['runs']}  {row['nodeid']}")
+            return 0
+        regressions = gate(conn, args.run, args.threshold, args.window, args.min_delta)
+        for r in regressions:
+            print(f"SLOWER {r['nodeid']}: {r['duration']:.3f}s vs median {r['median']:.3f}s "
+                  f"over {r['runs']} runs ({format_change(r['change'])})")
+        if not regressions:
+            print("No duration regressions")
+        return 1 if regressions else 0
+    finally:
+        conn.close()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,249 @@
+#!/usr/bin/env python3
+"""
+Change-impact test selection.
+
+Builds a SQLite database mapping each test (pytest node id) to the source lines it
+executed, recorded with per-test coverage contexts (see tests/framework/impact.py),
+and to the non-code inputs it used (its module, scenario YAML, fixture archives).
+Given a git revision, selects the tests whose covered lines or inputs changed.
+
+Line numbers in the map belong to the revision it was recorded at, so changed
+lines are always taken from diffs against that revision: the working tree
+against it, plus (for an older REV) REV against it, numbered on its side.
+
+Changes the map cannot account for (framework code, packaging, source files no
+test executed, non-Python files under src/, new scenarios) select the full
+suite instead. Tests of deleted test modules are never selected.
+
+Usage:
+  python scripts/test_impact.py build --record-dir DIR   # normally via run_all_tests.py --record-impact
+  python scripts/test_impact.py select [REV]             # print affected node ids (or ALL)
+"""
+
+import argparse
+import json
+import os
+import re
+import sqlite3
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict, List, Optional, Set
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+DEFAULT_DB = PROJECT_ROOT / ".cache" / "test_impact.sqlite"
+
+# Changes here can affect any test, so they always select the full suite
+FULL_RUN_PATHS = ("tests/framework/", "tests/conftest.py", "pyproject.toml", "setup.py",
+                  "requirements.txt", "pytest.ini")
+# Code whose changes must be covered by the map, or else select the full suite
+CODE_PATHS = ("src/", "main.py")
+
+_HUNK = re.compile(r"^@@ -(\d+)(?:,(\d+))? \+(\d+)(?:,(\d+))? @@")
+
+SCHEMA = """
+CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT);
+CREATE TABLE lines (nodeid TEXT, path TEXT, line INTEGER);
+CREATE TABLE inputs (nodeid TEXT, path TEXT);
+CREATE INDEX lines_path ON lines (path, line);
+CREATE INDEX inputs_path ON inputs (path);
+"""
+
+
+def _git(*args: str) -> str:
+    return subprocess.run(
+        ["git", *args], cwd=PROJECT_ROOT, check=True, capture_output=True, text=True
+    ).stdout
+
+
+def _relative(path: str) -> str:
+    return os.path.relpath(path, PROJECT_ROOT).replace(os.sep, "/")
+
+
+def build_database(record_dir: str, db_path: Path = DEFAULT_DB, revision: Optional[str] = None) -> int:
+    """Build the mapping database from recorded coverage files; return the number of tests."""
+    from tests.framework.impact import INPUTS_FILE
+
+    db_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = db_path.with_suffix(".tmp")
+    if tmp_path.exists():
+        tmp_path.unlink()
+    conn = sqlite3.connect(str(tmp_path))
+    conn.executescript(SCHEMA)
+    nodeids: Set[str] = set()
+    for name in sorted(os.listdir(record_dir)):
+        if not name.startswith(".coverage."):
+            continue
+        import coverage
+
+        data = coverage.CoverageData(basename=os.path.join(record_dir, name))
+        data.read()
+        for measured in data.measured_files():
+            path = _relative(measured)
+            rows = []
+            for line, contexts in data.contexts_by_lineno(measured).items():
+                for context in contexts:
+                    if context:
+                        rows.append((context, path, line))
+                        nodeids.add(context)
+            conn.executemany("INSERT INTO lines VALUES (?, ?, ?)", rows)
+    inputs_file = os.path.join(record_dir, INPUTS_FILE)
+    if os.path.exists(inputs_file):
+        with open(inputs_file, "r", encoding="utf-8") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                entry = json.loads(line)
+                nodeids.add(entry["nodeid"])
+                conn.executemany(
+                    "INSERT INTO inputs VALUES (?, ?)", [(entry["nodeid"], p) for p in entry["inputs"]]
+                )
+    conn.execute("INSERT INTO meta VALUES ('revision', ?)", (revision or "",))
+    conn.execute("INSERT INTO meta VALUES ('tests', ?)", (json.dumps(sorted(nodeids)),))
+    conn.commit()
+    conn.close()
+    os.replace(tmp_path, db_path)
+    return len(nodeids)
+
+
+def recorded_revision(db_path: Path = DEFAULT_DB) -> Optional[str]:
+    conn = sqlite3.connect(str(db_path))
+    try:
+        row = conn.execute("SELECT value FROM meta WHERE key = 'revision'").fetchone()
+    finally:
+        conn.close()
+    return row[0] if row and row[0] else None
+
+
+def changed_lines(revision: str, target: Optional[str] = None) -> Dict[str, Optional[Set[int]]]:
+    """Changed files between revision and target -> changed lines.
+
+    Without a target the working tree (untracked files included) is compared and
+    lines are numbered as in `revision`; with a target lines are numbered as in
+    `target`. None means the whole file (binary, or missing on the numbered side).
+    Pure insertions/deletions mark the lines around the change.
+    """
+    number_new = target is not None
+    changes: Dict[str, Optional[Set[int]]] = {}
+    path: Optional[str] = None
+    old_path: Optional[str] = None
+    diff_path: Optional[str] = None
+    in_header = False
+    diff_args = ["diff", "-U0", "--no-color", "--no-renames", revision] + ([target] if target else []) + ["--"]
+    for line in _git(*diff_args).splitlines():
+        if line.startswith("diff --git "):
+            # "diff --git a/P b/P": without renames both sides name the same path
+            both = line[len("diff --git a/"):]
+            diff_path = both[: (len(both) - len(" b/")) // 2]
+            path, old_path, in_header = None, None, True
+        elif in_header and line.startswith("--- "):
+            old_path = None if line == "--- /dev/null" else line[len("--- a/"):]
+        elif in_header and line.startswith("+++ "):
+            new_path = None if line == "+++ /dev/null" else line[len("+++ b/"):]
+            path = new_path if number_new else old_path
+            if path is None:
+                # Missing on the numbered side: nothing to look up by line
+                changes[new_path or old_path] = None
+            else:
+                changes.setdefault(path, set())
+        elif in_header and line.startswith("Binary files") and diff_path is not None:
+            changes[diff_path] = None
+        elif path is not None and line.startswith("@@"):
+            in_header = False
+            match = _HUNK.match(line)
+            if match and changes.get(path) is not None:
+                first = 3 if number_new else 1
+                start, count = int(match.group(first)), int(match.group(first + 1) or "1")
+                if count == 0:
+                    changes[path].update({start, start + 1})
+                else:
+                    changes[path].update(range(start, start + count))
+    if not number_new:
+        for untracked in _git("ls-files", "--others", "--exclude-standard").splitlines():
+            changes[untracked] = None
+    return changes
+
+
+def _merge_changes(changes: Dict[str, Optional[Set[int]]], more: Dict[str, Optional[Set[int]]]) -> None:
+    for path, lines in more.items():
+        if path not in changes:
+            changes[path] = lines
+        elif changes[path] is not None:
+            changes[path] = None if lines is None else changes[path] | lines
+
+
+def _commit(revision: str) -> str:
+    return _git("rev-parse", "--verify", f"{revision}^{{commit}}").strip()
+
+
+def select_tests(revision: Optional[str] = None, db_path: Path = DEFAULT_DB) -> Optional[List[str]]:
+    """Return node ids affected since revision (default: the recorded revision).
+
+    None means the impact is unknown and the full suite must run.
+    """
+    if not db_path.exists():
+        return None
+    recorded = recorded_revision(db_path)
+    if not recorded:
+        return None
+    # Covered line numbers are those of the recorded revision: diff against it
+    changes = changed_lines(recorded)
+    if revision and _commit(revision) != _commit(recorded):
+        _merge_changes(changes, changed_lines(revision, recorded))
+    conn = sqlite3.connect(str(db_path))
+    try:
+        covered = {row[0] for row in conn.execute("SELECT DISTINCT path FROM lines")}
+        inputs = {row[0] for row in conn.execute("SELECT DISTINCT path FROM inputs")}
+        selected: Set[str] = set()
+        for path, lines in changes.items():
+            if path.startswith(FULL_RUN_PATHS):
+                return None
+            if path.startswith("src/") and not path.endswith(".py"):
+                # Package data the map has no lines for
+                return None
+            if path in covered:
+                rows = conn.execute("SELECT DISTINCT nodeid, line FROM lines WHERE path = ?", (path,))
+                selected.update(nodeid for nodeid, line in rows if lines is None or line in lines)
+            elif path in inputs:
+                rows = conn.execute("SELECT DISTINCT nodeid FROM inputs WHERE path = ?", (path,))
+                selected.update(row[0] for row in rows)
+            elif path.startswith(CODE_PATHS):
+                return None
+            elif path.startswith("tests/") and os.path.basename(path).startswith("test_") and path.endswith(".py"):
+                # New test module: run it whole
+                selected.add(path)
+            elif path.startswith("tests/") and path.endswith((".yml", ".yaml")):
+                return None
+    finally:
+        conn.close()
+    # Deleted test modules have nothing left to run
+    return sorted(nodeid for nodeid in selected if (PROJECT_ROOT / nodeid.split("::", 1)[0]).exists())
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Change-impact test selection")
+    parser.add_argument("--db", type=Path, default=DEFAULT_DB, help=f"Mapping database (default: {DEFAULT_DB})")
+    sub = parser.add_subparsers(dest="command", required=True)
+    build = sub.add_parser("build", help="Build the database from recorded coverage data")
+    build.add_argument("--record-dir", required=True, help="Directory written via TEST_IMPACT_RECORD")
+    build.add_argument("--revision", default=None, help="Revision the data was recorded at (default: HEAD)")
+    select = sub.add_parser("select", help="Print node ids affected since REV (ALL if unknown)")
+    select.add_argument("revision", nargs="?", default=None, help="Git revision (default: recorded revision)")
+    args = parser.parse_args()
+
+    sys.path.insert(0, str(PROJECT_ROOT))
+    if args.command == "build":
+        revision = args.revision or _git("rev-parse", "HEAD").strip()
+        count = build_database(args.record_dir, args.db, revision)
+        print(f"Recorded impact of {count} tests at {revision} into {args.db}")
+        return 0
+    selection = select_tests(args.revision, args.db)
+    if selection is None:
+        print("ALL")
+    else:
+        print("\n".join(selection))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
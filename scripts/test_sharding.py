@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+"""
+Duration-balanced test sharding.
+
+Splits the collected pytest node ids into N shards using historical per-test
+durations from junit XML reports: tests with history are assigned longest first
+to the currently lightest shard (LPT), tests without history are dealt out
+round-robin afterwards. The plan is deterministic given the collected tests and
+the history, so the history must be given explicitly and be the same on every
+machine (e.g. reports restored from a shared CI artifact); then each machine
+computes the same partition independently.
+
+Usage:
+  python scripts/test_sharding.py plan --shard 2/4 --history 'reports/junit-*.xml'  # node ids of shard 2 of 4
+  python scripts/test_sharding.py merge --shards 4               # combine junit-shard-*-of-4.xml
+  python scripts/test_sharding.py merge shard-*.xml -o all.xml   # combine the given reports
+"""
+
+import argparse
+import glob
+import heapq
+import subprocess
+import sys
+import xml.etree.ElementTree as ET
+from pathlib import Path
+from typing import Dict, Iterable, List, Tuple
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+REPORT_DIR = PROJECT_ROOT / "artifacts" / "test_reports"
+
+
+def parse_shard(value: str) -> Tuple[int, int]:
+    """Parse 'i/N' (1-based) into (i, N)."""
+    try:
+        index, total = (int(part) for part in value.split("/", 1))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"Shard must look like i/N, got {value!r}")
+    if total < 1 or not 1 <= index <= total:
+        raise argparse.ArgumentTypeError(f"Shard index must be within 1..N, got {value!r}")
+    return index, total
+
+
+def shard_report_path(index: int, total: int) -> Path:
+    return REPORT_DIR / f"junit-shard-{index}-of-{total}.xml"
+
+
+def shard_reports(total: int) -> Tuple[List[Path], List[int]]:
+    """Existing reports of a run split into `total` shards, and the missing shard indexes."""
+    reports, missing = [], []
+    for index in range(1, total + 1):
+        path = shard_report_path(index, total)
+        if path.exists():
+            reports.append(path)
+        else:
+            missing.append(index)
+    return reports, missing
+
+
+def case_key(classname: str, name: str) -> str:
+    """Key shared by junit test cases and node ids: dotted module.Class.test."""
+    return f"{classname}.{name}"
+
+
+def nodeid_key(nodeid: str) -> str:
+    """tests/unit/test_x.py::TestX::test_y -> tests.unit.test_x.TestX.test_y"""
+    path, _, rest = nodeid.partition("::")
+    module = path[:-3] if path.endswith(".py") else path
+    return ".".join([module.replace("/", ".")] + ([rest.replace("::", ".")] if rest else []))
+
+
+def collect_tests(markers: Iterable[str] = (), paths: Iterable[str] = ("tests/",)) -> List[str]:
+    """Node ids pytest would run (collect-only), selected like run_all_tests.py selects them."""
+    cmd = [sys.executable, "-m", "pytest", "--collect-only", "-q", "-p", "no:cacheprovider"]
+    # pytest keeps only the last -m, so the markers form one expression
+    markers = list(markers)
+    cmd.extend(["-m", " or ".join(markers) if markers else "not performance"])
+    cmd.extend(paths)
+    result = subprocess.run(cmd, cwd=PROJECT_ROOT, capture_output=True, text=True)
+    if result.returncode not in (0, 5):  # 5: nothing collected
+        raise RuntimeError(f"Test collection failed:\n{result.stdout}{result.stderr}")
+    return sorted(line.strip() for line in result.stdout.splitlines() if "::" in line)
+
+
+def history_files(patterns: Iterable[str]) -> List[Path]:
+    """Reports matching the globs (relative to the project root)."""
+    files: List[Path] = []
+    for pattern in patterns:
+        files.extend(Path(p) for p in sorted(glob.glob(str(PROJECT_ROOT / pattern))))
+    return files
+
+
+def load_durations(junit_files: Iterable[Path]) -> Dict[str, float]:
+    """Mean duration per test key over all reports (unreadable reports are ignored)."""
+    totals: Dict[str, List[float]] = {}
+    for junit_file in junit_files:
+        try:
+            root = ET.parse(junit_file).getroot()
+        except (OSError, ET.ParseError):
+            continue
+        for case in root.iter("testcase"):
+            if case.find("skipped") is not None:
+                continue
+            key = case_key(case.get("classname", ""), case.get("name", ""))
+            totals.setdefault(key, []).append(float(case.get("time", 0.0)))
+    return {key: sum(times) / len(times) for key, times in totals.items()}
+
+
+def partition(tests: List[str], durations: Dict[str, float], shards: int) -> List[List[str]]:
+    """LPT assignment of tests with history, then round-robin for the rest."""
+    buckets: List[List[str]] = [[] for _ in range(shards)]
+    known = sorted(
+        (t for t in tests if nodeid_key(t) in durations),
+        key=lambda t: (-durations[nodeid_key(t)], t),
+    )
+    unknown = sorted(t for t in tests if nodeid_key(t) not in durations)
+    heap = [(0.0, index) for index in range(shards)]
+    for test in known:
+        load, index = heapq.heappop(heap)
+        buckets[index].append(test)
+        heapq.heappush(heap, (load + durations[nodeid_key(test)], index))
+    for position, test in enumerate(unknown):
+        buckets[position % shards].append(test)
+    return buckets
+
+
+def plan_shard(index: int, total: int, history: Iterable[str],
+               markers: Iterable[str] = ()) -> Tuple[List[str], float]:
+    """Return the node ids of shard index/total and its estimated duration (known tests only).
+
+    `history` globs must name the same reports on every machine, or the shards
+    overlap and miss tests.
+    """
+    history = list(history)
+    if not history:
+        raise RuntimeError("Sharding needs explicit duration history (reports shared by every shard)")
+    tests = collect_tests(markers)
+    durations = load_durations(history_files(history))
+    shard = partition(tests, durations, total)[index - 1]
+    estimate = sum(durations.get(nodeid_key(t), 0.0) for t in shard)
+    return shard, estimate
+
+
+def merge_reports(junit_files: Iterable[Path], output: Path) -> Dict[str, float]:
+    """Combine junit reports into one <testsuites> file and return the totals."""
+    merged = ET.Element("testsuites")
+    totals = {"tests": 0, "failures": 0, "errors": 0, "skipped": 0, "time": 0.0}
+    for junit_file in junit_files:
+        root = ET.parse(junit_file).getroot()
+        suites = [root] if root.tag == "testsuite" else list(root.iter("testsuite"))
+        for suite in suites:
+            merged.append(suite)
+            for key in ("tests", "failures", "errors", "skipped"):
+                totals[key] += int(suite.get(key, 0))
+            totals["time"] += float(suite.get("time", 0.0))
+    for key, value in totals.items():
+        merged.set(key, f"{value:.3f}" if key == "time" else str(value))
+    output.parent.mkdir(parents=True, exist_ok=True)
+    ET.ElementTree(merged).write(output, encoding="utf-8", xml_declaration=True)
+    return totals
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Duration-balanced test sharding")
+    sub = parser.add_subparsers(dest="command", required=True)
+    plan = sub.add_parser("plan", help="Print the node ids of one shard")
+    plan.add_argument("--shard", type=parse_shard, required=True, help="i/N (1-based)")
+    plan.add_argument("-m", "--marker", action="append", default=[], help="Restrict to a marker")
+    plan.add_argument("--history", action="append", required=True,
+                      help="junit report glob(s) with past durations; must be the same on every shard")
+    merge = sub.add_parser("merge", help="Combine shard junit reports into one summary")
+    merge.add_argument("reports", nargs="*", type=Path, help="Shard reports (default: those of --shards)")
+    merge.add_argument("--shards", type=int, default=None, metavar="N",
+                       help=f"Merge junit-shard-I-of-N.xml for I in 1..N from {REPORT_DIR}")
+    merge.add_argument("-o", "--output", type=Path, default=REPORT_DIR / "junit-merged.xml")
+    args = parser.parse_args()
+
+    if args.command == "plan":
+        tests, estimate = plan_shard(*args.shard, history=args.history, markers=args.marker)
+        print("\n".join(tests))
+        print(f"# {len(tests)} tests, ~{estimate:.1f}s with history", file=sys.stderr)
+        return 0
+
+    if args.reports:
+        reports = args.reports
+    elif args.shards:
+        reports, missing = shard_reports(args.shards)
+        if missing:
+            print(f"Missing reports of shard(s) {', '.join(map(str, missing))} of {args.shards}", file=sys.stderr)
+            return 1
+    else:
+        parser.error("merge needs report paths or --shards N")
+    totals = merge_reports(reports, args.output)
+    passed = totals["tests"] - totals["failures"] - totals["errors"] - totals["skipped"]
+    print(f"Merged {len(reports)} reports into {args.output}")
+    print(f"Tests: {totals['tests']}  Passed: {passed}  Failed: {totals['failures']}  "
+          f"Errors: {totals['errors']}  Skipped: {totals['skipped']}  Time: {totals['time']:.2f}s")
+    return 0 if totals["failures"] == 0 and totals["errors"] == 0 else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+"""
+Thin client for the python_sample_app render server.
+
+Forwards argv, cwd and environment to a running ``python_sample_app server``
+over a Unix domain socket. The client's stdin/stdout/stderr file descriptors
+are passed along (SCM_RIGHTS), so the server-side run writes straight to this
+process's streams; the exit code and the run's resource usage are sent back
+when the run finishes.
+
+This module deliberately uses only a handful of stdlib modules and no package
+imports, so it can also be run as a plain script for the fastest start:
+
+    python3 -S src/python_sample_app/client.py --config config.json
+
+If no server is listening, the client falls back to running the CLI in a
+regular interpreter (set PYTHON_SAMPLE_APP_NO_FALLBACK=1 to fail instead).
+Once the request has been sent, failures (e.g. the server dying mid-run) are
+reported as errors and never rerun locally, since the run may have had effects.
+A request the server cannot start (e.g. its cwd does not exist) is answered
+with an ``error`` instead of an exit code.
+"""
+
+import array
+import json
+import os
+import socket
+import struct
+import sys
+from typing import Any, Dict, List, Optional, Tuple
+
+SOCKET_ENV = "PYTHON_SAMPLE_APP_SOCKET"
+NO_FALLBACK_ENV = "PYTHON_SAMPLE_APP_NO_FALLBACK"
+
+_HEADER = struct.Struct("!I")
+_FALLBACK_SCRIPT = (
+	"import sys\n"
+	"from python_sample_app.main import main\n"
+	"sys.argv[0] = 'python_sample_app'\n"
+	"sys.exit(main())\n"
+)
+_MAX_FDS = 3
+
+
+def default_socket_path() -> str:
+	"""Return the socket path from $PYTHON_SAMPLE_APP_SOCKET or a per-user default."""
+	path = os.environ.get(SOCKET_ENV)
+	if path:
+		return path
+	tmp_dir = os.environ.get("TMPDIR") or "/tmp"
+	return os.path.join(tmp_dir, f"python_sample_app-{os.getuid()}.sock")
+
+
+def _recv_exact(sock: socket.socket, size: int) -> bytes:
+	chunks = []
+	while size:
+		chunk = sock.recv(size)
+		if not chunk:
+			raise ConnectionError("Connection closed before message was complete")
+		chunks.append(chunk)
+		size -= len(chunk)
+	return b"".join(chunks)
+
+
+def send_message(sock: socket.socket, message: Dict[str, Any], fds: Optional[List[int]] = None) -> None:
+	"""Send a length-prefixed JSON message, optionally passing file descriptors."""
+	payload = json.dumps(message).encode("utf-8")
+	header = _HEADER.pack(len(payload))
+	if fds:
+		ancillary = [(socket.SOL_SOCKET, socket.SCM_RIGHTS, array.array("i", fds))]
+		sock.sendmsg([header], ancillary)
+	else:
+		sock.sendall(header)
+	sock.sendall(payload)
+
+
+def recv_message(sock: socket.socket) -> Tuple[Dict[str, Any], List[int]]:
+	"""Receive a length-prefixed JSON message and any file descriptors sent with it."""
+	fds = array.array("i")
+	header, ancdata, _flags, _addr = sock.recvmsg(
+		_HEADER.size, socket.CMSG_SPACE(_MAX_FDS * fds.itemsize)
+	)
+	for level, kind, data in ancdata:
+		if level == socket.SOL_SOCKET and kind == socket.SCM_RIGHTS:
+			fds.frombytes(data[: len(data) - (len(data) % fds.itemsize)])
+	if len(header) < _HEADER.size:
+		header += _recv_exact(sock, _HEADER.size - len(header))
+	(length,) = _HEADER.unpack(header)
+	return json.loads(_recv_exact(sock, length).decode("utf-8")), list(fds)
+
+
+class ServerUnavailable(OSError):
+	"""No server is listening on the socket (nothing was sent)."""
+
+
+class RunNotStarted(OSError):
+	"""The server could not start the run (nothing was run)."""
+
+
+def _stdio_fds() -> Tuple[List[int], List[int]]:
+	"""Return fds 0-2 (substituting /dev/null for closed ones) and the fds opened for that."""
+	fds, opened = [], []
+	for fd in (0, 1, 2):
+		try:
+			os.fstat(fd)
+		except OSError:
+			fd = os.open(os.devnull, os.O_RDWR)
+			opened.append(fd)
+		fds.append(fd)
+	return fds, opened
+
+
+def request(
+	argv: List[str],
+	socket_path: Optional[str] = None,
+	cwd: Optional[str] = None,
+	env: Optional[Dict[str, str]] = None,
+	stdio: Optional[List[int]] = None,
+	timeout: Optional[float] = None,
+) -> Dict[str, Any]:
+	"""Run the CLI on the server and return its response (exit_code, rusage).
+
+	Raises ServerUnavailable if no server is listening, RunNotStarted if the server
+	could not start the run, socket.timeout if the run takes longer than `timeout`
+	seconds (closing the connection stops the run) and other OSErrors (e.g.
+	ConnectionError) if the connection fails after connecting.
+	"""
+	with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+		sock.settimeout(timeout)
+		try:
+			sock.connect(socket_path or default_socket_path())
+		except (FileNotFoundError, ConnectionRefusedError) as e:
+			raise ServerUnavailable(*e.args) from e
+		message = {
+			"argv": list(argv),
+			"cwd": cwd or os.getcwd(),
+			"env": dict(os.environ if env is None else env),
+		}
+		opened: List[int] = []
+		if stdio is None:
+			stdio, opened = _stdio_fds()
+		try:
+			send_message(sock, message, stdio)
+		finally:
+			for fd in opened:
+				os.close(fd)
+		response, _ = recv_message(sock)
+	if "error" in response:
+		raise RunNotStarted(response["error"])
+	return response
+
+
+def run_remote(
+	argv: List[str],
+	socket_path: Optional[str] = None,
+	cwd: Optional[str] = None,
+	env: Optional[Dict[str, str]] = None,
+	stdio: Optional[List[int]] = None,
+) -> int:
+	"""Run the CLI on the server and return its exit code.
+
+	Raises ServerUnavailable if no server is listening, OSError for later failures.
+	"""
+	return int(request(argv, socket_path, cwd, env, stdio)["exit_code"])
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+	"""Client entry point: forward argv to the server and return its exit code."""
+	argv = sys.argv[1:] if argv is None else argv
+	try:
+		exit_code = run_remote(argv)
+	except ServerUnavailable as e:
+		if os.environ.get(NO_FALLBACK_ENV):
+			print(f"python_sample_app server unavailable: {e}", file=sys.stderr)
+			return 1
+		# Make the package importable when this file is run as a plain script
+		package_parent = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+		pythonpath = os.environ.get("PYTHONPATH")
+		os.environ["PYTHONPATH"] = package_parent + (os.pathsep + pythonpath if pythonpath else "")
+		os.execv(sys.executable, [sys.executable, "-c", _FALLBACK_SCRIPT] + argv)
+	except OSError as e:
+		print(f"python_sample_app server request failed: {e}", file=sys.stderr)
+		return 1
+	# Mirror shell conventions for runs killed by a signal
+	return 128 - exit_code if exit_code < 0 else exit_code
+
+
+if __name__ == "__main__":
+	sys.exit(main())
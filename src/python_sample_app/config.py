@@ -9,6 +9,8 @@ import json
 from dataclasses import dataclass
 from typing import Optional, Any, Dict
 
+from .core import json_codec
+
 
 @dataclass
 class Config:
@@ -18,8 +20,7 @@ class Config:
     @classmethod
     def load(cls, config_file: str) -> "Config":
         """Load configuration from a JSON file without validation."""
-        with open(config_file, "r", encoding="utf-8") as f:
-            data: Any = json.load(f)
+        data: Any = json_codec.load_file(config_file)
         if isinstance(data, dict):
             # Ignore unknown keys and do not validate types
             output_dir_value = data.get("output_dir")
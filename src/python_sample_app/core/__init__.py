@@ -1,5 +1,8 @@
 """
-Core package placeholder for python_sample_app.
+Core package for python_sample_app.
 
-This project is a minimal scaffold; no core modules are provided.
-"""
\ No newline at end of file
+Modules:
+- json_codec: pluggable JSON decoding backends used by every config read
+- schema: declarative config schema compiled into a (batch) validator function
+- output_writer: background writer with bounded queue, group-commit fsync and atomic renames
+"""
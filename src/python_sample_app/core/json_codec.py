@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+JSON decoding backends for python_sample_app.
+
+All configuration reads go through this module. Files are read as bytes and
+handed to the selected decoder directly, which skips the text-decoding pass of
+text-mode file objects. The "auto" backend prefers an accelerated decoder when
+one is installed and falls back to the standard library otherwise:
+
+    orjson -> ujson -> json
+
+Note that accelerated decoders are stricter than stdlib ``json`` for a few
+inputs (e.g. NaN/Infinity literals); select ``json`` to keep stdlib semantics.
+"""
+
+import importlib
+import json
+import os
+from typing import Any, Callable, Dict, List, Optional, Union
+
+# Preference order used by the "auto" backend
+BACKENDS = ("orjson", "ujson", "json")
+AUTO = "auto"
+
+_decoders: Dict[str, Optional[Callable[[bytes], Any]]] = {}
+_active_name: Optional[str] = None
+_active_decoder: Optional[Callable[[bytes], Any]] = None
+
+
+def _import_decoder(name: str) -> Optional[Callable[[bytes], Any]]:
+	"""Return the ``loads`` callable of a backend, or None if it is not installed."""
+	if name in _decoders:
+		return _decoders[name]
+	if name == "json":
+		decoder: Optional[Callable[[bytes], Any]] = json.loads
+	else:
+		try:
+			decoder = importlib.import_module(name).loads
+		except ImportError:
+			decoder = None
+	_decoders[name] = decoder
+	return decoder
+
+
+def available_backends() -> List[str]:
+	"""List installed backends in preference order."""
+	return [name for name in BACKENDS if _import_decoder(name) is not None]
+
+
+def set_backend(name: str = AUTO) -> str:
+	"""Select the decoding backend and return the resolved backend name.
+
+	Raises ValueError for unknown names and ImportError when an explicitly
+	requested backend is not installed.
+	"""
+	global _active_name, _active_decoder
+	if name == AUTO:
+		# Stop at the first importable backend: importing the others costs start-up time
+		name = next(backend for backend in BACKENDS if _import_decoder(backend) is not None)
+	elif name not in BACKENDS:
+		raise ValueError(f"Unknown JSON backend: {name!r} (choose from: {AUTO}, {', '.join(BACKENDS)})")
+	decoder = _import_decoder(name)
+	if decoder is None:
+		raise ImportError(f"JSON backend {name!r} is not installed")
+	_active_name, _active_decoder = name, decoder
+	return name
+
+
+def get_backend() -> str:
+	"""Return the name of the active backend, resolving "auto" on first use."""
+	if _active_name is None:
+		return set_backend(AUTO)
+	return _active_name
+
+
+def loads(data: Union[bytes, str]) -> Any:
+	"""Decode a JSON document from UTF-8 bytes or str."""
+	if _active_decoder is None:
+		set_backend(AUTO)
+	return _active_decoder(data)
+
+
+def load_file(path: Union[str, os.PathLike]) -> Any:
+	"""Read a JSON file as bytes and decode it with the active backend."""
+	with open(path, "rb") as f:
+		data = f.read()
+	return loads(data)
@@ -0,0 +1,288 @@
+#!/usr/bin/env python3
+"""
+Background output writer with group-commit fsync.
+
+``OutputWriter.submit(path, data)`` queues a write and returns a Future. The
+queue is bounded, so producers block when the writer falls behind
+(backpressure). A background thread takes writes off the queue in groups (up
+to ``group_size`` files, or whatever arrived within ``group_interval`` seconds
+of the first one) and commits each group at once:
+
+1. every file is written to a temporary file next to its target
+2. the temporary files are fsynced
+3. each one is renamed over its target (os.replace, atomic)
+4. every affected directory is fsynced once, making the renames durable
+
+A symlinked target is resolved first, so the link is kept and the file it
+points to is replaced; an existing target keeps its permission bits.
+
+A Future resolves to the target path once its group is committed, or carries
+the exception that failed that write (other writes of the group are not
+affected). Readers therefore see either the old file or the complete new one,
+and after a crash a completed write is never lost or torn.
+
+    with OutputWriter() as writer:
+        futures = [writer.submit(path, text) for path, text in outputs]
+    # leaving the block waits for every write
+
+``shared_writer()`` is the process-wide instance behind ``write_output``: writes
+made from several threads, or by repeated in-process runs, share its groups. A
+single CLI run writes one file, so its group holds just that file.
+"""
+
+import atexit
+import io
+import os
+import queue
+import stat
+import tempfile
+import threading
+import time
+from concurrent.futures import Future
+from typing import List, Optional, Set, Tuple, Union
+
+DEFAULT_MAX_PENDING = 256
+DEFAULT_GROUP_SIZE = 64
+# Seconds to wait for more writes to join a group after the first one arrives
+DEFAULT_GROUP_INTERVAL = 0.002
+
+_STOP = object()
+
+_shared: Optional["OutputWriter"] = None
+_shared_lock = threading.Lock()
+
+
+def _read_umask() -> int:
+	"""The process umask: from /proc where available, else set and restored once at import."""
+	try:
+		with open("/proc/self/status", "r", encoding="ascii") as status:
+			for line in status:
+				if line.startswith("Umask:"):
+					return int(line.split()[1], 8)
+	except (OSError, ValueError):
+		pass
+	umask = os.umask(0o022)
+	os.umask(umask)
+	return umask
+
+
+# Temp files are created 0600; outputs get the usual umask-based mode. os.umask()
+# can only be read by changing it, which would race with files created by other
+# threads, so it is never called once writers run.
+_FILE_MODE = 0o666 & ~_read_umask()
+
+
+def _fsync_directory(directory: str) -> None:
+	"""Persist renames in a directory (no-op where directories cannot be opened)."""
+	if not hasattr(os, "O_DIRECTORY"):
+		return
+	fd = os.open(directory, os.O_RDONLY | os.O_DIRECTORY)
+	try:
+		os.fsync(fd)
+	finally:
+		os.close(fd)
+
+
+class _Write:
+	"""One queued write and the state of its commit."""
+	__slots__ = ("path", "target", "data", "encoding", "future", "temp_path", "handle")
+
+	def __init__(self, path: str, data: Union[str, bytes], encoding: str):
+		self.path = os.path.abspath(path)
+		# The file actually replaced (symlinks resolved when the write is committed)
+		self.target = self.path
+		self.data = data
+		self.encoding = encoding
+		self.future: Future = Future()
+		self.temp_path: Optional[str] = None
+		# Open temp file between writing and fsync
+		self.handle = None
+
+
+class OutputWriter:
+	"""Durable, atomic file writes committed in groups by a background thread."""
+	def __init__(self, max_pending: int = DEFAULT_MAX_PENDING, group_size: int = DEFAULT_GROUP_SIZE,
+				group_interval: float = DEFAULT_GROUP_INTERVAL, durable: bool = True):
+		if max_pending < 1 or group_size < 1:
+			raise ValueError("max_pending and group_size must be at least 1")
+		self.group_size = group_size
+		self.group_interval = group_interval
+		# Without durability writes are still atomic, only the fsyncs are skipped
+		self.durable = durable
+		self._queue: "queue.Queue" = queue.Queue(max_pending)
+		self._closed = False
+		self._lock = threading.Lock()
+		# Producers between their closed check and the end of their put
+		self._submitting = 0
+		self._idle = threading.Condition(self._lock)
+		self._mode = _FILE_MODE
+		self._thread = threading.Thread(target=self._run, name="output-writer", daemon=True)
+		self._thread.start()
+
+	def __enter__(self) -> "OutputWriter":
+		return self
+
+	def __exit__(self, *exc_info) -> None:
+		self.close()
+
+	def submit(self, path: str, data: Union[str, bytes], encoding: str = "utf-8") -> Future:
+		"""Queue a write of `data` to `path`; blocks while the queue is full.
+
+		Text is written in text mode (platform newline translation), like open(path, "w").
+		"""
+		with self._lock:
+			if self._closed:
+				raise RuntimeError("OutputWriter is closed")
+			self._submitting += 1
+		write = _Write(path, data, encoding)
+		try:
+			# Outside the lock, so a full queue blocks only this producer
+			self._queue.put(write)
+		finally:
+			with self._lock:
+				self._submitting -= 1
+				if not self._submitting:
+					self._idle.notify_all()
+		return write.future
+
+	def close(self) -> None:
+		"""Commit every queued write and stop the background thread."""
+		with self._lock:
+			if self._closed:
+				return
+			self._closed = True
+			# Writes already being submitted are queued ahead of the stop marker
+			while self._submitting:
+				self._idle.wait()
+		self._queue.put(_STOP)
+		self._thread.join()
+
+	def _run(self) -> None:
+		stopping = False
+		while not stopping:
+			group, stopping = self._next_group()
+			if group:
+				self._commit(group)
+
+	def _next_group(self) -> Tuple[List[_Write], bool]:
+		"""Block for the first write, then gather more until the group is full or the interval ends."""
+		item = self._queue.get()
+		if item is _STOP:
+			return [], True
+		group = [item]
+		deadline = time.perf_counter() + self.group_interval
+		while len(group) < self.group_size:
+			try:
+				item = self._queue.get_nowait()
+			except queue.Empty:
+				remaining = deadline - time.perf_counter()
+				if remaining <= 0:
+					break
+				try:
+					item = self._queue.get(timeout=remaining)
+				except queue.Empty:
+					break
+			if item is _STOP:
+				return group, True
+			group.append(item)
+		return group, False
+
+	def _commit(self, group: List[_Write]) -> None:
+		written = []
+		for write in group:
+			try:
+				self._write_temp(write)
+				written.append(write)
+			except BaseException as e:
+				self._fail(write, e)
+		# Writing every file before the first fsync lets the kernel write them back together
+		pending = []
+		for write in written:
+			try:
+				if self.durable:
+					os.fsync(write.handle.fileno())
+				write.handle.close()
+				write.handle = None
+				pending.append(write)
+			except BaseException as e:
+				self._fail(write, e)
+		directories: Set[str] = set()
+		committed = []
+		for write in pending:
+			try:
+				os.replace(write.temp_path, write.target)
+				directories.add(os.path.dirname(write.target))
+				committed.append(write)
+			except BaseException as e:
+				self._fail(write, e)
+		directory_errors = {}
+		if self.durable:
+			for directory in directories:
+				try:
+					_fsync_directory(directory)
+				except OSError as e:
+					directory_errors[directory] = e
+		for write in committed:
+			error = directory_errors.get(os.path.dirname(write.target))
+			if error is not None:
+				write.future.set_exception(error)
+			else:
+				write.future.set_result(write.path)
+
+	def _write_temp(self, write: _Write) -> None:
+		write.target = os.path.realpath(write.path)
+		try:
+			mode = stat.S_IMODE(os.stat(write.target).st_mode)
+		except FileNotFoundError:
+			mode = self._mode
+		directory, name = os.path.split(write.target)
+		fd, write.temp_path = tempfile.mkstemp(prefix=f".{name}.", suffix=".tmp", dir=directory)
+		write.handle = os.fdopen(fd, "wb")
+		if not isinstance(write.data, bytes):
+			# Wrapped once the handle owns the fd, so _fail closes it (and unlinks the
+			# temp file) when the encoding is unknown
+			write.handle = io.TextIOWrapper(write.handle, encoding=write.encoding)
+		write.handle.write(write.data)
+		write.handle.flush()
+		write.data = None
+		os.chmod(write.temp_path, mode)
+
+	@staticmethod
+	def _fail(write: _Write, error: BaseException) -> None:
+		if write.handle is not None:
+			try:
+				write.handle.close()
+			except OSError:
+				pass
+		if write.temp_path is not None:
+			try:
+				os.unlink(write.temp_path)
+			except OSError:
+				pass
+		write.future.set_exception(error)
+
+
+def shared_writer() -> OutputWriter:
+	"""The process-wide writer, started on first use and closed at exit."""
+	global _shared
+	with _shared_lock:
+		if _shared is None:
+			_shared = OutputWriter()
+		return _shared
+
+
+@atexit.register
+def _close_shared_writer() -> None:
+	if _shared is not None:
+		_shared.close()
+
+
+def _forget_shared_writer() -> None:
+	# A forked child has no writer thread: it starts its own writer on first use
+	global _shared, _shared_lock
+	_shared = None
+	_shared_lock = threading.Lock()
+
+
+if hasattr(os, "register_at_fork"):
+	os.register_at_fork(after_in_child=_forget_shared_writer)
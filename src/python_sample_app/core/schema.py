@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+"""
+Declarative config schema compiled into a validator function.
+
+A schema maps config keys to ``Field`` declarations. ``compile_schema`` turns
+it into Python source once (one straight-line block of checks per key, with
+types and choices bound as constants) and builds the function with ``exec``,
+so validating a record runs no schema interpretation at all. The compiled
+validator checks a single config or a whole batch in one call and returns
+``SchemaError`` records (record index, key, error code, message); unknown keys
+are allowed, as configs may carry keys for other tools.
+
+    validator = compile_schema({"test": Field(str, required=True)})
+    validator.validate({"test": 1})        # -> [SchemaError(record=0, key='test', code='type', ...)]
+    validator.validate_many(configs)       # -> errors of every record, in record order
+"""
+
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Type, Union
+
+_TYPE_NAMES = {
+	str: "a string",
+	int: "an integer",
+	float: "a number",
+	bool: "a boolean",
+	list: "a list",
+	dict: "an object",
+}
+
+
+@dataclass(frozen=True)
+class Field:
+	"""Declaration of one config key."""
+	types: Union[Type, Tuple[Type, ...]]
+	required: bool = False
+	# Accept an explicit null (None) as "not set"
+	nullable: bool = False
+	# Allowed values, checked after the type
+	choices: Optional[Tuple[Any, ...]] = None
+
+	def type_tuple(self) -> Tuple[Type, ...]:
+		return self.types if isinstance(self.types, tuple) else (self.types,)
+
+	def describe(self) -> str:
+		"""Expected type in words, e.g. 'a string' or 'an integer or a number'."""
+		return " or ".join(_TYPE_NAMES.get(t, f"of type {t.__name__}") for t in self.type_tuple())
+
+
+@dataclass
+class SchemaError:
+	"""One validation failure; key is None when the record itself is not an object."""
+	record: int
+	key: Optional[str]
+	code: str
+	message: str
+
+	def __str__(self) -> str:
+		return self.message
+
+
+class CompiledSchema:
+	"""Validator generated from a schema; see compile_schema()."""
+	def __init__(self, schema: Dict[str, Field], source: str, validate_batch):
+		self.schema = schema
+		self.source = source
+		self._validate_batch = validate_batch
+
+	def validate(self, config: Any) -> List[SchemaError]:
+		"""Errors of a single config (record index 0); empty when it is valid."""
+		return self._validate_batch((config,))
+
+	def validate_many(self, configs: Iterable[Any]) -> List[SchemaError]:
+		"""Errors of every config in one pass, in record order."""
+		return self._validate_batch(configs)
+
+	def invalid_records(self, configs: Iterable[Any]) -> Dict[int, List[SchemaError]]:
+		"""Errors grouped by record index (only records with errors)."""
+		grouped: Dict[int, List[SchemaError]] = {}
+		for error in self._validate_batch(configs):
+			grouped.setdefault(error.record, []).append(error)
+		return grouped
+
+
+def _accepted_types(types: Tuple[Type, ...]) -> Tuple[Type, ...]:
+	"""Types whose values pass the check: JSON integers are numbers too."""
+	if float in types and int not in types:
+		return types + (int,)
+	return types
+
+
+def _type_check(value: str, types: Tuple[Type, ...], const: str) -> str:
+	"""Source of a condition that is true when `value` has none of `types`."""
+	exact = " and ".join(f"{value}.__class__ is not {const}[{i}]" for i in range(len(types)))
+	# bool is an int subclass, but JSON true/false are not numbers
+	if bool not in types and any(issubclass(bool, t) for t in types):
+		return f"({exact} and (not isinstance({value}, {const}) or {value}.__class__ is bool))"
+	return f"({exact} and not isinstance({value}, {const}))"
+
+
+def _choice_set(field: Field):
+	"""Choices as a frozenset when both they and the accepted values hash, else a tuple."""
+	try:
+		choices = frozenset(field.choices)
+	except TypeError:
+		return tuple(field.choices)
+	if all(t.__hash__ is not None for t in field.type_tuple()):
+		return choices
+	return tuple(field.choices)
+
+
+def _generate(schema: Dict[str, Field]) -> Tuple[str, Dict[str, Any]]:
+	"""Source of the batch validator and the constants it refers to."""
+	namespace: Dict[str, Any] = {"SchemaError": SchemaError, "_MISSING": object()}
+	lines = [
+		"def validate_batch(records):",
+		"\terrors = []",
+		"\tappend = errors.append",
+		"\tfor index, record in enumerate(records):",
+		"\t\tif record.__class__ is not dict and not isinstance(record, dict):",
+		"\t\t\tappend(SchemaError(index, None, 'not_object', "
+		"'Configuration must be a JSON object. Got: %r' % (type(record),)))",
+		"\t\t\tcontinue",
+		"\t\tget = record.get",
+	]
+	for position, (key, field) in enumerate(schema.items()):
+		types_const, choices_const, key_const = f"T{position}", f"C{position}", f"K{position}"
+		types = _accepted_types(field.type_tuple())
+		namespace[types_const] = types
+		namespace[key_const] = key
+		value = f"v{position}"
+		lines.append(f"\t\t{value} = get({key_const}, _MISSING)")
+		missing = f"{value} is _MISSING or {value} is None" if field.nullable else f"{value} is _MISSING"
+		lines.append(f"\t\tif {missing}:")
+		if field.required:
+			missing_message = f"Configuration {key!r} is required"
+			lines.append(f"\t\t\tappend(SchemaError(index, {key_const}, 'missing', {missing_message!r}))")
+		else:
+			lines.append("\t\t\tpass")
+		type_message = f"Configuration {key!r} must be {field.describe()}. Got: %r"
+		lines.append(f"\t\telif {_type_check(value, types, types_const)}:")
+		lines.append(f"\t\t\tappend(SchemaError(index, {key_const}, 'type', {type_message!r} % (type({value}),)))")
+		if field.choices is not None:
+			namespace[choices_const] = _choice_set(field)
+			choice_message = f"Configuration {key!r} must be one of {', '.join(map(repr, field.choices))}. Got: %r"
+			lines.append(f"\t\telif {value} not in {choices_const}:")
+			lines.append(f"\t\t\tappend(SchemaError(index, {key_const}, 'choice', "
+						f"{choice_message!r} % ({value},)))")
+	lines.append("\treturn errors")
+	return "\n".join(lines) + "\n", namespace
+
+
+def compile_schema(schema: Dict[str, Field]) -> CompiledSchema:
+	"""Compile a {key: Field} schema into a validator (done once, reuse the result)."""
+	for key, field in schema.items():
+		if not isinstance(field, Field):
+			raise TypeError(f"Schema entry {key!r} must be a Field, got {type(field).__name__}")
+		if not all(isinstance(t, type) for t in field.type_tuple()):
+			raise TypeError(f"Schema entry {key!r} has invalid types: {field.types!r}")
+	source, namespace = _generate(schema)
+	exec(compile(source, "<config schema>", "exec"), namespace)
+	return CompiledSchema(dict(schema), source, namespace["validate_batch"])
+
+
+# Keys read by the CLI; 'test' defaults to "Hello World", output_dir to ./output
+CONFIG_SCHEMA: Dict[str, Field] = {
+	"test": Field(str),
+	"output_dir": Field(str, nullable=True),
+}
+
+config_validator = compile_schema(CONFIG_SCHEMA)
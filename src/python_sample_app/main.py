@@ -10,16 +10,20 @@ Behavior:
 - Returns exit code 0 on success, non-zero on error
 
 This CLI accepts an optional trailing command argument for compatibility,
-which is ignored (kept only to avoid breaking existing scripts).
+which is ignored (kept only to avoid breaking existing scripts). The one
+exception is 'server', which starts the prefork render server (see server.py).
 """
 
 import argparse
-import json
 import logging
 import os
 import sys
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, List, Optional
+
+from .core import json_codec
+from .core.output_writer import OutputWriter, shared_writer
+from .core.schema import config_validator
 
 
 def setup_logging(verbose: bool = False) -> None:
@@ -34,22 +38,25 @@ def setup_logging(verbose: bool = False) -> None:
 def load_config_from_path(config_path: str) -> Dict[str, Any]:
 	path = Path(config_path)
 	if path.is_file():
-		with open(path, "r", encoding="utf-8") as f:
-			return json.load(f)
+		return json_codec.load_file(path)
 	elif path.is_dir():
 		# Merge all .json files in the folder (later files override earlier ones)
 		config: Dict[str, Any] = {}
 		for file in sorted(path.glob("*.json")):
-			with open(file, "r", encoding="utf-8") as f:
-				data = json.load(f)
-				if isinstance(data, dict):
-					config.update(data)
+			data = json_codec.load_file(file)
+			if isinstance(data, dict):
+				config.update(data)
 		return config
 	else:
 		raise FileNotFoundError(f"Config path not found: {config_path}")
 
 
-def main() -> int:
+def write_output(output_file: str, test_value: str, writer: Optional[OutputWriter] = None) -> None:
+	# Durable and atomic: temp file, fsync, rename (see core/output_writer.py)
+	(writer or shared_writer()).submit(output_file, test_value + "\n").result()
+
+
+def main(argv: Optional[List[str]] = None) -> int:
 	parser = argparse.ArgumentParser(
 		description="python_sample_app - minimal CLI",
 		formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -64,13 +71,43 @@ def main() -> int:
 	parser.add_argument(
 		"command",
 		nargs="?",
-		help="Optional command argument (ignored; kept for compatibility)",
+		help="Optional command argument; 'server' starts the prefork render server, "
+		"anything else is ignored (kept for compatibility)",
 	)
 	parser.add_argument("--verbose", "-v", action="store_true", help="Enable verbose output")
-	args = parser.parse_args()
+	parser.add_argument(
+		"--json-backend",
+		choices=(json_codec.AUTO,) + json_codec.BACKENDS,
+		default=json_codec.AUTO,
+		help="JSON decoder used for config files (default: auto = fastest installed)",
+	)
+	parser.add_argument(
+		"--socket",
+		default=None,
+		help="Unix socket path for 'server' mode (default: $PYTHON_SAMPLE_APP_SOCKET or a per-user temp path)",
+	)
+	parser.add_argument(
+		"--workers",
+		type=int,
+		default=None,
+		help="Number of pre-forked workers for 'server' mode (default: CPU count)",
+	)
+	args = parser.parse_args(argv)
 
 	setup_logging(args.verbose)
 
+	try:
+		backend = json_codec.set_backend(args.json_backend)
+	except ImportError as e:
+		logging.error("%s", e)
+		return 1
+	logging.debug("JSON backend: %s", backend)
+
+	if args.command == "server":
+		from .server import serve
+
+		return serve(args.socket, args.workers)
+
 	# Determine config path
 	config_path = args.config or os.getcwd()
 	logging.info("Using config: %s", config_path)
@@ -82,23 +119,26 @@ def main() -> int:
 		logging.error("Failed to load configuration: %s", e)
 		return 1
 
+	# Validate every known key up front and report all problems at once
+	errors = config_validator.validate(config)
+	if errors:
+		for error in errors:
+			logging.error("%s", error)
+		return 1
+
 	# Resolve output directory
 	output_dir = config.get("output_dir") or os.path.join(os.getcwd(), "output")
 	output_dir = os.path.abspath(output_dir)
 	os.makedirs(output_dir, exist_ok=True)
 	logging.info("Output directory: %s", output_dir)
 
-	# Get the 'test' value
+	# Get the 'test' value (validated as a string above)
 	test_value = config.get("test", "Hello World")
-	if not isinstance(test_value, str):
-		logging.error("Configuration 'test' must be a string. Got: %r", type(test_value))
-		return 1
 
 	# Write output.txt with the test value
 	output_file = os.path.join(output_dir, "output.txt")
 	try:
-		with open(output_file, "w", encoding="utf-8") as f:
-			f.write(test_value + "\n")
+		write_output(output_file, test_value)
 		logging.info("Wrote output to: %s", output_file)
 	except Exception as e:
 		logging.error("Failed to write output: %s", e)
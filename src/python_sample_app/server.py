@@ -0,0 +1,297 @@
+#!/usr/bin/env python3
+"""
+Prefork render server for python_sample_app.
+
+``python_sample_app server`` preloads the application, freezes the GC heap and
+pre-forks workers that accept connections on a Unix domain socket. Each request
+(see client.py for the protocol) is served by forking a fresh child from the
+worker, which adopts the client's stdio file descriptors, cwd, environment and
+argv and runs the normal CLI ``main()``. Every run therefore keeps the regular
+CLI semantics and never leaks state into the next one, while skipping
+interpreter start-up and imports.
+
+Workers that exit are respawned; a worker exiting right after its start counts
+as a crash, and consecutive crashes are respawned with a growing delay until the
+server gives up. A worker told to stop (SIGTERM) passes the signal on to the
+run it is serving.
+
+Unix only (requires fork and AF_UNIX sockets).
+"""
+
+import errno
+import gc
+import logging
+import os
+import select
+import signal
+import socket
+import stat
+import sys
+import time
+import traceback
+from typing import Dict, List, Optional
+
+from . import client
+from .core import json_codec
+from .main import main
+
+
+_RUSAGE_FIELDS = ("ru_utime", "ru_stime", "ru_maxrss", "ru_inblock", "ru_oublock")
+# A worker exiting sooner than this (seconds) after its start counts as a crash
+MIN_WORKER_LIFETIME = 1.0
+# Consecutive crashes after which the server stops instead of respawning
+MAX_WORKER_CRASHES = 5
+# Respawn delay after the first crash (seconds), doubled per further crash
+RESPAWN_DELAY = 0.05
+MAX_RESPAWN_DELAY = 2.0
+# Set in per-run children, whose forwarded argv must not start a nested server
+_in_run_child = False
+# In a worker: pid of the run child being served, if any
+_run_pid: Optional[int] = None
+
+
+class _Stop(Exception):
+	"""Raised from the signal handler to leave the supervisor loop."""
+
+
+def _exit_code_from_status(status: int) -> int:
+	"""Translate a waitpid status into an exit code (negative for signals)."""
+	if os.WIFSIGNALED(status):
+		return -os.WTERMSIG(status)
+	return os.WEXITSTATUS(status)
+
+
+def _run_child(request: Dict, fds: List[int]) -> int:
+	"""Run one CLI invocation inside a freshly forked child; return its exit code."""
+	global _in_run_child
+	_in_run_child = True
+	for target, fd in enumerate(fds[:3]):
+		os.dup2(fd, target)
+	for fd in fds:
+		if fd > 2:
+			os.close(fd)
+	os.chdir(request["cwd"])
+	os.environ.clear()
+	os.environ.update(request["env"])
+	argv = list(request["argv"])
+	sys.argv = ["python_sample_app"] + argv
+	# Let main() configure logging from scratch (e.g. honour --verbose)
+	for handler in logging.root.handlers[:]:
+		logging.root.removeHandler(handler)
+	logging.root.setLevel(logging.WARNING)
+	try:
+		return main(argv)
+	except SystemExit as e:
+		if e.code is None:
+			return 0
+		if isinstance(e.code, int):
+			return e.code
+		print(e.code, file=sys.stderr)
+		return 1
+	except BaseException:
+		traceback.print_exc()
+		return 1
+
+
+def _check_cwd(cwd: str) -> None:
+	"""Raise the OSError starting a process in `cwd` would fail with."""
+	if not stat.S_ISDIR(os.stat(cwd).st_mode):
+		raise NotADirectoryError(errno.ENOTDIR, os.strerror(errno.ENOTDIR), cwd)
+
+
+def _rusage(usage) -> Dict:
+	"""The child's resource usage as sent to the client."""
+	return {name: getattr(usage, name) for name in _RUSAGE_FIELDS}
+
+
+def _handle_connection(conn: socket.socket, listener: socket.socket) -> None:
+	"""Serve one request: fork a child, wait for it and report its exit code and rusage."""
+	request, fds = client.recv_message(conn)
+	try:
+		_check_cwd(request["cwd"])
+	except OSError as e:
+		# Nothing can run: report it like a failed process start
+		for fd in fds:
+			os.close(fd)
+		client.send_message(conn, {"error": str(e)})
+		return
+	global _run_pid
+	done_r, done_w = os.pipe()
+	sys.stdout.flush()
+	sys.stderr.flush()
+	# Hold SIGTERM until _run_pid is set, so the worker never exits without forwarding it
+	signal.pthread_sigmask(signal.SIG_BLOCK, {signal.SIGTERM})
+	pid = os.fork()
+	if pid == 0:
+		exit_code = 1
+		try:
+			os.close(done_r)
+			conn.close()
+			listener.close()
+			signal.signal(signal.SIGTERM, signal.SIG_DFL)
+			signal.signal(signal.SIGINT, signal.SIG_DFL)
+			signal.pthread_sigmask(signal.SIG_UNBLOCK, {signal.SIGTERM})
+			exit_code = _run_child(request, fds)
+		except BaseException:
+			traceback.print_exc()
+		finally:
+			try:
+				sys.stdout.flush()
+				sys.stderr.flush()
+			finally:
+				os._exit(exit_code & 0xFF)
+	_run_pid = pid
+	signal.pthread_sigmask(signal.SIG_UNBLOCK, {signal.SIGTERM})
+	# done_w stays open in the child only, so EOF on done_r means it exited
+	os.close(done_w)
+	for fd in fds:
+		os.close(fd)
+	try:
+		while True:
+			readable, _, _ = select.select([done_r, conn], [], [])
+			if done_r in readable:
+				break
+			if conn in readable and not conn.recv(1, socket.MSG_PEEK):
+				# Client went away: stop the run
+				os.kill(pid, signal.SIGTERM)
+				break
+		_, status, usage = os.wait4(pid, 0)
+		_run_pid = None
+	finally:
+		os.close(done_r)
+	client.send_message(conn, {"exit_code": _exit_code_from_status(status), "rusage": _rusage(usage)})
+
+
+def _stop_worker(signum, _frame):
+	"""SIGTERM in a worker: stop the run being served (if any), then exit."""
+	if _run_pid is not None:
+		try:
+			os.kill(_run_pid, signum)
+		except ProcessLookupError:
+			pass
+	os._exit(128 + signum)
+
+
+def _worker_loop(listener: socket.socket) -> None:
+	"""Accept and serve connections until terminated."""
+	signal.signal(signal.SIGTERM, _stop_worker)
+	signal.signal(signal.SIGINT, signal.SIG_IGN)
+	while True:
+		conn, _ = listener.accept()
+		with conn:
+			try:
+				_handle_connection(conn, listener)
+			except Exception as e:
+				logging.error("Request failed: %s", e)
+
+
+def _spawn_worker(listener: socket.socket) -> int:
+	pid = os.fork()
+	if pid == 0:
+		exit_code = 0
+		try:
+			_worker_loop(listener)
+		except BaseException:
+			traceback.print_exc()
+			exit_code = 1
+		finally:
+			os._exit(exit_code)
+	return pid
+
+
+def _bind(socket_path: str) -> socket.socket:
+	"""Bind the listening socket, replacing a stale socket file if present."""
+	if os.path.exists(socket_path):
+		probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+		try:
+			probe.connect(socket_path)
+		except OSError:
+			os.unlink(socket_path)
+		else:
+			raise OSError(f"A server is already listening on {socket_path}")
+		finally:
+			probe.close()
+	listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+	listener.bind(socket_path)
+	os.chmod(socket_path, 0o600)
+	listener.listen(128)
+	return listener
+
+
+def serve(socket_path: Optional[str] = None, workers: Optional[int] = None) -> int:
+	"""Run the prefork server until SIGTERM/SIGINT; return an exit code."""
+	if _in_run_child:
+		logging.error("'server' cannot be forwarded to a running server")
+		return 2
+	if not hasattr(os, "fork") or not hasattr(socket, "AF_UNIX"):
+		logging.error("Server mode requires a Unix platform (fork and AF_UNIX sockets)")
+		return 1
+	socket_path = socket_path or client.default_socket_path()
+	workers = workers or os.cpu_count() or 1
+	try:
+		listener = _bind(socket_path)
+	except OSError as e:
+		logging.error("Failed to start server: %s", e)
+		return 1
+
+	# The app is already imported; resolve the JSON backend too, then freeze the
+	# heap so workers and per-run children share it copy-on-write
+	json_codec.get_backend()
+	gc.collect()
+	gc.freeze()
+
+	def _stop(_signum, _frame):
+		raise _Stop()
+
+	signal.signal(signal.SIGTERM, _stop)
+	signal.signal(signal.SIGINT, _stop)
+
+	# Worker pid -> start time
+	pids: Dict[int, float] = {}
+	crashes = 0
+	exit_code = 0
+	try:
+		for _ in range(workers):
+			pids[_spawn_worker(listener)] = time.monotonic()
+		logging.info("Serving on %s with %d workers", socket_path, workers)
+		while True:
+			try:
+				pid, _ = os.wait()
+			except ChildProcessError:
+				break
+			lifetime = time.monotonic() - pids.pop(pid, 0.0)
+			if lifetime >= MIN_WORKER_LIFETIME:
+				crashes = 0
+				logging.warning("Worker %d exited; respawning", pid)
+			else:
+				crashes += 1
+				if crashes >= MAX_WORKER_CRASHES:
+					logging.error("Workers keep exiting right after start (%d in a row); stopping", crashes)
+					exit_code = 1
+					break
+				delay = min(RESPAWN_DELAY * 2 ** (crashes - 1), MAX_RESPAWN_DELAY)
+				logging.warning("Worker %d exited after %.2fs; respawning in %.2fs", pid, lifetime, delay)
+				time.sleep(delay)
+			pids[_spawn_worker(listener)] = time.monotonic()
+	except _Stop:
+		pass
+	finally:
+		signal.signal(signal.SIGTERM, signal.SIG_IGN)
+		signal.signal(signal.SIGINT, signal.SIG_IGN)
+		for pid in pids:
+			try:
+				os.kill(pid, signal.SIGTERM)
+			except ProcessLookupError:
+				pass
+		for pid in pids:
+			try:
+				os.waitpid(pid, 0)
+			except ChildProcessError:
+				pass
+		listener.close()
+		try:
+			os.unlink(socket_path)
+		except FileNotFoundError:
+			pass
+		logging.info("Server stopped")
+	return exit_code
@@ -0,0 +1,32 @@
+#!/usr/bin/env python3
+"""
+pytest configuration for the test suite
+
+Marks every test with its category (the directory under tests/) so that
+``pytest -m unit`` / ``-m performance`` etc. select by category.
+"""
+
+import os
+
+CATEGORY_MARKERS = {
+	"unit": "Unit tests - test individual components in isolation",
+	"feature": "Feature tests - test complete feature workflows",
+	"integration": "Integration tests - test comprehensive scenarios and component interactions",
+	"example": "Example tests - run the shipped example configuration",
+	"performance": "Performance and benchmark tests",
+}
+
+TESTS_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def pytest_configure(config):
+	for name, description in CATEGORY_MARKERS.items():
+		config.addinivalue_line("markers", f"{name}: {description}")
+
+
+def pytest_collection_modifyitems(config, items):
+	for item in items:
+		relative = os.path.relpath(str(item.fspath), TESTS_DIR)
+		category = relative.split(os.sep, 1)[0]
+		if category in CATEGORY_MARKERS:
+			item.add_marker(category)
@@ -0,0 +1,26 @@
+#!/usr/bin/env python3
+"""
+Feature test: CLI across a matrix of config variants
+"""
+
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+from tests.framework import UnifiedTestCase
+
+
+class TestCLIConfigMatrix(UnifiedTestCase):
+	"""Test CLI output for every case of the config matrix"""
+
+	# Every case is forked from a warm worker: isolated runs without interpreter start-up
+	executor_backend = "pool"
+
+	def test_cli_config_matrix(self):
+		cases = self.run_matrix("202_config_matrix")
+		self.assertEqual(cases, 8)
+
+
+if __name__ == "__main__":
+	unittest.main()
@@ -0,0 +1,23 @@
+#!/usr/bin/env python3
+"""
+Feature test: config schema validation
+"""
+
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+from tests.framework import UnifiedTestCase
+
+
+class TestConfigSchema(UnifiedTestCase):
+	"""Test that an invalid config is rejected before any output is written"""
+
+	def test_config_schema_errors(self):
+		result = self.run_test("203_config_schema")
+		self.validate_test_output(result)
+
+
+if __name__ == "__main__":
+	unittest.main()
@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Feature test: spill capture and early termination
+"""
+
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+from tests.framework import UnifiedTestCase
+from tests.framework import validators
+from tests.framework.executor import StreamWatch
+
+
+class TestSpillCapture(UnifiedTestCase):
+	"""Test spill files, the in-memory tail and runs killed by stream checks"""
+
+	executor_capture = "spill"
+
+	def blocking_config(self) -> str:
+		"""A config folder whose only file is a FIFO: the CLI logs its config path, then blocks."""
+		config_dir = os.path.join(self.workspace_dir, "configs")
+		os.makedirs(config_dir)
+		os.mkfifo(os.path.join(config_dir, "config.json"))
+		return config_dir
+
+	def read(self, path: str) -> str:
+		with open(path, "r", encoding="utf-8") as f:
+			return f.read()
+
+	def test_spill_capture_scenario(self):
+		result = self.run_test("204_spill_capture")
+		self.validate_execution_success(result)
+		self.validate_test_output(result)
+		cli_result = result.cli_result
+		self.assertIsNone(cli_result.terminated_early)
+		self.assertEqual(cli_result.stream_matches["stdout"], {"Wrote output to"})
+		self.assertEqual(os.path.dirname(cli_result.stdout_file), self.workspace_dir)
+		self.assertEqual(self.read(cli_result.stdout_file), cli_result.stdout)
+
+	def test_only_the_tail_is_kept_in_memory(self):
+		self.executor.tail_bytes = 16
+		config_path = os.path.join(self.workspace_dir, "config.json")
+		with open(config_path, "w", encoding="utf-8") as f:
+			f.write('{"test": "Tail Run", "output_dir": "./output"}')
+		result = self.executor.run_full_pipeline(config_path)
+		self.assertEqual(result.exit_code, 0, self.read(result.stderr_file))
+		full = self.read(result.stdout_file)
+		self.assertIn("Using config", full)
+		self.assertEqual(len(result.stdout.encode("utf-8")), 16)
+		self.assertTrue(full.endswith(result.stdout))
+		# Assertions on the stream still see the whole output through the spill file
+		self.cli_validator.assert_cli_stdout_contains(result, "Using config")
+
+	@unittest.skipUnless(hasattr(os, "mkfifo"), "requires FIFOs")
+	def test_forbidden_text_terminates_the_run(self):
+		watch = StreamWatch(forbidden={"stdout": ["Using config"]})
+		result = self.executor.run_full_pipeline(self.blocking_config(), self.workspace_dir, watch=watch)
+		self.assertEqual(result.terminated_early, "forbidden text 'Using config' in stdout")
+		self.assertLess(result.exit_code, 0)
+		self.assertLess(result.execution_time, 20.0)
+		with self.assertRaisesRegex(validators.TestError, "terminated early: forbidden text 'Using config' in stdout"):
+			self.cli_validator.assert_cli_success(result)
+
+	@unittest.skipUnless(hasattr(os, "mkfifo"), "requires FIFOs")
+	def test_time_limit_terminates_the_run(self):
+		watch = StreamWatch(expected={"stdout": ["Using config"]}, deadline=1.0)
+		result = self.executor.run_full_pipeline(self.blocking_config(), self.workspace_dir, watch=watch)
+		self.assertEqual(result.terminated_early, "max_execution_time 1.0s exceeded")
+		self.assertLess(result.exit_code, 0)
+		self.assertLess(result.execution_time, 20.0)
+		# Text seen before the kill is still reported
+		self.assertEqual(result.stream_matches["stdout"], {"Using config"})
+
+
+if __name__ == "__main__":
+	unittest.main()
@@ -7,8 +7,13 @@ Provides CLI execution, YAML-based test data loading, and generic validators.
 
 from .base import UnifiedTestCase, TestResult
 from .data_loader import TestDataLoader
+from .catalog import TestCatalog, get_catalog
+from .fixtures import FixtureCache, get_fixture_cache
+from .matrix import ScenarioMatrix
 from .executor import TestExecutor, CLIResult
 from .validators_processor import ValidatorsProcessor
+from .assertion_plan import AssertionPlan, AssertionFailures, ValidationContext
+from .streaming import MultiPatternScanner, scan_file
 from .validators import (
 	OutputValidator,
 	FileValidator,
@@ -20,9 +25,19 @@ __all__ = [
 	'UnifiedTestCase',
 	'TestResult',
 	'TestDataLoader',
+	'TestCatalog',
+	'get_catalog',
+	'FixtureCache',
+	'get_fixture_cache',
+	'ScenarioMatrix',
 	'TestExecutor',
 	'CLIResult',
 	'ValidatorsProcessor',
+	'AssertionPlan',
+	'AssertionFailures',
+	'ValidationContext',
+	'MultiPatternScanner',
+	'scan_file',
 	'OutputValidator',
 	'FileValidator',
 	'CLIValidator',
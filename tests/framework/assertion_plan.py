@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+"""
+Assertion plans for the unified testing framework (generic)
+
+YAML assertions are compiled once into an AssertionPlan. Running a plan takes an
+explicit ValidationContext (base directory for relative paths and the CLI
+result), stats each referenced file at most once and streams it at most once,
+evaluating all of its content checks in that single pass (see streaming.py). Every failing check is
+collected and reported together.
+"""
+
+import os
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from .executor import CLIResult, StreamWatch
+from .streaming import encode_patterns, scan_file
+from .validators import CLIValidator, TestError
+
+
+class AssertionFailures(AssertionError):
+	"""Raised when more than one assertion of a plan fails"""
+	def __init__(self, failures: List[Exception]):
+		self.failures = failures
+		lines = "\n".join(f"  - {failure}" for failure in failures)
+		super().__init__(f"{len(failures)} assertions failed:\n{lines}")
+
+
+@dataclass
+class ValidationContext:
+	"""Explicit inputs for running an assertion plan"""
+	base_dir: Optional[str] = None
+	output_dir: Optional[str] = None
+	cli_result: Optional[CLIResult] = None
+
+	def resolve(self, path: str) -> str:
+		"""Resolve a YAML path against base_dir (or the cwd when no base_dir is set)."""
+		if os.path.isabs(path) or not self.base_dir:
+			return os.path.normpath(path)
+		return os.path.normpath(os.path.join(self.base_dir, path))
+
+
+@dataclass
+class FileChecks:
+	"""All checks that target one file or directory"""
+	path: str
+	is_dir: bool = False
+	must_exist: bool = False
+	must_not_exist: bool = False
+	utf8: bool = False
+	contains: List[str] = field(default_factory=list)
+	not_contains: List[str] = field(default_factory=list)
+	contains_lines: List[str] = field(default_factory=list)
+	line_count: Optional[int] = None
+	empty: bool = False
+	not_empty: bool = False
+
+	def needs_content(self) -> bool:
+		return bool(self.utf8 or self.contains or self.not_contains or self.contains_lines
+					or self.line_count is not None)
+
+	def evaluate(self, context: ValidationContext, failures: List[Exception]) -> None:
+		resolved = context.resolve(self.path)
+		try:
+			stat = os.stat(resolved)
+		except OSError:
+			stat = None
+		if self.must_not_exist:
+			if stat is not None:
+				failures.append(AssertionError(f"File exists but should not: {resolved}"))
+			return
+		if stat is None:
+			kind = "Output directory" if self.is_dir else "File"
+			failures.append(AssertionError(f"{kind} does not exist: {resolved}"))
+			return
+		if self.is_dir and not os.path.isdir(resolved):
+			failures.append(AssertionError(f"Output path is not a directory: {resolved}"))
+		if self.empty and stat.st_size != 0:
+			failures.append(AssertionError(f"File is not empty: {resolved}"))
+		if self.not_empty and stat.st_size == 0:
+			failures.append(AssertionError(f"File is empty: {resolved}"))
+		if not self.needs_content():
+			return
+		patterns = encode_patterns(self.contains + self.not_contains + self.contains_lines)
+		scan = scan_file(resolved, patterns, validate_utf8=self.utf8,
+						count_lines=self.line_count is not None)
+		if scan.utf8_error is not None:
+			failures.append(AssertionError(f"File '{resolved}' is not valid UTF-8: {scan.utf8_error}"))
+		for expected in self.contains:
+			if expected.encode("utf-8") not in scan.found:
+				failures.append(AssertionError(f"File '{resolved}' missing expected text: '{expected}'"))
+		for forbidden in self.not_contains:
+			if forbidden.encode("utf-8") in scan.found:
+				failures.append(AssertionError(f"File '{resolved}' contains forbidden text: '{forbidden}'"))
+		for line in self.contains_lines:
+			if line.encode("utf-8") not in scan.found:
+				failures.append(AssertionError(f"File '{resolved}' missing expected line: '{line}'"))
+		if self.line_count is not None and scan.line_count != self.line_count:
+			failures.append(AssertionError(
+				f"File '{resolved}' expected {self.line_count} lines, got {scan.line_count}"))
+
+
+class AssertionPlan:
+	"""Compiled form of a YAML `assertions` section"""
+	def __init__(self, execution_checks: List[Tuple[str, Callable[[CLIResult], None]]],
+				file_checks: List[FileChecks], stream_watch: Optional[StreamWatch] = None):
+		self.execution_checks = execution_checks
+		self.file_checks = file_checks
+		# Execution checks the executor can evaluate while output streams (spill capture)
+		self.stream_watch = stream_watch or StreamWatch()
+
+	@classmethod
+	def compile(cls, assertions: Dict[str, Any], cli_validator: Optional[CLIValidator] = None) -> "AssertionPlan":
+		cli = cli_validator or CLIValidator()
+		execution_checks: List[Tuple[str, Callable[[CLIResult], None]]] = []
+		exec_a = assertions.get("execution", {})
+		if "exit_code" in exec_a:
+			expected = exec_a["exit_code"]
+			if expected == 0:
+				execution_checks.append(("exit_code", cli.assert_cli_success))
+			else:
+				execution_checks.append(("exit_code", lambda r: cli.assert_cli_exit_code(r, expected)))
+		if "stdout_contains" in exec_a:
+			stdout_text = exec_a["stdout_contains"]
+			execution_checks.append(("stdout_contains", lambda r: cli.assert_cli_stdout_contains(r, stdout_text)))
+		if "stderr_contains" in exec_a:
+			stderr_text = exec_a["stderr_contains"]
+			execution_checks.append(("stderr_contains", lambda r: cli.assert_cli_stderr_contains(r, stderr_text)))
+		if "stdout_not_contains" in exec_a:
+			stdout_forbidden = exec_a["stdout_not_contains"]
+			execution_checks.append(("stdout_not_contains", lambda r: cli.assert_cli_stdout_not_contains(r, stdout_forbidden)))
+		if "stderr_not_contains" in exec_a:
+			stderr_forbidden = exec_a["stderr_not_contains"]
+			execution_checks.append(("stderr_not_contains", lambda r: cli.assert_cli_stderr_not_contains(r, stderr_forbidden)))
+		if "max_execution_time" in exec_a:
+			limit = exec_a["max_execution_time"]
+			execution_checks.append(("max_execution_time", lambda r: cli.assert_cli_execution_time_under(r, limit)))
+		if "max_cpu_time" in exec_a:
+			cpu_limit = exec_a["max_cpu_time"]
+			execution_checks.append(("max_cpu_time", lambda r: cli.assert_cli_cpu_time_under(r, cpu_limit)))
+		if "max_peak_rss_mb" in exec_a:
+			rss_limit = exec_a["max_peak_rss_mb"]
+			execution_checks.append(("max_peak_rss_mb", lambda r: cli.assert_cli_peak_rss_under(r, rss_limit)))
+		if "max_io_blocks" in exec_a:
+			io_limit = exec_a["max_io_blocks"]
+			execution_checks.append(("max_io_blocks", lambda r: cli.assert_cli_io_blocks_under(r, io_limit)))
+		if exec_a.get("success_expected") is False:
+			expected_error = exec_a.get("expected_error")
+			execution_checks.append(("success_expected", lambda r: cli.assert_cli_failure(r, expected_error)))
+
+		files: Dict[str, FileChecks] = {}
+
+		def checks_for(path: str) -> FileChecks:
+			if path not in files:
+				files[path] = FileChecks(path)
+			return files[path]
+
+		files_a = assertions.get("files", {})
+		if "output_dir_exists" in files_a:
+			checks = checks_for(files_a["output_dir_exists"])
+			checks.must_exist = checks.is_dir = True
+		for path in files_a.get("files_exist", []):
+			checks_for(path).must_exist = True
+		for path in files_a.get("files_not_exist", []):
+			checks_for(path).must_not_exist = True
+		for path in files_a.get("utf8_files", []):
+			checks_for(path).utf8 = True
+		for path, content_a in files_a.get("file_content", {}).items():
+			checks = checks_for(path)
+			checks.contains.extend(content_a.get("contains", []))
+			checks.not_contains.extend(content_a.get("not_contains", []))
+			checks.contains_lines.extend(content_a.get("contains_lines", []))
+			if "line_count" in content_a:
+				checks.line_count = content_a["line_count"]
+			checks.empty = checks.empty or bool(content_a.get("empty"))
+			checks.not_empty = checks.not_empty or bool(content_a.get("not_empty"))
+		watch = StreamWatch(deadline=exec_a.get("max_execution_time"))
+		for stream in ("stdout", "stderr"):
+			if f"{stream}_contains" in exec_a:
+				watch.expected[stream] = [exec_a[f"{stream}_contains"]]
+			if f"{stream}_not_contains" in exec_a:
+				watch.forbidden[stream] = [exec_a[f"{stream}_not_contains"]]
+		if exec_a.get("expected_error"):
+			watch.expected.setdefault("stderr", []).append(exec_a["expected_error"])
+		return cls(execution_checks, list(files.values()), watch)
+
+	def run(self, context: ValidationContext) -> None:
+		"""Evaluate every check; raise the single failure or AssertionFailures for several."""
+		failures: List[Exception] = []
+		if self.execution_checks and context.cli_result is not None:
+			for _name, check in self.execution_checks:
+				try:
+					check(context.cli_result)
+				except (AssertionError, TestError) as e:
+					failures.append(e)
+		for checks in self.file_checks:
+			checks.evaluate(context, failures)
+		if len(failures) == 1:
+			raise failures[0]
+		if failures:
+			raise AssertionFailures(failures)
@@ -5,18 +5,29 @@ Unified Test Case Base Class (generic)
 Provides common setup, teardown, and component initialization for CLI/file tests.
 """
 
+import inspect
+import itertools
 import os
 import sys
 import unittest
 import tempfile
 import json
 import shutil
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 
 from .executor import TestExecutor, CLIResult
 from .data_loader import TestDataLoader
 from .validators_processor import ValidatorsProcessor
 from .validators import OutputValidator, FileValidator, CLIValidator
+from .assertion_plan import ValidationContext
+from .perf import record_benchmark, record_cli_run, summarize
+from . import impact, result_cache
+
+# Root for per-test workspaces (default: <tmp>/python_sample_app-tests); each
+# pytest-xdist worker gets its own subdirectory
+WORKSPACE_ROOT_ENV = "TEST_WORKSPACE_ROOT"
+# Set to keep workspaces after the test for inspection
+KEEP_WORKSPACE_ENV = "TEST_KEEP_WORKSPACE"
 
 
 class TestResult:
@@ -26,72 +37,241 @@ class TestResult:
 		self.test_dir = test_dir
 		self.output_dir = output_dir
 		self.artifacts = artifacts or []
+		# Timing summary when produced by run_benchmark
+		self.benchmark: Optional[Dict[str, Any]] = None
+		# Scenario data the run was built from (a matrix case's expansion for run_matrix)
+		self.test_data: Optional[Dict[str, Any]] = None
 
 
 class UnifiedTestCase(unittest.TestCase):
 	"""Base class for tests using the unified testing framework (generic)."""
+	# Executor backend for this suite ("subprocess", "inprocess" or "pool"); None defers to
+	# TEST_EXECUTOR_BACKEND and then to the subprocess backend
+	executor_backend = None
+	# Output capture ("memory" or "spill"); None defers to TEST_EXECUTOR_CAPTURE
+	executor_capture = None
+
 	def setUp(self):
-		self.executor = TestExecutor()
+		self.executor = TestExecutor(backend=self.executor_backend, capture=self.executor_capture)
 		self.data_loader = TestDataLoader()
 		self.validators_processor = ValidatorsProcessor()
 		self.output_validator = OutputValidator()
 		self.file_validator = FileValidator()
 		self.cli_validator = CLIValidator()
-		self._cleanup_existing_test_folders()
-		self.temp_dir = tempfile.mkdtemp()
-		self.output_dir = os.path.join(self.temp_dir, "output")
-		os.makedirs(self.output_dir, exist_ok=True)
 		self.test_name = self.__class__.__name__
 		self.test_method = self._testMethodName
+		# Unique workspace per test (and per worker), so parallel runs never share fixtures
+		self.workspace_dir = tempfile.mkdtemp(
+			prefix=f"{self.test_name}.{self.test_method}-", dir=self._worker_root()
+		)
+		self.temp_dir = self.workspace_dir
+		self.output_dir = os.path.join(self.temp_dir, "output")
+		os.makedirs(self.output_dir, exist_ok=True)
+		# Spilled stdout/stderr are removed with the workspace
+		self.executor.spill_dir = self.workspace_dir
+		# Change-impact recording: coverage context and the inputs this test uses
+		self._impact_inputs = [inspect.getfile(type(self))]
+		if impact.record_dir():
+			self.executor.coverage_context = impact.test_nodeid(self)
+		# Scenario digests for the result cache (test id -> digest)
+		self._cached_scenarios: Dict[str, str] = {}
+
+	def run(self, result=None):
+		# Record passes in the result cache once the test is reported successful
+		if result is not None and self._result_cache_active():
+			result = result_cache.CachingResult(result, self._store_cached_pass)
+		return super().run(result)
 
 	def tearDown(self):
-		pass
+		directory = impact.record_dir()
+		if directory:
+			impact.record_inputs(directory, impact.test_nodeid(self), self._impact_inputs)
+		# Cleanup is scoped to this test's own workspace
+		if not os.environ.get(KEEP_WORKSPACE_ENV):
+			shutil.rmtree(self.workspace_dir, ignore_errors=True)
 
 	def run_test(self, test_id: str) -> TestResult:
+		self._note_scenario(test_id)
 		# Load test data from YAML
 		test_data = self.data_loader.load_test_data(test_id)
+		if "matrix" in test_data:
+			raise ValueError(f"Test '{test_id}' has a matrix section; use run_matrix")
+		return self._run_scenario(test_id, test_data, self.workspace_dir)
+
+	def run_matrix(self, test_id: str) -> int:
+		"""Run and validate every case of a scenario's YAML `matrix` section.
+
+		Cases are expanded lazily from the one loaded scenario, each in a fresh
+		directory and as its own subTest (labelled with its parameters). With
+		`concurrency` above 1, cases are materialized in batches and run through
+		executor.run_many (stream checks are then only evaluated after each run).
+		Returns the number of cases run.
+		"""
+		self._note_scenario(test_id)
+		test_data = self.data_loader.load_test_data(test_id)
+		matrix = test_data.get("matrix")
+		if matrix is None:
+			raise ValueError(f"Test '{test_id}' has no matrix section")
+		cases = enumerate(matrix.cases())
+		batch_size = 1 if matrix.concurrency == 1 else matrix.concurrency * 4
+		count = 0
+		while True:
+			batch = []
+			for index, params in itertools.islice(cases, batch_size):
+				case_data = matrix.expand(test_data, params)
+				case_dir = tempfile.mkdtemp(prefix=f"case-{index}-", dir=self.workspace_dir)
+				batch.append((params, case_data, case_dir))
+			if not batch:
+				return count
+			if matrix.concurrency == 1:
+				params, case_data, case_dir = batch[0]
+				with self.subTest(case=matrix.label(params)):
+					self._validate_case(self._run_scenario(test_id, case_data, case_dir))
+			else:
+				prepared = [self._prepare_scenario(test_id, case_data, case_dir) for _, case_data, case_dir in batch]
+				cli_results = self.executor.run_many(
+					[os.path.join(test_folder, config_filename) for test_folder, config_filename, _, _ in prepared],
+					concurrency=matrix.concurrency
+				)
+				for (params, case_data, _), (_, _, test_dir, output_dir), cli_result in zip(batch, prepared, cli_results):
+					with self.subTest(case=matrix.label(params)):
+						self._validate_case(self._scenario_result(test_id, case_data, cli_result, test_dir, output_dir))
+			for _, case_data, case_dir in batch:
+				if case_data.get("assertions") is not test_data.get("assertions"):
+					self.validators_processor.discard(case_data.get("assertions"))
+				shutil.rmtree(case_dir, ignore_errors=True)
+			count += len(batch)
+
+	def _validate_case(self, result: TestResult) -> None:
+		self.validate_execution_success(result)
+		self.validate_test_output(result)
+
+	def run_benchmark(self, test_id: str) -> TestResult:
+		"""Run a scenario per its YAML `benchmark` section and check the median/p95 limits.
+
+		Every warmup and measured iteration gets freshly materialized fixtures and must
+		succeed. The returned result is the last iteration's, with the summary in
+		`result.benchmark`.
+		"""
+		self._note_scenario(test_id)
+		test_data = self.data_loader.load_test_data(test_id)
+		settings = test_data.get("benchmark")
+		if settings is None:
+			raise ValueError(f"Test '{test_id}' has no benchmark section")
+		samples = []
+		result = None
+		for iteration in range(settings["warmup"] + settings["iterations"]):
+			if result is not None:
+				shutil.rmtree(os.path.dirname(result.test_dir), ignore_errors=True)
+			iteration_dir = tempfile.mkdtemp(prefix=f"iteration-{iteration}-", dir=self.workspace_dir)
+			result = self._run_scenario(test_id, test_data, iteration_dir)
+			self.cli_validator.assert_cli_success(result.cli_result)
+			if iteration >= settings["warmup"]:
+				samples.append(result.cli_result.execution_time)
+		stats = summarize(samples)
+		failures = []
+		for key, stat in (("max_median", "median"), ("max_p95", "p95")):
+			limit = settings.get(key)
+			if limit is not None and stats[stat] > limit:
+				failures.append(f"{stat} {stats[stat]:.4f}s exceeds {key} {limit:.4f}s")
+		record_benchmark(test_id, stats, settings, passed=not failures)
+		result.benchmark = stats
+		if failures:
+			raise AssertionError(
+				f"Benchmark '{test_id}' over {stats['iterations']} iterations: " + "; ".join(failures)
+				+ f" (mean {stats['mean']:.4f}s, stdev {stats['stdev']:.4f}s)")
+		return result
+
+	def _run_scenario(self, test_id: str, test_data: Dict[str, Any], base_dir: str) -> TestResult:
+		test_folder, config_filename, test_dir, output_dir = self._prepare_scenario(test_id, test_data, base_dir)
+		# Execute (stream checks from the YAML are evaluated while output arrives)
+		plan = self.validators_processor.compile(test_data.get("assertions", {}))
+		cli_result = self.executor.run_full_pipeline(config_filename, test_folder, watch=plan.stream_watch)
+		return self._scenario_result(test_id, test_data, cli_result, test_dir, output_dir)
+
+	def _prepare_scenario(self, test_id: str, test_data: Dict[str, Any], base_dir: str):
+		"""Materialize a scenario; return (test_folder, config_filename, test_dir, output_dir)."""
+		if impact.record_dir():
+			self._impact_inputs.extend(self.data_loader.input_files(test_id))
 		# Create temporary files
-		source_dir, config_path = self.data_loader.create_temp_files(test_data, test_id)
+		source_dir, config_path = self.data_loader.create_temp_files(test_data, test_id, base_dir)
 		# Calculate paths
 		test_folder = os.path.dirname(source_dir)
 		test_dir = os.path.dirname(test_folder)
 		output_dir = os.path.join(test_dir, "output")
 		os.makedirs(output_dir, exist_ok=True)
-		config_filename = os.path.basename(config_path)
-		# Execute
-		cli_result = self.executor.run_full_pipeline(config_filename, test_folder)
+		return test_folder, os.path.basename(config_path), test_dir, output_dir
+
+	def _scenario_result(self, test_id: str, test_data: Dict[str, Any], cli_result: CLIResult,
+						test_dir: str, output_dir: str) -> TestResult:
+		record_cli_run(impact.test_nodeid(self), test_id, cli_result)
 		# Collect artifacts (generic: look for output.txt)
 		artifacts = []
 		candidate = os.path.join(output_dir, "output.txt")
 		if os.path.exists(candidate):
 			artifacts.append(candidate)
-		return TestResult(cli_result, test_dir, output_dir, artifacts)
+		result = TestResult(cli_result, test_dir, output_dir, artifacts)
+		result.test_data = test_data
+		return result
 
 	def validate_execution_success(self, result: TestResult):
 		self.cli_validator.assert_cli_success(result.cli_result)
 
 	def validate_test_output(self, result: TestResult):
 		# Load test data to get assertions
-		test_id = os.path.basename(result.test_dir).replace('test-', '')
-		test_data = self.data_loader.load_test_data(test_id)
+		test_data = result.test_data
+		if test_data is None:
+			test_id = os.path.basename(result.test_dir).replace('test-', '')
+			test_data = self.data_loader.load_test_data(test_id)
 		# Expose paths for validators to normalize relative paths
 		self.current_validation_base_dir = result.test_dir
 		self.current_validation_output_dir = result.output_dir
+		self.output_validator.base_dir = result.test_dir
+		context = ValidationContext(result.test_dir, result.output_dir, result.cli_result)
 		# Process assertions
 		self.validators_processor.process_assertions(
-			test_data.get("assertions", {}), {}, {}, result.cli_result, self
+			test_data.get("assertions", {}), {}, {}, result.cli_result, self, context
 		)
 
-	def _cleanup_existing_test_folders(self):
-		"""Clean up any existing test-* folders in test directories"""
-		test_categories = ['unit', 'feature', 'integration', 'example']
-		for category in test_categories:
-			category_path = os.path.join(os.path.dirname(__file__), '..', category)
-			if os.path.exists(category_path):
-				for item in os.listdir(category_path):
-					item_path = os.path.join(category_path, item)
-					if os.path.isdir(item_path) and item.startswith('test-'):
-						try:
-							shutil.rmtree(item_path)
-						except Exception as e:
-							print(f"Warning: Could not clean up {item_path}: {e}")
\ No newline at end of file
+	@staticmethod
+	def _result_cache_active() -> bool:
+		# Impact recording needs every test to actually run
+		return result_cache.enabled() and not impact.record_dir()
+
+	def _result_cache_key(self) -> str:
+		settings = {"backend": self.executor.backend, "capture": self.executor.capture}
+		return result_cache.test_key(impact.test_nodeid(self), inspect.getfile(type(self)), settings)
+
+	def _scenario_digest(self, test_id: str) -> str:
+		files = self.data_loader.input_files(test_id)
+		return result_cache.scenario_digest(files[0], files[1:])
+
+	def _note_scenario(self, test_id: str) -> None:
+		"""Track a scenario for the result cache; skip the test if its last pass is still valid."""
+		if not self._result_cache_active() or test_id in self._cached_scenarios:
+			return
+		first = not self._cached_scenarios
+		self._cached_scenarios[test_id] = self._scenario_digest(test_id)
+		if not first:
+			return
+		entry = self._get_result_cache().lookup(self._result_cache_key())
+		if entry and entry.get("scenarios") and all(
+				self._scenario_digest(scenario) == digest for scenario, digest in entry["scenarios"].items()):
+			raise unittest.SkipTest(result_cache.CACHED_PASS)
+
+	def _store_cached_pass(self) -> None:
+		if self._cached_scenarios:
+			self._get_result_cache().store(self._result_cache_key(), impact.test_nodeid(self), self._cached_scenarios)
+
+	@staticmethod
+	def _get_result_cache() -> "result_cache.ResultCache":
+		return result_cache.ResultCache()
+
+	@staticmethod
+	def _worker_root() -> str:
+		"""Return (and create) the workspace root of the current worker process."""
+		root = os.environ.get(WORKSPACE_ROOT_ENV) or os.path.join(tempfile.gettempdir(), "python_sample_app-tests")
+		worker_id = os.environ.get("PYTEST_XDIST_WORKER", "main")
+		worker_root = os.path.join(root, worker_id)
+		os.makedirs(worker_root, exist_ok=True)
+		return worker_root
@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+Test data catalog for the unified testing framework (generic)
+
+Indexes every scenario YAML under tests/ once per session (test id -> path; an
+id used by two files is an error) and caches the parsed, validated test data
+keyed by file mtime and size, so repeated loads of the same scenario cost a
+single os.stat. YAML is parsed with the libyaml C loader when PyYAML was built
+with it.
+
+Set TEST_CATALOG_CACHE to a file path to persist parsed scenarios between runs
+(pickle; entries are re-validated against mtime/size on use).
+"""
+
+import atexit
+import os
+import pickle
+import re
+import tempfile
+from typing import Callable, Dict, List, Optional, Tuple
+
+import yaml
+
+CACHE_ENV = "TEST_CATALOG_CACHE"
+# Bump when the parsed test data layout changes to invalidate persisted caches
+CACHE_VERSION = 2
+
+TESTS_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+_YAML_NAME = re.compile(r"^test[_-](.+)\.ya?ml$")
+
+
+class TestCatalog:
+	"""Maps test ids to YAML files and caches their parsed test data"""
+	def __init__(self, tests_dir: str = TESTS_DIR, cache_file: Optional[str] = None):
+		self.tests_dir = tests_dir
+		self.cache_file = cache_file
+		self._paths: Optional[Dict[str, str]] = None
+		# path -> (mtime_ns, size, test_data)
+		self._entries: Dict[str, Tuple[int, int, Dict]] = {}
+		self._dirty = False
+		if cache_file:
+			self._load_cache()
+			atexit.register(self.save)
+
+	def paths(self) -> Dict[str, str]:
+		"""Return the test id -> YAML path index, scanning tests/ on first use."""
+		if self._paths is None:
+			self._paths = self._scan()
+		return self._paths
+
+	def resolve(self, test_id: str) -> Optional[str]:
+		"""Return the YAML path for a test id (rescanning once for new files)."""
+		candidates = [test_id]
+		if test_id.isdigit():
+			# Legacy numeric ids: test-001.yml
+			candidates.append(f"{int(test_id):03d}")
+		for attempt in range(2):
+			paths = self.paths()
+			for candidate in candidates:
+				if candidate in paths:
+					return paths[candidate]
+			if attempt == 0:
+				self._paths = None
+		return None
+
+	def load(self, test_id: str, build: Callable[[List], Dict]) -> Dict:
+		"""Return parsed test data for test_id.
+
+		build(documents) turns the raw YAML documents into validated test data; it
+		only runs when the file is new or changed. The returned dict is shared
+		between callers and must be treated as read-only.
+		"""
+		path = self.resolve(test_id)
+		if path is None:
+			raise FileNotFoundError(f"Test data file not found for test ID: {test_id}")
+		stat = os.stat(path)
+		entry = self._entries.get(path)
+		if entry is not None and entry[0] == stat.st_mtime_ns and entry[1] == stat.st_size:
+			return entry[2]
+		with open(path, "r", encoding="utf-8") as f:
+			documents = list(yaml.load_all(f, Loader=YAML_LOADER))
+		test_data = build(documents)
+		self._entries[path] = (stat.st_mtime_ns, stat.st_size, test_data)
+		self._dirty = True
+		return test_data
+
+	def _scan(self) -> Dict[str, str]:
+		"""Index every scenario YAML; a test id used by two files is an error."""
+		paths: Dict[str, str] = {}
+		for dirpath, dirnames, filenames in os.walk(self.tests_dir):
+			# Skip generated workspaces and caches
+			dirnames[:] = sorted(d for d in dirnames if not d.startswith(("test-", ".", "__")))
+			for filename in sorted(filenames):
+				match = _YAML_NAME.match(filename)
+				if not match:
+					continue
+				path = os.path.join(dirpath, filename)
+				other = paths.setdefault(match.group(1), path)
+				if other != path:
+					raise ValueError(f"Duplicate test id {match.group(1)!r}: {other} and {path}")
+		return paths
+
+	def _load_cache(self) -> None:
+		try:
+			with open(self.cache_file, "rb") as f:
+				version, entries = pickle.load(f)
+		except (OSError, EOFError, pickle.UnpicklingError, ValueError, TypeError):
+			return
+		if version == CACHE_VERSION and isinstance(entries, dict):
+			self._entries = entries
+
+	def save(self) -> None:
+		"""Persist parsed entries to cache_file (atomic replace; no-op if unchanged)."""
+		if not self.cache_file or not self._dirty:
+			return
+		cache_dir = os.path.dirname(os.path.abspath(self.cache_file))
+		os.makedirs(cache_dir, exist_ok=True)
+		fd, tmp_path = tempfile.mkstemp(dir=cache_dir, prefix=".catalog-")
+		try:
+			with os.fdopen(fd, "wb") as f:
+				pickle.dump((CACHE_VERSION, self._entries), f, protocol=pickle.HIGHEST_PROTOCOL)
+			os.replace(tmp_path, self.cache_file)
+		except OSError:
+			if os.path.exists(tmp_path):
+				os.unlink(tmp_path)
+			return
+		self._dirty = False
+
+
+_default_catalog: Optional[TestCatalog] = None
+
+
+def get_catalog() -> TestCatalog:
+	"""Return the session-wide catalog (created on first use)."""
+	global _default_catalog
+	if _default_catalog is None:
+		_default_catalog = TestCatalog(cache_file=os.environ.get(CACHE_ENV) or None)
+	return _default_catalog
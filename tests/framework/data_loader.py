@@ -4,47 +4,42 @@ Test Data Loader for the unified testing framework (generic)
 
 This module provides the TestDataLoader class that handles loading
 test data from YAML files and creating temporary files for testing.
+Fixtures are built once per content hash and cloned into each workspace
+(see fixtures.py).
 """
 
 import os
-import yaml
-import tempfile
 import json
-from typing import Dict, Tuple, Optional
+from typing import Dict, List, Tuple, Optional
+
+from .catalog import TestCatalog, get_catalog
+from .fixtures import FixtureCache, archive_key, content_key, fixture_cache_enabled, get_fixture_cache
+from .matrix import ScenarioMatrix
+
+BENCHMARK_DEFAULTS = {"warmup": 1, "iterations": 10}
 
 
 class TestDataLoader:
 	"""
 	Loads test data from YAML files and creates temporary files for testing
 	"""
-	def __init__(self):
-		pass
+	def __init__(self, catalog: Optional[TestCatalog] = None, fixture_cache: Optional[FixtureCache] = None):
+		self.catalog = catalog or get_catalog()
+		self.fixture_cache = fixture_cache or get_fixture_cache()
 
 	def load_test_data(self, test_id: str) -> Dict:
-		# Try to find the YAML file in different test categories
-		test_categories = ["unit", "feature", "integration", "example"]
-		for category in test_categories:
-			yaml_file = f"tests/{category}/test_{test_id}.yml"
-			if os.path.exists(yaml_file):
-				with open(yaml_file, 'r') as f:
-					documents = list(yaml.safe_load_all(f))
-				test_data = self._parse_yaml_documents(documents)
-				self._validate_test_data(test_data)
-				return test_data
-		# Legacy numeric format
-		try:
-			test_num = int(test_id)
-			category = self._get_test_category(test_id)
-			yaml_file = f"tests/{category}/test-{test_id:03d}.yml"
-			if os.path.exists(yaml_file):
-				with open(yaml_file, 'r') as f:
-					documents = list(yaml.safe_load_all(f))
-				test_data = self._parse_yaml_documents(documents)
-				self._validate_test_data(test_data)
-				return test_data
-		except ValueError:
-			pass
-		raise FileNotFoundError(f"Test data file not found for test ID: {test_id}")
+		"""Return parsed and validated test data (cached; treat as read-only)."""
+		return self.catalog.load(test_id, self._build_test_data)
+
+	def input_files(self, test_id: str) -> List[str]:
+		"""Files a scenario is built from: its YAML and any source archives."""
+		test_data = self.load_test_data(test_id)
+		return [self.catalog.resolve(test_id)] + list(self._resolve_archives(test_data, test_id).values())
+
+	def _build_test_data(self, documents: list) -> Dict:
+		test_data = self._parse_yaml_documents(documents)
+		self._validate_test_data(test_data)
+		return test_data
 
 	def _parse_yaml_documents(self, documents: list) -> Dict:
 		test_data = {}
@@ -61,38 +56,70 @@ class TestDataLoader:
 				test_data["source_files"]["config.json"] = doc["config.json"]
 			if "assertions" in doc:
 				test_data["assertions"] = doc["assertions"]
+			if "benchmark" in doc:
+				test_data["benchmark"] = doc["benchmark"]
+			if "source_archives" in doc:
+				test_data["source_archives"] = doc["source_archives"]
+			if "matrix" in doc:
+				test_data["matrix"] = doc["matrix"]
 		return test_data
 
-	def create_temp_files(self, test_data: Dict, test_id: str) -> Tuple[str, str]:
-		# Find the test category and create test-specific folder
-		test_categories = ["unit", "feature", "integration", "example"]
+	def create_temp_files(self, test_data: Dict, test_id: str, base_dir: Optional[str] = None) -> Tuple[str, str]:
+		"""Materialize fixtures into <base_dir>/test-<id>/input.
+
+		Without base_dir the legacy shared location tests/<category>/test-<id> is used,
+		which is not safe for parallel runs.
+		"""
 		test_dir = None
-		for category in test_categories:
-			category_dir = f"tests/{category}"
-			if os.path.exists(category_dir):
-				test_dir = os.path.join(category_dir, f"test-{test_id}")
-				break
+		if base_dir is not None:
+			test_dir = os.path.join(base_dir, f"test-{test_id}")
+		else:
+			# Find the test category and create test-specific folder
+			test_categories = ["unit", "feature", "integration", "example"]
+			for category in test_categories:
+				category_dir = f"tests/{category}"
+				if os.path.exists(category_dir):
+					test_dir = os.path.join(category_dir, f"test-{test_id}")
+					break
 		if not test_dir:
 			raise ValueError(f"Could not find test directory for test ID: {test_id}")
 		os.makedirs(test_dir, exist_ok=True)
 		input_dir = os.path.join(test_dir, "input")
 		output_dir = os.path.join(test_dir, "output")
-		os.makedirs(input_dir, exist_ok=True)
+		archives = self._resolve_archives(test_data, test_id)
+		if base_dir is not None and fixture_cache_enabled():
+			key = content_key(test_data.get("source_files"),
+							  {dest: archive_key(path) for dest, path in archives.items()})
+			template = self.fixture_cache.template(
+				key, lambda staging: self._materialize(test_data, os.path.join(staging, "input"), archives))
+			self.fixture_cache.clone(template, test_dir)
+		else:
+			self._materialize(test_data, input_dir, archives)
 		os.makedirs(output_dir, exist_ok=True)
+		return os.path.join(input_dir, "src"), os.path.join(input_dir, "config.json")
+
+	def _materialize(self, test_data: Dict, input_dir: str, archives: Dict[str, str]) -> None:
+		"""Write source files, extracted archives and config.json into input_dir."""
+		os.makedirs(input_dir, exist_ok=True)
 		source_dir = self._create_source_files(test_data, input_dir)
-		config_path = self._create_config_file(test_data, input_dir)
-		return source_dir, config_path
-
-	def _get_test_category(self, test_id: str) -> str:
-		test_num = int(test_id)
-		if test_num <= 1000:
-			return "unit"
-		elif test_num <= 2000:
-			return "feature"
-		elif test_num <= 3000:
-			return "integration"
-		else:
-			return "example"
+		for dest, archive_path in archives.items():
+			self.fixture_cache.clone(self.fixture_cache.archive(archive_path), os.path.join(source_dir, dest))
+		self._create_config_file(test_data, input_dir)
+
+	def _resolve_archives(self, test_data: Dict, test_id: str) -> Dict[str, str]:
+		"""Map source_archives destinations to archive paths (relative to the YAML file)."""
+		archives = test_data.get("source_archives") or {}
+		if not archives:
+			return {}
+		yaml_path = self.catalog.resolve(test_id)
+		yaml_dir = os.path.dirname(yaml_path) if yaml_path else os.getcwd()
+		resolved = {}
+		for dest, archive_path in archives.items():
+			path = os.path.normpath(os.path.join(yaml_dir, archive_path))
+			if not os.path.isfile(path):
+				raise ValueError(f"Source archive not found for '{dest}': {path}")
+			resolved[dest] = path
+		return resolved
 
 	def _validate_test_data(self, test_data: Dict) -> None:
 		# Example tests may provide only assertions
@@ -107,14 +134,52 @@ class TestDataLoader:
 				raise ValueError("'source_files' cannot be empty")
 			if "config.json" not in test_data["source_files"]:
 				raise ValueError("Missing config.json in source_files")
+		# Validate assertions section if present
+		if "assertions" in test_data and not isinstance(test_data["assertions"], dict):
+			raise ValueError("'assertions' must be a dictionary")
+		config_files = test_data.get("source_files")
+		if "matrix" in test_data:
+			if not has_source_files:
+				raise ValueError("'matrix' requires 'source_files' with a config.json template")
+			matrix = ScenarioMatrix(test_data["matrix"], test_data["source_files"], test_data.get("assertions", {}))
+			test_data["matrix"] = matrix
+			# The template itself need not be JSON; its first expansion must be
+			config_files = matrix.expand(test_data, next(matrix.cases()))["source_files"]
+		if has_source_files:
 			# Validate that config.json contains valid JSON
 			try:
-				json.loads(test_data["source_files"]["config.json"])
+				json.loads(config_files["config.json"])
 			except json.JSONDecodeError as e:
 				raise ValueError(f"Invalid JSON in config.json: {e}")
-		# Validate assertions section if present
-		if "assertions" in test_data and not isinstance(test_data["assertions"], dict):
-			raise ValueError("'assertions' must be a dictionary")
+		if "benchmark" in test_data:
+			test_data["benchmark"] = self._validate_benchmark(test_data["benchmark"])
+		if "source_archives" in test_data:
+			archives = test_data["source_archives"]
+			if not isinstance(archives, dict) or not all(
+					isinstance(k, str) and isinstance(v, str) for k, v in archives.items()):
+				raise ValueError("'source_archives' must map destination directories to archive paths")
+			for dest in archives:
+				if os.path.isabs(dest) or ".." in dest.replace("\\", "/").split("/"):
+					raise ValueError(f"'source_archives' destination must stay inside src/: {dest}")
+
+	def _validate_benchmark(self, benchmark) -> Dict:
+		"""Validate a benchmark section and fill in defaults (warmup 1, iterations 10)."""
+		if not isinstance(benchmark, dict):
+			raise ValueError("'benchmark' must be a dictionary")
+		unknown = set(benchmark) - set(BENCHMARK_DEFAULTS) - {"max_median", "max_p95"}
+		if unknown:
+			raise ValueError(f"Unknown benchmark settings: {', '.join(sorted(unknown))}")
+		settings = dict(BENCHMARK_DEFAULTS)
+		settings.update(benchmark)
+		if not isinstance(settings["warmup"], int) or settings["warmup"] < 0:
+			raise ValueError("'benchmark.warmup' must be a non-negative integer")
+		if not isinstance(settings["iterations"], int) or settings["iterations"] < 1:
+			raise ValueError("'benchmark.iterations' must be a positive integer")
+		for key in ("max_median", "max_p95"):
+			value = settings.get(key)
+			if value is not None and (not isinstance(value, (int, float)) or value <= 0):
+				raise ValueError(f"'benchmark.{key}' must be a positive number of seconds")
+		return settings
 
 	def _create_source_files(self, test_data: Dict, temp_dir: str) -> str:
 		source_files = test_data["source_files"]
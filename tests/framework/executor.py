@@ -2,13 +2,71 @@
 TestExecutor - CLI-Only Execution Engine (generic)
 
 Executes the application via its CLI using main.py. Captures stdout/stderr/exit code and timing.
+
+Three backends are available:
+- subprocess (default): runs `python3 main.py ...` in a child process (true end-to-end)
+- inprocess: calls python_sample_app.main.main() directly with argv, cwd and environment
+  swapped in isolation, avoiding interpreter start-up per run
+- pool: each run is forked from a warm worker of the app's render server (see
+  warm_pool.py), keeping process isolation without start-up and imports; runs that
+  cannot be pooled (spill capture, impact recording, no pool available) use subprocess
+
+Select the backend per executor (TestExecutor(backend=...), or `executor_backend` on a
+UnifiedTestCase subclass) or for the whole run via TEST_EXECUTOR_BACKEND.
+
+Subprocess output is captured in one of two modes:
+- memory (default): stdout/stderr are held in full in the CLIResult
+- spill: streams are written to temporary files while only a tail is kept in memory;
+  a StreamWatch is evaluated incrementally as data arrives and the process is killed
+  as soon as a failure is certain (forbidden text seen, time limit exceeded)
+
+Select it with TestExecutor(capture=...) or TEST_EXECUTOR_CAPTURE.
+
+run_many() runs the CLI on many configs concurrently (asyncio subprocesses, at most
+`concurrency` at a time, each with its own timeout) and returns the results in input order.
+
+Every run records perf_counter wall time and, where the platform allows, CPU time,
+peak RSS and block I/O counts (subprocess runs via wait4, so they are the child's own;
+in-process runs leave peak RSS unset).
 """
 
+import asyncio
+import importlib
+import io
+import logging
 import os
 import subprocess
+import sys
+import tempfile
+import threading
 import time
-from dataclasses import dataclass
-from typing import List, Dict, Optional
+import traceback
+from contextlib import redirect_stderr, redirect_stdout
+from dataclasses import dataclass, field
+from typing import List, Dict, Optional, Sequence, Set
+
+from .impact import coverage_command, measured_in_process, record_dir
+from .streaming import MultiPatternScanner, encode_patterns
+from .warm_pool import shared_pool
+
+try:
+	import resource
+except ImportError:  # not available on Windows
+	resource = None
+
+BACKEND_ENV = "TEST_EXECUTOR_BACKEND"
+BACKENDS = ("subprocess", "inprocess", "pool")
+CAPTURE_ENV = "TEST_EXECUTOR_CAPTURE"
+CAPTURE_MODES = ("memory", "spill")
+# Bytes of each stream kept in memory in spill mode
+DEFAULT_TAIL_BYTES = 64 * 1024
+_READ_SIZE = 64 * 1024
+
+# ru_maxrss is in KiB on Linux and in bytes on macOS
+_MAXRSS_PER_MB = 1024 * 1024 if sys.platform == "darwin" else 1024
+
+# In-process runs mutate process-wide state (argv, cwd, environ, logging)
+_IN_PROCESS_LOCK = threading.Lock()
 
 
 @dataclass
@@ -20,26 +78,249 @@ class CLIResult:
 	execution_time: float
 	command: List[str]
 	working_dir: str
+	# Spill capture: full streams live in these files; stdout/stderr hold only the tail
+	stdout_file: Optional[str] = None
+	stderr_file: Optional[str] = None
+	# Watched texts seen while the process ran, per stream ("stdout"/"stderr")
+	stream_matches: Dict[str, Set[str]] = field(default_factory=dict)
+	# Why the process was killed before it finished, if it was
+	terminated_early: Optional[str] = None
+	# Resource usage of the run (None where the platform or backend cannot measure it).
+	# Subprocess runs report the child's own rusage from wait4; in-process runs report
+	# deltas of this process and no peak RSS, since its peak covers everything run before
+	cpu_user_time: Optional[float] = None
+	cpu_system_time: Optional[float] = None
+	peak_rss_mb: Optional[float] = None
+	io_blocks_in: Optional[int] = None
+	io_blocks_out: Optional[int] = None
+
+	@property
+	def cpu_time(self) -> Optional[float]:
+		"""User + system CPU seconds."""
+		if self.cpu_user_time is None or self.cpu_system_time is None:
+			return None
+		return self.cpu_user_time + self.cpu_system_time
+
+	@property
+	def io_blocks(self) -> Optional[int]:
+		"""Block input + output operations."""
+		if self.io_blocks_in is None or self.io_blocks_out is None:
+			return None
+		return self.io_blocks_in + self.io_blocks_out
+
+
+@dataclass
+class StreamWatch:
+	"""Checks evaluated on stdout/stderr while the process runs (spill capture)"""
+	# stream name -> texts expected to appear
+	expected: Dict[str, List[str]] = field(default_factory=dict)
+	# stream name -> texts whose appearance fails the run (terminates it early)
+	forbidden: Dict[str, List[str]] = field(default_factory=dict)
+	# Seconds after which the run has failed anyway (terminates it early)
+	deadline: Optional[float] = None
+
+
+def _read_pipe(pipe, output: Dict[str, str], name: str) -> None:
+	output[name] = pipe.read()
+	pipe.close()
+
+
+def _exit_code(status: int) -> int:
+	"""Decode a wait status like Popen.returncode (negative signal number when killed)."""
+	if os.WIFSIGNALED(status):
+		return -os.WTERMSIG(status)
+	return os.WEXITSTATUS(status)
+
+
+def _reap(proc: subprocess.Popen, deadline: Optional[float] = None):
+	"""Wait for proc and return (exit_code, rusage), or None if deadline (perf_counter) passes.
+
+	Uses wait4 so the rusage is the child's own; rusage is None where wait4 is unavailable.
+	"""
+	if not hasattr(os, "wait4"):
+		try:
+			remaining = None if deadline is None else max(0.0, deadline - time.perf_counter())
+			return proc.wait(remaining), None
+		except subprocess.TimeoutExpired:
+			return None
+	delay = 0.0005
+	while True:
+		pid, status, usage = os.wait4(proc.pid, 0 if deadline is None else os.WNOHANG)
+		if pid:
+			proc.returncode = _exit_code(status)
+			return proc.returncode, usage
+		if time.perf_counter() >= deadline:
+			return None
+		time.sleep(delay)
+		delay = min(delay * 2, 0.05)
+
+
+def _self_usage():
+	return resource.getrusage(resource.RUSAGE_SELF) if resource is not None else None
+
+
+def _usage_fields(usage, before=None) -> Dict:
+	"""CLIResult resource fields from an rusage (minus `before` for counters)."""
+	if usage is None:
+		return {}
+
+	def delta(name: str):
+		return getattr(usage, name) - (getattr(before, name) if before is not None else 0)
+	return {
+		"cpu_user_time": delta("ru_utime"),
+		"cpu_system_time": delta("ru_stime"),
+		"peak_rss_mb": usage.ru_maxrss / _MAXRSS_PER_MB,
+		"io_blocks_in": delta("ru_inblock"),
+		"io_blocks_out": delta("ru_oublock"),
+	}
+
+
+class _SpillReader:
+	"""Drains one pipe into a spill file, keeping a tail and scanning watched texts"""
+	def __init__(self, name: str, pipe, path: str, tail_bytes: int, watch: StreamWatch, on_forbidden):
+		self.name = name
+		self.pipe = pipe
+		self.path = path
+		self.tail_bytes = tail_bytes
+		self.tail = bytearray()
+		self.forbidden = encode_patterns(watch.forbidden.get(name, []))
+		self.scanner = MultiPatternScanner(encode_patterns(watch.expected.get(name, [])) | self.forbidden)
+		self.on_forbidden = on_forbidden
+
+	def run(self) -> None:
+		with open(self.path, "wb") as spill:
+			while True:
+				chunk = self.pipe.read1(_READ_SIZE)
+				if not chunk:
+					break
+				spill.write(chunk)
+				self.tail += chunk
+				if len(self.tail) > self.tail_bytes:
+					del self.tail[:len(self.tail) - self.tail_bytes]
+				if self.scanner.patterns:
+					hits = self.scanner.feed(chunk) & self.forbidden
+					if hits:
+						self.on_forbidden(self.name, min(hits).decode("utf-8"))
+		self.pipe.close()
+
+	def matches(self) -> Set[str]:
+		return {p.decode("utf-8") for p in self.scanner.found}
+
+	def tail_text(self) -> str:
+		# The tail may start inside a multi-byte sequence
+		return self.tail.decode("utf-8", errors="replace")
 
 
 class TestExecutor:
 	"""Executes the sample app via CLI only."""
-	def __init__(self):
+	def __init__(self, backend: Optional[str] = None, capture: Optional[str] = None,
+				tail_bytes: int = DEFAULT_TAIL_BYTES):
 		# Absolute path to main.py (project root)
 		workspace_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 		main_script_path = os.path.join(workspace_root, "main.py")
 		self.main_script_command = ["python3", main_script_path]
+		self.src_dir = os.path.join(workspace_root, "src")
+		self.backend = backend or os.environ.get(BACKEND_ENV) or "subprocess"
+		if self.backend not in BACKENDS:
+			raise ValueError(f"Unknown executor backend: {self.backend!r} (choose from: {', '.join(BACKENDS)})")
+		self.capture = capture or os.environ.get(CAPTURE_ENV) or "memory"
+		if self.capture not in CAPTURE_MODES:
+			raise ValueError(f"Unknown capture mode: {self.capture!r} (choose from: {', '.join(CAPTURE_MODES)})")
+		self.tail_bytes = tail_bytes
+		# Directory for spill files (None: the system temp dir)
+		self.spill_dir: Optional[str] = None
+		# Coverage context (test node id) for change-impact recording (TEST_IMPACT_RECORD)
+		self.coverage_context: Optional[str] = None
 
-	def run_full_pipeline(self, config_path: str, working_dir: str = None) -> CLIResult:
-		"""Run the application once (single-step CLI)."""
+	def run_full_pipeline(self, config_path: str, working_dir: str = None,
+						watch: Optional[StreamWatch] = None, args: Optional[List[str]] = None) -> CLIResult:
+		"""Run the application once (single-step CLI); `args` are appended after --config."""
 		if working_dir is None:
-			working_dir = os.path.dirname(config_path) if os.path.isfile(config_path) else config_path
-		command = self._build_command(["--config", config_path])
-		return self._execute_command(command, working_dir)
+			working_dir = self._default_working_dir(config_path)
+		command = self._build_command(["--config", config_path] + list(args or []))
+		return self._execute_command(command, working_dir, watch=watch)
+
+	def run_many(self, config_paths: Sequence[str], concurrency: Optional[int] = None,
+				timeout: Optional[float] = None, env: Optional[Dict[str, str]] = None) -> List[CLIResult]:
+		"""Run the application once per config, up to `concurrency` runs at a time.
+
+		Results are returned in input order; each run is killed after `timeout` seconds.
+		Subprocess runs in memory capture use asyncio subprocesses (no rusage fields: the
+		event loop reaps the children); pool runs are issued from worker threads. The
+		in-process backend and spill capture run the configs one after another through
+		the regular path. Must not be called from a running event loop.
+		"""
+		concurrency = concurrency or os.cpu_count() or 1
+		if concurrency < 1:
+			raise ValueError(f"concurrency must be at least 1, got {concurrency}")
+		jobs = [(self._build_command(["--config", path]), self._default_working_dir(path))
+				for path in config_paths]
+		if self.backend == "inprocess" or self.capture == "spill":
+			return [self._execute_command(command, working_dir, timeout, env) for command, working_dir in jobs]
+		return asyncio.run(self._run_many_async(jobs, concurrency, timeout, env))
+
+	async def _run_many_async(self, jobs, concurrency: int, timeout: Optional[float],
+							env: Optional[Dict[str, str]]) -> List[CLIResult]:
+		semaphore = asyncio.BoundedSemaphore(concurrency)
+		process_env = os.environ.copy()
+		if env:
+			process_env.update(env)
+
+		async def run_one(command: List[str], working_dir: str) -> CLIResult:
+			async with semaphore:
+				if self.backend == "pool":
+					return await asyncio.get_running_loop().run_in_executor(
+						None, self._execute_command, command, working_dir, timeout, env
+					)
+				return await self._execute_async(command, working_dir, timeout, process_env)
+
+		return list(await asyncio.gather(*(run_one(command, working_dir) for command, working_dir in jobs)))
+
+	async def _execute_async(self, command: List[str], working_dir: str, timeout: Optional[float],
+							process_env: Dict[str, str]) -> CLIResult:
+		start_time = time.perf_counter()
+		try:
+			proc = await asyncio.create_subprocess_exec(
+				*self._process_command(command),
+				cwd=working_dir,
+				env=process_env,
+				stdout=asyncio.subprocess.PIPE,
+				stderr=asyncio.subprocess.PIPE
+			)
+		except Exception as e:
+			return CLIResult(
+				exit_code=-1,
+				stdout="",
+				stderr=f"Command failed: {e}",
+				execution_time=time.perf_counter() - start_time,
+				command=command,
+				working_dir=working_dir
+			)
+		try:
+			stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout)
+		except asyncio.TimeoutError:
+			proc.kill()
+			await proc.communicate()
+			return CLIResult(
+				exit_code=-1,
+				stdout="",
+				stderr=f"Command timed out after {timeout} seconds",
+				execution_time=time.perf_counter() - start_time,
+				command=command,
+				working_dir=working_dir
+			)
+		return CLIResult(
+			exit_code=proc.returncode,
+			stdout=stdout.decode("utf-8", errors="replace"),
+			stderr=stderr.decode("utf-8", errors="replace"),
+			execution_time=time.perf_counter() - start_time,
+			command=command,
+			working_dir=working_dir
+		)
 
 	def run_with_verbose(self, config_path: str, working_dir: str = None) -> CLIResult:
 		if working_dir is None:
-			working_dir = os.path.dirname(config_path) if os.path.isfile(config_path) else config_path
+			working_dir = self._default_working_dir(config_path)
 		command = self._build_command(["--config", config_path, "--verbose"]) 
 		return self._execute_command(command, working_dir)
 
@@ -56,53 +337,279 @@ class TestExecutor:
 			shutil.rmtree(output_dir)
 		os.makedirs(output_dir, exist_ok=True)
 
+	@staticmethod
+	def _default_working_dir(config_path: str) -> str:
+		return os.path.dirname(config_path) if os.path.isfile(config_path) else config_path
+
 	def _build_command(self, args: List[str]) -> List[str]:
 		return self.main_script_command + args
 
+	def _process_command(self, command: List[str]) -> List[str]:
+		"""Command actually spawned: wrapped in coverage when recording change impact."""
+		directory = record_dir()
+		if directory and self.coverage_context:
+			return coverage_command(command, self.coverage_context, directory)
+		return command
+
 	def _execute_command(self, command: List[str], working_dir: str,
-						timeout: Optional[int] = None, env: Optional[Dict[str, str]] = None) -> CLIResult:
-		start_time = time.time()
+						timeout: Optional[int] = None, env: Optional[Dict[str, str]] = None,
+						watch: Optional[StreamWatch] = None) -> CLIResult:
+		if self.backend == "inprocess":
+			return self._execute_in_process(command, working_dir, env)
+		if self.backend == "pool" and self.capture == "memory" and not (record_dir() and self.coverage_context):
+			pooled = self._execute_pooled(command, working_dir, timeout, env)
+			if pooled is not None:
+				return pooled
+		if self.capture == "spill":
+			return self._execute_spilling(command, working_dir, timeout, env, watch or StreamWatch())
+		start_time = time.perf_counter()
 		try:
 			process_env = os.environ.copy()
 			if env:
 				process_env.update(env)
-			result = subprocess.run(
-				command,
+			proc = subprocess.Popen(
+				self._process_command(command),
 				cwd=working_dir,
 				env=process_env,
-				capture_output=True,
-				text=True,
-				timeout=timeout
+				stdout=subprocess.PIPE,
+				stderr=subprocess.PIPE,
+				text=True
 			)
-			execution_time = time.time() - start_time
+		except Exception as e:
+			execution_time = time.perf_counter() - start_time
 			return CLIResult(
-				exit_code=result.returncode,
-				stdout=result.stdout,
-				stderr=result.stderr,
+				exit_code=-1,
+				stdout="",
+				stderr=f"Command failed: {e}",
 				execution_time=execution_time,
 				command=command,
 				working_dir=working_dir
 			)
-		except subprocess.TimeoutExpired:
-			execution_time = time.time() - start_time
+		# Drain the pipes ourselves: communicate() would reap the child before wait4 can
+		output: Dict[str, str] = {}
+		threads = [threading.Thread(target=_read_pipe, args=(pipe, output, name), daemon=True)
+				   for name, pipe in (("stdout", proc.stdout), ("stderr", proc.stderr))]
+		for thread in threads:
+			thread.start()
+		deadline = None if timeout is None else start_time + timeout
+		for thread in threads:
+			thread.join(None if deadline is None else max(0.0, deadline - time.perf_counter()))
+		reaped = None if any(thread.is_alive() for thread in threads) else _reap(proc, deadline)
+		if reaped is None:
+			proc.kill()
+			reaped = _reap(proc)
+			for thread in threads:
+				thread.join()
+			execution_time = time.perf_counter() - start_time
 			return CLIResult(
 				exit_code=-1,
 				stdout="",
 				stderr=f"Command timed out after {timeout} seconds",
 				execution_time=execution_time,
 				command=command,
-				working_dir=working_dir
+				working_dir=working_dir,
+				**_usage_fields(reaped[1])
 			)
+		execution_time = time.perf_counter() - start_time
+		exit_code, usage = reaped
+		return CLIResult(
+			exit_code=exit_code,
+			stdout=output.get("stdout", ""),
+			stderr=output.get("stderr", ""),
+			execution_time=execution_time,
+			command=command,
+			working_dir=working_dir,
+			**_usage_fields(usage)
+		)
+
+	def _execute_spilling(self, command: List[str], working_dir: str, timeout: Optional[int],
+						env: Optional[Dict[str, str]], watch: StreamWatch) -> CLIResult:
+		"""Run the command with stdout/stderr spilled to files and watched as they stream."""
+		start_time = time.perf_counter()
+		process_env = os.environ.copy()
+		if env:
+			process_env.update(env)
+		stop = threading.Event()
+		reasons: List[str] = []
+
+		def on_forbidden(stream: str, text: str) -> None:
+			if not reasons:
+				reasons.append(f"forbidden text '{text}' in {stream}")
+			stop.set()
+
+		paths = []
+		for name in ("stdout", "stderr"):
+			fd, path = tempfile.mkstemp(prefix=f"{name}-", suffix=".log", dir=self.spill_dir)
+			os.close(fd)
+			paths.append(path)
+		try:
+			proc = subprocess.Popen(self._process_command(command), cwd=working_dir, env=process_env,
+									stdout=subprocess.PIPE, stderr=subprocess.PIPE)
 		except Exception as e:
-			execution_time = time.time() - start_time
 			return CLIResult(
 				exit_code=-1,
 				stdout="",
 				stderr=f"Command failed: {e}",
-				execution_time=execution_time,
+				execution_time=time.perf_counter() - start_time,
+				command=command,
+				working_dir=working_dir,
+				stdout_file=paths[0],
+				stderr_file=paths[1]
+			)
+		readers = [
+			_SpillReader("stdout", proc.stdout, paths[0], self.tail_bytes, watch, on_forbidden),
+			_SpillReader("stderr", proc.stderr, paths[1], self.tail_bytes, watch, on_forbidden),
+		]
+		threads = [threading.Thread(target=reader.run, daemon=True) for reader in readers]
+		for thread in threads:
+			thread.start()
+		timed_out = False
+		while True:
+			# Non-blocking reap (deadline already reached)
+			reaped = _reap(proc, time.perf_counter())
+			if reaped is not None or stop.wait(0.01):
+				break
+			elapsed = time.perf_counter() - start_time
+			if timeout is not None and elapsed > timeout:
+				timed_out = True
+				break
+			if watch.deadline is not None and elapsed > watch.deadline:
+				reasons.append(f"max_execution_time {watch.deadline}s exceeded")
+				break
+		if reaped is None:
+			proc.kill()
+			reaped = _reap(proc)
+		exit_code, usage = reaped
+		for thread in threads:
+			thread.join()
+		execution_time = time.perf_counter() - start_time
+		stderr = readers[1].tail_text()
+		if timed_out:
+			exit_code = -1
+			stderr = f"Command timed out after {timeout} seconds"
+		return CLIResult(
+			exit_code=exit_code,
+			stdout=readers[0].tail_text(),
+			stderr=stderr,
+			execution_time=execution_time,
+			command=command,
+			working_dir=working_dir,
+			stdout_file=paths[0],
+			stderr_file=paths[1],
+			stream_matches={reader.name: reader.matches() for reader in readers},
+			terminated_early=reasons[0] if reasons else None,
+			**_usage_fields(usage)
+		)
+
+	def _execute_pooled(self, command: List[str], working_dir: str, timeout: Optional[float],
+						env: Optional[Dict[str, str]]) -> Optional[CLIResult]:
+		"""Run the command on the warm pool; None when the pool is unavailable (nothing ran)."""
+		pool = shared_pool(self.main_script_command, self.src_dir)
+		if pool is None:
+			return None
+		process_env = os.environ.copy()
+		if env:
+			process_env.update(env)
+		start_time = time.perf_counter()
+		try:
+			exit_code, stdout, stderr, usage = pool.run(
+				command[len(self.main_script_command):], os.path.abspath(working_dir), process_env, timeout
+			)
+		except pool.client.ServerUnavailable:
+			# Nothing was sent: run it as a plain subprocess instead
+			return None
+		except OSError as e:
+			# Same result as a subprocess that cannot be started (or whose pipes break)
+			return CLIResult(
+				exit_code=-1,
+				stdout="",
+				stderr=f"Command failed: {e}",
+				execution_time=time.perf_counter() - start_time,
 				command=command,
 				working_dir=working_dir
 			)
+		execution_time = time.perf_counter() - start_time
+		if exit_code is None:
+			exit_code, stdout, stderr = -1, "", f"Command timed out after {timeout} seconds"
+		return CLIResult(
+			exit_code=exit_code,
+			stdout=stdout,
+			stderr=stderr,
+			execution_time=execution_time,
+			command=command,
+			working_dir=working_dir,
+			**_usage_fields(usage)
+		)
+
+	def _load_main(self):
+		"""Import python_sample_app.main from this workspace's src/ directory."""
+		if self.src_dir not in sys.path:
+			sys.path.insert(0, self.src_dir)
+		return importlib.import_module("python_sample_app.main").main
+
+	def _execute_in_process(self, command: List[str], working_dir: str,
+						env: Optional[Dict[str, str]] = None) -> CLIResult:
+		"""Run main() in this process with argv/cwd/env swapped and output captured.
+
+		Timeouts are not enforced in-process; use the subprocess backend for those.
+		"""
+		args = command[len(self.main_script_command):]
+		stdout, stderr = io.StringIO(), io.StringIO()
+		root_logger = logging.getLogger()
+		with _IN_PROCESS_LOCK:
+			saved_argv, saved_cwd, saved_env = sys.argv, os.getcwd(), os.environ.copy()
+			saved_handlers, saved_level = root_logger.handlers[:], root_logger.level
+			usage_before = _self_usage()
+			start_time = time.perf_counter()
+			try:
+				main = self._load_main()
+				sys.argv = [self.main_script_command[-1]] + args
+				os.chdir(working_dir)
+				if env:
+					os.environ.update(env)
+				# Let main() install its own handler on the captured stdout
+				root_logger.handlers = []
+				with redirect_stdout(stdout), redirect_stderr(stderr), \
+						measured_in_process(self.coverage_context, record_dir()):
+					try:
+						exit_code = main(args)
+					except SystemExit as e:
+						if e.code is None or isinstance(e.code, int):
+							exit_code = e.code or 0
+						else:
+							print(e.code, file=sys.stderr)
+							exit_code = 1
+					except Exception:
+						traceback.print_exc()
+						exit_code = 1
+			except Exception as e:
+				exit_code = -1
+				stderr.write(f"Command failed: {e}")
+			finally:
+				for handler in root_logger.handlers:
+					if handler not in saved_handlers:
+						handler.close()
+				root_logger.handlers = saved_handlers
+				root_logger.setLevel(saved_level)
+				os.environ.clear()
+				os.environ.update(saved_env)
+				os.chdir(saved_cwd)
+				sys.argv = saved_argv
+			execution_time = time.perf_counter() - start_time
+			usage = _self_usage()
+		fields = _usage_fields(usage, usage_before)
+		if fields:
+			# ru_maxrss is this process's peak so far (every earlier test included), not the run's
+			fields["peak_rss_mb"] = None
+		return CLIResult(
+			exit_code=exit_code,
+			stdout=stdout.getvalue(),
+			stderr=stderr.getvalue(),
+			execution_time=execution_time,
+			command=command,
+			working_dir=working_dir,
+			**fields
+		)
 
 	def _get_test_category(self, test_name: str) -> str:
 		if test_name.startswith("test_example_"):
@@ -0,0 +1,224 @@
+#!/usr/bin/env python3
+"""
+Fixture template cache for the unified testing framework (generic)
+
+Scenario fixtures are materialized once into a template directory keyed by a hash
+of their content; each test then gets its copy of the template by hardlinking the
+files (falling back to copying when links are not possible, e.g. across devices).
+Linked fixture files are read-only, since they are shared with the template. Root
+ignores file permissions and could modify the shared template through a link, so
+fixtures are always copied when running as root.
+
+Large fixtures can reference archives (``source_archives`` in the YAML) which are
+extracted once into the cache and reused by every template that needs them.
+
+Every key gets its own template, so changed scenarios and matrix cases leave
+unused templates behind. When the session's cache is first used, templates not
+used for TEST_FIXTURE_CACHE_MAX_AGE days (default 7) are removed, then the least
+recently used ones until the cache fits in TEST_FIXTURE_CACHE_MAX_MB (default
+1024). Templates used within the last hour are kept, as other test processes may
+be cloning them.
+
+Set TEST_FIXTURE_ROOT to place the cache elsewhere (e.g. a tmpfs such as /dev/shm)
+and TEST_FIXTURE_CACHE=0 to write fixtures directly into each workspace instead.
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import stat
+import tarfile
+import tempfile
+import time
+import zipfile
+from typing import Callable, List, Optional, Tuple
+
+FIXTURE_ROOT_ENV = "TEST_FIXTURE_ROOT"
+FIXTURE_CACHE_ENV = "TEST_FIXTURE_CACHE"
+FIXTURE_MAX_MB_ENV = "TEST_FIXTURE_CACHE_MAX_MB"
+FIXTURE_MAX_AGE_ENV = "TEST_FIXTURE_CACHE_MAX_AGE"
+DEFAULT_MAX_MB = 1024
+DEFAULT_MAX_AGE_DAYS = 7
+# Templates used more recently than this are never evicted (seconds)
+EVICTION_MIN_IDLE = 3600
+# Bump when the template layout changes
+TEMPLATE_VERSION = 1
+
+_READ_ONLY = stat.S_IRUSR | stat.S_IRGRP | stat.S_IROTH
+
+
+def fixture_cache_enabled() -> bool:
+	return os.environ.get(FIXTURE_CACHE_ENV, "1") != "0"
+
+
+def content_key(*parts) -> str:
+	"""Stable hash of JSON-serializable parts."""
+	payload = json.dumps([TEMPLATE_VERSION, *parts], sort_keys=True, separators=(",", ":"))
+	return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:32]
+
+
+def archive_key(archive_path: str) -> str:
+	"""Key an archive by path, size and mtime (hashing multi-GB archives per run would defeat the cache)."""
+	st = os.stat(archive_path)
+	return content_key("archive", os.path.abspath(archive_path), st.st_size, st.st_mtime_ns)
+
+
+def _tree_size(directory: str) -> int:
+	total = 0
+	for dirpath, _dirnames, filenames in os.walk(directory):
+		for filename in filenames:
+			try:
+				total += os.lstat(os.path.join(dirpath, filename)).st_size
+			except OSError:
+				pass
+	return total
+
+
+class FixtureCache:
+	"""Content-addressed fixture templates, cloned into test workspaces"""
+	def __init__(self, root: Optional[str] = None):
+		self.root = root or os.environ.get(FIXTURE_ROOT_ENV) or os.path.join(
+			tempfile.gettempdir(), "python_sample_app-fixtures")
+		self._can_link = not (hasattr(os, "geteuid") and os.geteuid() == 0)
+
+	def template(self, key: str, build: Callable[[str], None]) -> str:
+		"""Return the template directory for key, running build(dir) once to create it.
+
+		Creation is atomic (build into a private directory, then rename), so concurrent
+		workers never see a half-built template; the loser of a race discards its copy.
+		"""
+		path = os.path.join(self.root, key)
+		if os.path.isdir(path):
+			# The directory mtime records the last use (for eviction)
+			try:
+				os.utime(path)
+			except OSError:
+				pass
+			return path
+		os.makedirs(self.root, exist_ok=True)
+		staging = tempfile.mkdtemp(prefix=f".{key}-", dir=self.root)
+		try:
+			build(staging)
+			self._make_read_only(staging)
+			os.rename(staging, path)
+		except OSError:
+			if not os.path.isdir(path):
+				raise
+		finally:
+			if os.path.isdir(staging):
+				shutil.rmtree(staging, ignore_errors=True)
+		return path
+
+	def archive(self, archive_path: str) -> str:
+		"""Return a directory holding the extracted archive (extracted on first use)."""
+		return self.template(f"archive-{archive_key(archive_path)}",
+							lambda target: extract_archive(archive_path, target))
+
+	def clone(self, template: str, destination: str) -> None:
+		"""Recreate template under destination, hardlinking files where possible."""
+		for dirpath, _dirnames, filenames in os.walk(template):
+			relative = os.path.relpath(dirpath, template)
+			target_dir = os.path.normpath(os.path.join(destination, relative))
+			os.makedirs(target_dir, exist_ok=True)
+			for filename in filenames:
+				source = os.path.join(dirpath, filename)
+				target = os.path.join(target_dir, filename)
+				if os.path.lexists(target):
+					os.unlink(target)
+				if self._can_link:
+					try:
+						os.link(source, target)
+						continue
+					except OSError:
+						# Cross-device or unsupported: copy from now on
+						self._can_link = False
+				shutil.copyfile(source, target)
+
+	def evict(self, max_bytes: int, max_age: float, min_idle: float = EVICTION_MIN_IDLE) -> List[str]:
+		"""Remove templates unused for max_age seconds, then LRU ones beyond max_bytes.
+
+		Templates used within min_idle seconds are kept. Returns the removed keys.
+		"""
+		try:
+			names = [name for name in os.listdir(self.root) if not name.startswith(".")]
+		except OSError:
+			return []
+		now = time.time()
+		entries: List[Tuple[float, str, int]] = []
+		for name in names:
+			path = os.path.join(self.root, name)
+			try:
+				last_used = os.stat(path).st_mtime
+			except OSError:
+				continue
+			entries.append((last_used, name, _tree_size(path)))
+		# Oldest first
+		entries.sort()
+		total = sum(size for _, _, size in entries)
+		removed = []
+		for last_used, name, size in entries:
+			idle = now - last_used
+			if idle < min_idle or (idle < max_age and total <= max_bytes):
+				continue
+			# Rename first: a template is either complete or gone for other processes
+			doomed = os.path.join(self.root, f".evict-{name}-{os.getpid()}")
+			try:
+				os.rename(os.path.join(self.root, name), doomed)
+			except OSError:
+				continue
+			shutil.rmtree(doomed, ignore_errors=True)
+			total -= size
+			removed.append(name)
+		return removed
+
+	@staticmethod
+	def _make_read_only(directory: str) -> None:
+		for dirpath, _dirnames, filenames in os.walk(directory):
+			for filename in filenames:
+				os.chmod(os.path.join(dirpath, filename), _READ_ONLY)
+
+
+def _check_member_path(name: str, target: str) -> str:
+	resolved = os.path.realpath(os.path.join(target, name))
+	if os.path.commonpath([resolved, os.path.realpath(target)]) != os.path.realpath(target):
+		raise ValueError(f"Archive member escapes the extraction directory: {name}")
+	return resolved
+
+
+def extract_archive(archive_path: str, target: str) -> None:
+	"""Extract a .zip or tar archive into target, refusing members outside it."""
+	if zipfile.is_zipfile(archive_path):
+		with zipfile.ZipFile(archive_path) as archive:
+			for name in archive.namelist():
+				_check_member_path(name, target)
+			archive.extractall(target)
+		return
+	if tarfile.is_tarfile(archive_path):
+		with tarfile.open(archive_path) as archive:
+			members = []
+			for member in archive.getmembers():
+				_check_member_path(member.name, target)
+				if not (member.isfile() or member.isdir()):
+					raise ValueError(f"Unsupported archive member type: {member.name}")
+				members.append(member)
+			if hasattr(tarfile, "data_filter"):
+				archive.extractall(target, members=members, filter="data")
+			else:
+				archive.extractall(target, members=members)
+		return
+	raise ValueError(f"Unsupported archive format: {archive_path}")
+
+
+_default_cache: Optional[FixtureCache] = None
+
+
+def get_fixture_cache() -> FixtureCache:
+	"""Return the session-wide fixture cache (created on first use)."""
+	global _default_cache
+	if _default_cache is None:
+		_default_cache = FixtureCache()
+		max_mb = float(os.environ.get(FIXTURE_MAX_MB_ENV) or DEFAULT_MAX_MB)
+		max_days = float(os.environ.get(FIXTURE_MAX_AGE_ENV) or DEFAULT_MAX_AGE_DAYS)
+		_default_cache.evict(int(max_mb * (1 << 20)), max_days * 86400)
+	return _default_cache
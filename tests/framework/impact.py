@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Change-impact recording for the unified testing framework (generic)
+
+When TEST_IMPACT_RECORD points to a directory, every CLI run is measured with
+coverage.py under a per-test context (the pytest node id): subprocess runs are
+wrapped in ``python -m coverage run --context=<node id>`` and in-process runs
+use the coverage API. Each test also appends the inputs it used (its module,
+scenario YAML files and fixture archives) to inputs.jsonl in that directory.
+
+scripts/test_impact.py turns the recorded data into the mapping database used by
+``run_all_tests.py --affected``.
+"""
+
+import inspect
+import json
+import os
+import uuid
+from contextlib import contextmanager
+from typing import Iterable, Iterator, List, Optional
+
+IMPACT_RECORD_ENV = "TEST_IMPACT_RECORD"
+INPUTS_FILE = "inputs.jsonl"
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def record_dir() -> Optional[str]:
+	"""Directory receiving impact data, or None when not recording."""
+	return os.environ.get(IMPACT_RECORD_ENV) or None
+
+
+def test_nodeid(test_case) -> str:
+	"""pytest-style node id (path::Class::method) of a unittest test case."""
+	path = os.path.relpath(inspect.getfile(type(test_case)), PROJECT_ROOT).replace(os.sep, "/")
+	return f"{path}::{type(test_case).__name__}::{test_case._testMethodName}"
+
+
+def coverage_include() -> List[str]:
+	"""Files measured for impact: the application entry point and package."""
+	return [os.path.join(PROJECT_ROOT, "main.py"), os.path.join(PROJECT_ROOT, "src", "*")]
+
+
+def _data_file(directory: str) -> str:
+	return os.path.join(directory, f".coverage.{uuid.uuid4().hex}")
+
+
+def coverage_command(command: List[str], context: str, directory: str) -> List[str]:
+	"""Wrap `python script args...` so the script runs under coverage with the given context."""
+	return [command[0], "-m", "coverage", "run",
+			f"--data-file={_data_file(directory)}",
+			f"--context={context}",
+			f"--include={','.join(coverage_include())}",
+			*command[1:]]
+
+
+@contextmanager
+def measured_in_process(context: Optional[str], directory: Optional[str]) -> Iterator[None]:
+	"""Measure an in-process run with the coverage API (no-op when not recording)."""
+	if not context or not directory:
+		yield
+		return
+	import coverage
+	cov = coverage.Coverage(data_file=_data_file(directory), include=coverage_include(), context=context)
+	cov.start()
+	try:
+		yield
+	finally:
+		cov.stop()
+		cov.save()
+
+
+def record_inputs(directory: str, nodeid: str, paths: Iterable[str]) -> None:
+	"""Append the non-code inputs a test used (paths relative to the project root)."""
+	relative = sorted({os.path.relpath(os.path.abspath(p), PROJECT_ROOT).replace(os.sep, "/") for p in paths})
+	with open(os.path.join(directory, INPUTS_FILE), "a", encoding="utf-8") as f:
+		f.write(json.dumps({"nodeid": nodeid, "inputs": relative}) + "\n")
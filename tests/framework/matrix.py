@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+"""
+Scenario matrices for the unified testing framework (generic)
+
+A ``matrix`` section in a scenario YAML expands one scenario into the cartesian
+product of its parameters; ``${name}`` placeholders in source files, config.json
+and assertions are replaced per case::
+
+  matrix:
+    parameters:
+      greeting: ["Hello", "Hej"]
+      size: {range: [1, 1000]}          # lazy range (start, stop[, step])
+    exclude:
+      - {greeting: "Hej", size: 3}
+    include:                            # extra cases, all parameters given
+      - {greeting: "Ciao", size: 0}
+    concurrency: 4                      # optional: run up to 4 cases at a time
+
+Values placed in config.json are JSON-escaped, so strings with quotes or
+backslashes stay valid JSON. An assertion value that is exactly ``${name}`` takes
+the parameter value with its type (e.g. ``line_count: ${lines}``).
+
+The YAML is parsed and the placeholders are compiled once; cases are generated
+lazily, so a single file can describe thousands of configurations. With
+``concurrency`` above 1 the cases are run in batches through TestExecutor.run_many.
+"""
+
+import itertools
+import json
+import re
+from typing import Any, Dict, Iterator, List, Set, Tuple, Union
+
+_PLACEHOLDER = re.compile(r"\$\{([A-Za-z_][A-Za-z0-9_]*)\}")
+_SCALARS = (str, int, float, bool)
+
+
+class _Text:
+	"""A string split once into literal parts and placeholder names"""
+	__slots__ = ("parts", "names", "whole")
+
+	def __init__(self, text: str):
+		pieces = _PLACEHOLDER.split(text)
+		# Even indexes are literals, odd indexes are parameter names
+		self.parts = pieces
+		self.names = set(pieces[1::2])
+		self.whole = pieces[1] if len(pieces) == 3 and not pieces[0] and not pieces[2] else None
+
+	def render(self, params: Dict[str, Any], escape) -> str:
+		out = []
+		for index, piece in enumerate(self.parts):
+			out.append(escape(params[piece]) if index % 2 else piece)
+		return "".join(out)
+
+
+def _plain(value: Any) -> str:
+	return value if isinstance(value, str) else json.dumps(value)
+
+
+def _json_escaped(value: Any) -> str:
+	"""Text of value inside a JSON document (string contents escaped, others as JSON)."""
+	return json.dumps(value, ensure_ascii=False)[1:-1] if isinstance(value, str) else json.dumps(value)
+
+
+def _compile(node: Any) -> Any:
+	"""Replace strings containing placeholders with _Text (other nodes are kept as-is)."""
+	if isinstance(node, str):
+		return _Text(node) if _PLACEHOLDER.search(node) else node
+	if isinstance(node, dict):
+		return {key: _compile(value) for key, value in node.items()}
+	if isinstance(node, list):
+		return [_compile(value) for value in node]
+	return node
+
+
+def _names(node: Any) -> Set[str]:
+	if isinstance(node, _Text):
+		return set(node.names)
+	if isinstance(node, dict):
+		return set().union(*(_names(value) for value in node.values())) if node else set()
+	if isinstance(node, list):
+		return set().union(*(_names(value) for value in node)) if node else set()
+	return set()
+
+
+def _render(node: Any, params: Dict[str, Any], escape, typed: bool) -> Any:
+	if isinstance(node, _Text):
+		if typed and node.whole is not None:
+			return params[node.whole]
+		return node.render(params, escape)
+	if isinstance(node, dict):
+		return {key: _render(value, params, escape, typed) for key, value in node.items()}
+	if isinstance(node, list):
+		return [_render(value, params, escape, typed) for value in node]
+	return node
+
+
+def _parse_values(name: str, values: Any) -> Union[List[Any], range]:
+	if isinstance(values, dict):
+		bounds = values.get("range")
+		if set(values) != {"range"} or not isinstance(bounds, list) or not 1 <= len(bounds) <= 3 \
+				or not all(isinstance(b, int) and not isinstance(b, bool) for b in bounds):
+			raise ValueError(f"'matrix.parameters.{name}' range must be {{range: [start, stop[, step]]}} of integers")
+		values = range(*bounds)
+	elif isinstance(values, list):
+		if not all(isinstance(v, _SCALARS) for v in values):
+			raise ValueError(f"'matrix.parameters.{name}' values must be strings, numbers or booleans")
+	else:
+		raise ValueError(f"'matrix.parameters.{name}' must be a list of values or a range")
+	if len(values) == 0:
+		raise ValueError(f"'matrix.parameters.{name}' has no values")
+	return values
+
+
+class ScenarioMatrix:
+	"""A validated matrix section bound to the scenario templates it expands"""
+	def __init__(self, section: Any, source_files: Dict[str, str], assertions: Dict[str, Any]):
+		if not isinstance(section, dict):
+			raise ValueError("'matrix' must be a dictionary")
+		unknown = set(section) - {"parameters", "include", "exclude", "concurrency"}
+		if unknown:
+			raise ValueError(f"Unknown matrix settings: {', '.join(sorted(unknown))}")
+		parameters = section.get("parameters")
+		if not isinstance(parameters, dict) or not parameters:
+			raise ValueError("'matrix.parameters' must map parameter names to values")
+		for name in parameters:
+			if not isinstance(name, str) or not _PLACEHOLDER.fullmatch("${" + name + "}"):
+				raise ValueError(f"Invalid matrix parameter name: {name!r}")
+		self.names: Tuple[str, ...] = tuple(parameters)
+		self.values = {name: _parse_values(name, values) for name, values in parameters.items()}
+		self.exclude = self._combinations(section.get("exclude", []), "exclude", partial=True)
+		self.include = self._combinations(section.get("include", []), "include", partial=False)
+		self.concurrency = section.get("concurrency", 1)
+		if not isinstance(self.concurrency, int) or isinstance(self.concurrency, bool) or self.concurrency < 1:
+			raise ValueError("'matrix.concurrency' must be a positive integer")
+		self._source_files = _compile(source_files)
+		self._assertions = _compile(assertions)
+		self._assertions_vary = bool(_names(self._assertions))
+		undefined = (_names(self._source_files) | _names(self._assertions)) - set(self.names)
+		if undefined:
+			raise ValueError(f"Undefined matrix parameters: {', '.join(sorted(undefined))}")
+		if next(self.cases(), None) is None:
+			raise ValueError("'matrix' excludes every case")
+
+	def _combinations(self, entries: Any, key: str, partial: bool) -> List[Dict[str, Any]]:
+		if not isinstance(entries, list) or not all(isinstance(e, dict) and e for e in entries):
+			raise ValueError(f"'matrix.{key}' must be a list of parameter mappings")
+		for entry in entries:
+			unknown = set(entry) - set(self.names)
+			if unknown:
+				raise ValueError(f"'matrix.{key}' uses unknown parameters: {', '.join(sorted(unknown))}")
+			if not partial and set(entry) != set(self.names):
+				raise ValueError(f"'matrix.{key}' entries must set every parameter")
+		return entries
+
+	def __len__(self) -> int:
+		return sum(1 for _ in self.cases())
+
+	def _product(self) -> Iterator[Dict[str, Any]]:
+		for combination in itertools.product(*(self.values[name] for name in self.names)):
+			yield dict(zip(self.names, combination))
+
+	def _is_excluded(self, params: Dict[str, Any]) -> bool:
+		return any(all(params[k] == v for k, v in entry.items()) for entry in self.exclude)
+
+	def cases(self) -> Iterator[Dict[str, Any]]:
+		"""Yield each case's parameters (product minus excludes, then includes), lazily."""
+		for params in self._product():
+			if not self._is_excluded(params):
+				yield params
+		for entry in self.include:
+			yield dict(entry)
+
+	def expand(self, test_data: Dict[str, Any], params: Dict[str, Any]) -> Dict[str, Any]:
+		"""Return test data for one case (unchanged sections are shared with test_data)."""
+		case = {key: value for key, value in test_data.items() if key != "matrix"}
+		case["source_files"] = {
+			name: _render(content, params, _json_escaped if name == "config.json" else _plain, typed=False)
+			for name, content in self._source_files.items()
+		}
+		if self._assertions_vary:
+			case["assertions"] = _render(self._assertions, params, _plain, typed=True)
+		case["matrix_case"] = dict(params)
+		return case
+
+	@staticmethod
+	def label(params: Dict[str, Any]) -> str:
+		return ", ".join(f"{name}={value!r}" for name, value in params.items())
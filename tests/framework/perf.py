@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+Performance measurement helpers for the unified testing framework (generic)
+
+Timing-sensitive tests wrap their measured section in ``measured()``, which
+disables the garbage collector and times the block with ``perf_counter``. When
+the runner sets TEST_PERF_RESULTS, each measurement is appended to that JSONL
+file so it can be merged into the performance report.
+
+Scenarios with a YAML ``benchmark:`` section are run repeatedly by
+``UnifiedTestCase.run_benchmark``; ``summarize()`` turns the samples into
+mean/stdev/median/p95 and, when TEST_BENCHMARK_RESULTS is set, the summary is
+appended to that JSONL file (collected into artifacts/test_reports/benchmarks.json).
+
+When TEST_CLI_TIMINGS is set, every CLI run's wall time, CPU time and peak RSS
+are appended to that JSONL file; the runner stores them in the duration history
+(scripts/test_history.py).
+"""
+
+import gc
+import json
+import math
+import os
+import platform
+import statistics
+import sys
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional
+
+PERF_RESULTS_ENV = "TEST_PERF_RESULTS"
+BENCHMARK_RESULTS_ENV = "TEST_BENCHMARK_RESULTS"
+CLI_TIMINGS_ENV = "TEST_CLI_TIMINGS"
+
+
+class Measurement:
+	"""Result of a measured section (seconds)."""
+	def __init__(self, name: str):
+		self.name = name
+		self.elapsed: Optional[float] = None
+
+
+@contextmanager
+def measured(name: str, extra: Optional[Dict] = None) -> Iterator[Measurement]:
+	"""Time a block with GC disabled and record it when TEST_PERF_RESULTS is set."""
+	measurement = Measurement(name)
+	gc_was_enabled = gc.isenabled()
+	gc.collect()
+	gc.disable()
+	start = time.perf_counter()
+	try:
+		yield measurement
+	finally:
+		measurement.elapsed = time.perf_counter() - start
+		if gc_was_enabled:
+			gc.enable()
+	record_measurement(name, measurement.elapsed, extra)
+
+
+def record_measurement(name: str, seconds: float, extra: Optional[Dict] = None) -> None:
+	"""Append a measurement to the TEST_PERF_RESULTS file (no-op when unset)."""
+	results_file = os.environ.get(PERF_RESULTS_ENV)
+	if not results_file:
+		return
+	entry = {"name": name, "seconds": seconds, "pid": os.getpid()}
+	if extra:
+		entry.update(extra)
+	with open(results_file, "a", encoding="utf-8") as f:
+		f.write(json.dumps(entry) + "\n")
+
+
+def summarize(samples: List[float]) -> Dict:
+	"""Mean, sample stdev, median and nearest-rank p95 of timing samples (seconds)."""
+	ordered = sorted(samples)
+	p95_rank = max(1, math.ceil(0.95 * len(ordered)))
+	return {
+		"iterations": len(ordered),
+		"mean": statistics.mean(ordered),
+		"stdev": statistics.stdev(ordered) if len(ordered) > 1 else 0.0,
+		"median": statistics.median(ordered),
+		"p95": ordered[p95_rank - 1],
+		"min": ordered[0],
+		"max": ordered[-1],
+		"samples": samples,
+	}
+
+
+def record_benchmark(test_id: str, stats: Dict, settings: Dict, passed: bool) -> None:
+	"""Append a benchmark summary to the TEST_BENCHMARK_RESULTS file (no-op when unset)."""
+	results_file = os.environ.get(BENCHMARK_RESULTS_ENV)
+	if not results_file:
+		return
+	entry = {"test_id": test_id, "passed": passed, "settings": settings, "pid": os.getpid()}
+	entry.update(stats)
+	with open(results_file, "a", encoding="utf-8") as f:
+		f.write(json.dumps(entry) + "\n")
+
+
+def record_cli_run(nodeid: str, test_id: str, cli_result) -> None:
+	"""Append one CLI run's timings to the TEST_CLI_TIMINGS file (no-op when unset)."""
+	results_file = os.environ.get(CLI_TIMINGS_ENV)
+	if not results_file:
+		return
+	entry = {
+		"nodeid": nodeid,
+		"test_id": test_id,
+		"execution_time": cli_result.execution_time,
+		"cpu_time": cli_result.cpu_time,
+		"peak_rss_mb": cli_result.peak_rss_mb,
+	}
+	with open(results_file, "a", encoding="utf-8") as f:
+		f.write(json.dumps(entry) + "\n")
+
+
+def _cpu_model() -> str:
+	try:
+		with open("/proc/cpuinfo", "r", encoding="utf-8") as f:
+			for line in f:
+				if line.startswith("model name"):
+					return line.split(":", 1)[1].strip()
+	except OSError:
+		pass
+	return platform.processor() or platform.machine()
+
+
+def environment_metadata() -> Dict:
+	"""Describe CPU, Python build and system load for performance reports."""
+	metadata = {
+		"cpu_model": _cpu_model(),
+		"cpu_count": os.cpu_count(),
+		"machine": platform.machine(),
+		"platform": platform.platform(),
+		"python_version": sys.version.split()[0],
+		"python_implementation": platform.python_implementation(),
+		"python_build": list(platform.python_build()),
+		"python_compiler": platform.python_compiler(),
+	}
+	if hasattr(os, "sched_getaffinity"):
+		metadata["cpu_affinity"] = sorted(os.sched_getaffinity(0))
+	if hasattr(os, "getloadavg"):
+		metadata["load_average"] = list(os.getloadavg())
+	return metadata
@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+Test result cache for the unified testing framework (generic)
+
+A passing test is recorded under a key made of its node id, the hash of its test
+module, the executor backend/capture mode, and a fingerprint of the application
+(src/python_sample_app, main.py), the framework, the packaging files
+(pyproject.toml, requirements*.txt, ...), the interpreter version, the JSON backend
+the CLI resolves to and the versions of all installed distributions. The
+entry also stores a digest per scenario the test ran (YAML content plus fixture
+archives). When all of those still match, the test is skipped as "cached-pass"
+instead of executing the CLI again.
+
+Entries live in .cache/test_results (TEST_RESULT_CACHE_DIR to move them); set
+TEST_RESULT_CACHE=0 (or run_all_tests.py --no-cache) to force full execution.
+"""
+
+import glob
+import hashlib
+import importlib.util
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+from typing import Dict, Iterable, Optional
+
+from .fixtures import archive_key
+
+RESULT_CACHE_ENV = "TEST_RESULT_CACHE"
+RESULT_CACHE_DIR_ENV = "TEST_RESULT_CACHE_DIR"
+CACHED_PASS = "cached-pass"
+# Bump when the key or entry layout changes
+CACHE_VERSION = 2
+# Project files that pin or install dependencies
+PACKAGING_FILES = ("pyproject.toml", "setup.py", "setup.cfg", "pytest.ini", "requirements*.txt")
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+FRAMEWORK_DIR = os.path.dirname(os.path.abspath(__file__))
+
+_code_fingerprint: Optional[str] = None
+
+
+def enabled() -> bool:
+	return os.environ.get(RESULT_CACHE_ENV, "1") != "0"
+
+
+def file_digest(path: str) -> str:
+	digest = hashlib.sha256()
+	with open(path, "rb") as f:
+		for chunk in iter(lambda: f.read(1 << 20), b""):
+			digest.update(chunk)
+	return digest.hexdigest()
+
+
+def _tree_files(root: str) -> Iterable[str]:
+	for dirpath, dirnames, filenames in os.walk(root):
+		dirnames[:] = sorted(d for d in dirnames if d != "__pycache__")
+		for filename in sorted(filenames):
+			if not filename.endswith((".pyc", ".pyo")):
+				yield os.path.join(dirpath, filename)
+
+
+def _json_backend() -> str:
+	"""Backend the CLI's "auto" mode resolves to here (found without importing it).
+
+	Same preference order as python_sample_app.core.json_codec.BACKENDS.
+	"""
+	for name in ("orjson", "ujson"):
+		if importlib.util.find_spec(name) is not None:
+			return name
+	return "json"
+
+
+def _installed_distributions() -> str:
+	"""Sorted name==version of every installed distribution ('' before Python 3.8)."""
+	try:
+		from importlib import metadata
+	except ImportError:
+		return ""
+	return ",".join(sorted(f"{dist.metadata['Name']}=={dist.version}" for dist in metadata.distributions()))
+
+
+def code_fingerprint() -> str:
+	"""Hash of the application, framework, packaging and environment (computed once per process)."""
+	global _code_fingerprint
+	if _code_fingerprint is None:
+		digest = hashlib.sha256()
+		digest.update(f"{CACHE_VERSION}|{platform.python_implementation()}|{sys.version}".encode("utf-8"))
+		digest.update(f"|json={_json_backend()}|{_installed_distributions()}\n".encode("utf-8"))
+		paths = list(_tree_files(os.path.join(PROJECT_ROOT, "src", "python_sample_app")))
+		paths += list(_tree_files(FRAMEWORK_DIR))
+		paths += [os.path.join(PROJECT_ROOT, "main.py"), os.path.join(PROJECT_ROOT, "tests", "conftest.py")]
+		for pattern in PACKAGING_FILES:
+			paths += sorted(glob.glob(os.path.join(PROJECT_ROOT, pattern)))
+		for path in paths:
+			if os.path.exists(path):
+				relative = os.path.relpath(path, PROJECT_ROOT).replace(os.sep, "/")
+				digest.update(f"{relative}={file_digest(path)}\n".encode("utf-8"))
+		_code_fingerprint = digest.hexdigest()
+	return _code_fingerprint
+
+
+def scenario_digest(yaml_path: str, archives: Iterable[str] = ()) -> str:
+	"""Digest of a scenario's YAML (inline fixtures included) and its fixture archives."""
+	parts = [file_digest(yaml_path)] + sorted(archive_key(path) for path in archives)
+	return hashlib.sha256("|".join(parts).encode("utf-8")).hexdigest()
+
+
+def test_key(nodeid: str, module_path: str, settings: Dict[str, str]) -> str:
+	"""Key of one test: node id, module content, executor settings and code fingerprint."""
+	payload = json.dumps([nodeid, file_digest(module_path), settings, code_fingerprint()], sort_keys=True)
+	return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class ResultCache:
+	"""Stores passing test entries as JSON files named by key"""
+	def __init__(self, directory: Optional[str] = None):
+		self.directory = directory or os.environ.get(RESULT_CACHE_DIR_ENV) or os.path.join(
+			PROJECT_ROOT, ".cache", "test_results")
+
+	def lookup(self, key: str) -> Optional[Dict]:
+		try:
+			with open(os.path.join(self.directory, f"{key}.json"), "r", encoding="utf-8") as f:
+				return json.load(f)
+		except (OSError, ValueError):
+			return None
+
+	def store(self, key: str, nodeid: str, scenarios: Dict[str, str]) -> None:
+		"""Record a pass (atomic replace, so concurrent workers never read partial entries)."""
+		os.makedirs(self.directory, exist_ok=True)
+		entry = {"nodeid": nodeid, "scenarios": scenarios, "recorded": time.strftime("%Y-%m-%d %H:%M:%S")}
+		fd, tmp_path = tempfile.mkstemp(dir=self.directory, prefix=".entry-")
+		try:
+			with os.fdopen(fd, "w", encoding="utf-8") as f:
+				json.dump(entry, f)
+			os.replace(tmp_path, os.path.join(self.directory, f"{key}.json"))
+		except OSError:
+			if os.path.exists(tmp_path):
+				os.unlink(tmp_path)
+
+
+class CachingResult:
+	"""Forwards to a unittest result, calling on_success before a test's success is reported"""
+	def __init__(self, result, on_success):
+		self._result = result
+		self._on_success = on_success
+
+	def addSuccess(self, test, *args, **kwargs):
+		self._on_success()
+		return self._result.addSuccess(test, *args, **kwargs)
+
+	def __getattr__(self, name):
+		return getattr(self._result, name)
@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""
+Streaming file scanning for the unified testing framework (generic)
+
+Validators search output files for many patterns at once without loading them
+into memory. Files are read in fixed-size chunks; a MultiPatternScanner keeps the
+last (longest pattern - 1) bytes of each chunk so matches that straddle a chunk
+boundary are found, and counts newlines over the raw bytes as it goes.
+
+Each chunk is read from disk once. While few patterns remain they are located
+with one C-level bytes search each over the chunk; with many, all still-missing
+patterns are searched in one pass per chunk with a single compiled alternation
+(the regex engine runs in C, so this beats a per-byte Aho-Corasick automaton
+written in Python). Found patterns are dropped from the remaining set at once,
+but the alternation is only recompiled once half of its patterns have been
+found or found patterns keep matching again, so finding n patterns costs a
+logarithmic number of compilations instead of n.
+"""
+
+import codecs
+import re
+from dataclasses import dataclass, field
+from typing import Iterable, Optional, Set
+
+DEFAULT_CHUNK_SIZE = 1 << 20
+# Up to this many remaining patterns, one bytes search each over the (cache-resident)
+# chunk is faster than a regex alternation
+FIND_THRESHOLD = 8
+# Matches of already-found patterns tolerated before the alternation is recompiled
+STALE_MATCH_LIMIT = 64
+
+
+class MultiPatternScanner:
+	"""Incremental multi-pattern substring search over a byte stream"""
+	def __init__(self, patterns: Iterable[bytes], validate_utf8: bool = False):
+		self.patterns: Set[bytes] = set(patterns)
+		# The empty pattern is contained in everything
+		self.found: Set[bytes] = {p for p in self.patterns if not p}
+		self.newlines = 0
+		self.size = 0
+		self.last_byte: Optional[int] = None
+		self.utf8_error: Optional[UnicodeDecodeError] = None
+		self._decoder = codecs.getincrementaldecoder("utf-8")() if validate_utf8 else None
+		self._overlap = max((len(p) for p in self.patterns), default=1) - 1
+		self._tail = b""
+		self._remaining: Set[bytes] = self.patterns - self.found
+		# Distinct pattern lengths, for finding the patterns that are prefixes of a match
+		self._lengths = sorted({len(p) for p in self._remaining})
+		self._regex: Optional["re.Pattern[bytes]"] = None
+		self._regex_size = 0
+		self._stale_matches = 0
+
+	def _alternation(self) -> Optional["re.Pattern[bytes]"]:
+		"""Compiled alternation, longest patterns first, of (a superset of) the remaining patterns.
+
+		It is recompiled from the remaining patterns only once more than half of its
+		patterns have been found, or after STALE_MATCH_LIMIT matches of found ones.
+		"""
+		if not self._remaining:
+			return None
+		stale = self._regex_size - len(self._remaining)
+		if self._regex is None or stale > len(self._remaining) or self._stale_matches >= STALE_MATCH_LIMIT:
+			ordered = sorted(self._remaining, key=len, reverse=True)
+			self._regex = re.compile(b"|".join(re.escape(p) for p in ordered))
+			self._regex_size = len(ordered)
+			self._stale_matches = 0
+		return self._regex
+
+	def _found_at(self, matched: bytes) -> Set[bytes]:
+		"""Remaining patterns found by a match: the match and its prefixes.
+
+		The alternation tries longer patterns first, so every other pattern that
+		matches at the same position is a prefix of the match.
+		"""
+		found = {matched} if matched in self._remaining else set()
+		for length in self._lengths:
+			if length >= len(matched):
+				break
+			if matched[:length] in self._remaining:
+				found.add(matched[:length])
+		return found
+
+	@property
+	def done(self) -> bool:
+		"""True once every pattern has been found."""
+		return not self._remaining
+
+	def feed(self, chunk: bytes) -> Set[bytes]:
+		"""Scan the next chunk and return the patterns it completed."""
+		if not chunk:
+			return set()
+		self.size += len(chunk)
+		self.newlines += chunk.count(b"\n")
+		self.last_byte = chunk[-1]
+		if self._decoder is not None and self.utf8_error is None:
+			try:
+				self._decoder.decode(chunk)
+			except UnicodeDecodeError as e:
+				self.utf8_error = e
+		newly_found: Set[bytes] = set()
+		if self._remaining:
+			data = self._tail + chunk
+			if len(self._remaining) <= FIND_THRESHOLD:
+				newly_found = {p for p in self._remaining if p in data}
+			else:
+				pos = 0
+				regex = self._alternation()
+				while regex is not None:
+					match = regex.search(data, pos)
+					if match is None:
+						break
+					found = self._found_at(match.group())
+					if found:
+						newly_found |= found
+						self._remaining -= found
+					else:
+						self._stale_matches += 1
+					regex = self._alternation()
+					# Patterns starting at the match are handled; others may overlap it
+					pos = match.start() + 1
+			self.found |= newly_found
+			self._remaining -= newly_found
+			self._tail = data[max(0, len(data) - self._overlap):] if self._overlap else b""
+		return newly_found
+
+	def finish(self) -> None:
+		"""Flag a truncated UTF-8 sequence at the end of the stream."""
+		if self._decoder is not None and self.utf8_error is None:
+			try:
+				self._decoder.decode(b"", final=True)
+			except UnicodeDecodeError as e:
+				self.utf8_error = e
+
+	@property
+	def line_count(self) -> int:
+		"""Number of lines (LF-terminated, plus a trailing unterminated line)."""
+		trailing = 1 if self.size and self.last_byte != ord("\n") else 0
+		return self.newlines + trailing
+
+
+@dataclass
+class ScanResult:
+	"""Outcome of scanning one file"""
+	found: Set[bytes] = field(default_factory=set)
+	line_count: int = 0
+	size: int = 0
+	utf8_error: Optional[UnicodeDecodeError] = None
+
+
+def scan_file(path: str, patterns: Iterable[bytes] = (), validate_utf8: bool = False,
+			count_lines: bool = True, chunk_size: int = DEFAULT_CHUNK_SIZE) -> ScanResult:
+	"""Stream a file once, finding patterns, counting lines and optionally validating UTF-8.
+
+	Stops reading early when every pattern is found and neither lines nor UTF-8
+	validity are needed.
+	"""
+	scanner = MultiPatternScanner(patterns, validate_utf8=validate_utf8)
+	needs_full_pass = count_lines or validate_utf8
+	with open(path, "rb") as f:
+		while True:
+			chunk = f.read(chunk_size)
+			if not chunk:
+				break
+			scanner.feed(chunk)
+			if scanner.done and not needs_full_pass:
+				break
+	scanner.finish()
+	return ScanResult(scanner.found, scanner.line_count, scanner.size, scanner.utf8_error)
+
+
+def encode_patterns(patterns: Iterable[str]) -> Set[bytes]:
+	"""UTF-8 encode text patterns; substring matches are identical on UTF-8 bytes."""
+	return {p.encode("utf-8") for p in patterns}
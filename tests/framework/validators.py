@@ -7,8 +7,9 @@ This module provides validator classes for validating CLI results and files.
 
 import os
 import re
-from typing import Dict, List
+from typing import Dict, List, Optional
 from .executor import CLIResult
+from .streaming import ScanResult, encode_patterns, scan_file
 
 
 class TestError(Exception):
@@ -21,19 +22,16 @@ class TestError(Exception):
 
 class OutputValidator:
 	"""Validates general output files, directories, and content"""
+	def __init__(self, base_dir: Optional[str] = None):
+		# Base directory for relative paths (None: relative to the cwd)
+		self.base_dir = base_dir
+
 	def _normalize_path(self, path: str) -> str:
-		"""Normalize a possibly relative path to an absolute path based on current test context."""
+		"""Normalize a possibly relative path against base_dir."""
 		if os.path.isabs(path):
 			return path
-		try:
-			import inspect
-			for frame_info in inspect.stack():
-				self_obj = frame_info.frame.f_locals.get('self')
-				if hasattr(self_obj, 'current_validation_base_dir'):
-					base_dir = getattr(self_obj, 'current_validation_base_dir')
-					return os.path.normpath(os.path.join(base_dir, path))
-		except Exception:
-			pass
+		if self.base_dir:
+			return os.path.normpath(os.path.join(self.base_dir, path))
 		return os.path.normpath(path)
 
 	def assert_output_dir_exists(self, output_path: str) -> None:
@@ -69,41 +67,31 @@ class OutputValidator:
 		if not files:
 			raise AssertionError(f"Directory is empty: {resolved}")
 
-	def assert_file_contains(self, file_path: str, expected_text: str) -> None:
-		resolved = self._normalize_path(file_path)
+	def _scan(self, resolved: str, patterns: List[str], count_lines: bool = False) -> ScanResult:
 		if not os.path.exists(resolved):
 			raise AssertionError(f"File does not exist: {resolved}")
-		with open(resolved, 'r', encoding='utf-8') as f:
-			content = f.read()
-		if expected_text not in content:
+		return scan_file(resolved, encode_patterns(patterns), count_lines=count_lines)
+
+	def assert_file_contains(self, file_path: str, expected_text: str) -> None:
+		resolved = self._normalize_path(file_path)
+		if expected_text.encode('utf-8') not in self._scan(resolved, [expected_text]).found:
 			raise AssertionError(f"File '{resolved}' missing expected text: '{expected_text}'")
 
 	def assert_file_not_contains(self, file_path: str, forbidden_text: str) -> None:
 		resolved = self._normalize_path(file_path)
-		if not os.path.exists(resolved):
-			raise AssertionError(f"File does not exist: {resolved}")
-		with open(resolved, 'r', encoding='utf-8') as f:
-			content = f.read()
-		if forbidden_text in content:
+		if forbidden_text.encode('utf-8') in self._scan(resolved, [forbidden_text]).found:
 			raise AssertionError(f"File '{resolved}' contains forbidden text: '{forbidden_text}'")
 
 	def assert_file_contains_lines(self, file_path: str, expected_lines: List[str]) -> None:
 		resolved = self._normalize_path(file_path)
-		if not os.path.exists(resolved):
-			raise AssertionError(f"File does not exist: {resolved}")
-		with open(resolved, 'r', encoding='utf-8') as f:
-			content = f.read()
+		found = self._scan(resolved, expected_lines).found
 		for line in expected_lines:
-			if line not in content:
+			if line.encode('utf-8') not in found:
 				raise AssertionError(f"File '{resolved}' missing expected line: '{line}'")
 
 	def assert_file_line_count(self, file_path: str, expected_count: int) -> None:
 		resolved = self._normalize_path(file_path)
-		if not os.path.exists(resolved):
-			raise AssertionError(f"File does not exist: {resolved}")
-		with open(resolved, 'r', encoding='utf-8') as f:
-			lines = f.readlines()
-		actual_count = len(lines)
+		actual_count = self._scan(resolved, [], count_lines=True).line_count
 		if actual_count != expected_count:
 			raise AssertionError(f"File '{resolved}' expected {expected_count} lines, got {actual_count}")
 
@@ -154,11 +142,9 @@ class FileValidator:
 	def assert_file_valid_utf8(self, file_path: str) -> None:
 		if not os.path.exists(file_path):
 			raise AssertionError(f"File does not exist: {file_path}")
-		try:
-			with open(file_path, 'r', encoding='utf-8') as f:
-				f.read()
-		except UnicodeDecodeError as e:
-			raise AssertionError(f"File '{file_path}' is not valid UTF-8: {e}")
+		error = scan_file(file_path, validate_utf8=True, count_lines=False).utf8_error
+		if error is not None:
+			raise AssertionError(f"File '{file_path}' is not valid UTF-8: {error}")
 
 	def assert_execution_time_under(self, actual_time: float, max_time: float) -> None:
 		if actual_time > max_time:
@@ -167,18 +153,31 @@ class FileValidator:
 
 class CLIValidator:
 	"""Validates CLI execution results and behavior"""
+	def _stream_contains(self, result: CLIResult, stream: str, text: str) -> bool:
+		"""Check a stream for text, using watched matches or the spill file when captured that way."""
+		if text in result.stream_matches.get(stream, ()):
+			return True
+		spill_file = getattr(result, f"{stream}_file")
+		if spill_file and os.path.exists(spill_file):
+			encoded = text.encode('utf-8')
+			return encoded in scan_file(spill_file, [encoded], count_lines=False).found
+		return text in getattr(result, stream)
+
 	def assert_cli_success(self, result: CLIResult, message: str = None) -> None:
 		if result.exit_code != 0:
 			error_msg = message or f"CLI execution failed with exit code {result.exit_code}"
+			if result.terminated_early:
+				error_msg += f" (terminated early: {result.terminated_early})"
 			if result.stderr:
 				error_msg += f"\nStderr: {result.stderr}"
-			raise TestError(error_msg, context={"exit_code": result.exit_code, "stderr": result.stderr})
+			raise TestError(error_msg, context={"exit_code": result.exit_code, "stderr": result.stderr,
+											  "terminated_early": result.terminated_early})
 
 	def assert_cli_failure(self, result: CLIResult, expected_error: str = None, message: str = None) -> None:
 		if result.exit_code == 0:
 			error_msg = message or "CLI execution succeeded when failure was expected"
 			raise TestError(error_msg, context={"exit_code": result.exit_code, "stdout": result.stdout})
-		if expected_error and expected_error not in result.stderr:
+		if expected_error and not self._stream_contains(result, "stderr", expected_error):
 			error_msg = f"Expected error '{expected_error}' not found in stderr: {result.stderr}"
 			raise TestError(error_msg, context={"exit_code": result.exit_code, "stderr": result.stderr})
 
@@ -188,16 +187,52 @@ class CLIValidator:
 					  context={"exit_code": result.exit_code, "expected_exit_code": expected_exit_code})
 
 	def assert_cli_stdout_contains(self, result: CLIResult, expected_text: str) -> None:
-		if expected_text not in result.stdout:
+		if not self._stream_contains(result, "stdout", expected_text):
 			raise TestError(f"Expected text '{expected_text}' not found in stdout: {result.stdout}",
 					  context={"stdout": result.stdout, "expected_text": expected_text})
 
 	def assert_cli_stderr_contains(self, result: CLIResult, expected_text: str) -> None:
-		if expected_text not in result.stderr:
+		if not self._stream_contains(result, "stderr", expected_text):
 			raise TestError(f"Expected text '{expected_text}' not found in stderr: {result.stderr}",
 					  context={"stderr": result.stderr, "expected_text": expected_text})
 
+	def assert_cli_stdout_not_contains(self, result: CLIResult, forbidden_text: str) -> None:
+		if self._stream_contains(result, "stdout", forbidden_text):
+			raise TestError(f"Forbidden text '{forbidden_text}' found in stdout: {result.stdout}",
+					  context={"stdout": result.stdout, "forbidden_text": forbidden_text})
+
+	def assert_cli_stderr_not_contains(self, result: CLIResult, forbidden_text: str) -> None:
+		if self._stream_contains(result, "stderr", forbidden_text):
+			raise TestError(f"Forbidden text '{forbidden_text}' found in stderr: {result.stderr}",
+					  context={"stderr": result.stderr, "forbidden_text": forbidden_text})
+
 	def assert_cli_execution_time_under(self, result: CLIResult, max_time: float) -> None:
 		if result.execution_time > max_time:
 			raise TestError(f"Execution time {result.execution_time:.2f}s exceeds maximum {max_time:.2f}s",
-					  context={"execution_time": result.execution_time, "max_time": max_time})
\ No newline at end of file
+					  context={"execution_time": result.execution_time, "max_time": max_time})
+
+	def _require_metric(self, result: CLIResult, name: str, value):
+		if value is None:
+			raise TestError(f"{name} was not recorded for this run (unsupported by platform or backend)",
+					  context={"metric": name})
+		return value
+
+	def assert_cli_cpu_time_under(self, result: CLIResult, max_time: float) -> None:
+		cpu_time = self._require_metric(result, "cpu_time", result.cpu_time)
+		if cpu_time > max_time:
+			raise TestError(f"CPU time {cpu_time:.2f}s (user {result.cpu_user_time:.2f}s, "
+					  f"sys {result.cpu_system_time:.2f}s) exceeds maximum {max_time:.2f}s",
+					  context={"cpu_time": cpu_time, "max_time": max_time})
+
+	def assert_cli_peak_rss_under(self, result: CLIResult, max_mb: float) -> None:
+		peak_rss_mb = self._require_metric(result, "peak_rss_mb", result.peak_rss_mb)
+		if peak_rss_mb > max_mb:
+			raise TestError(f"Peak RSS {peak_rss_mb:.1f} MB exceeds maximum {max_mb:.1f} MB",
+					  context={"peak_rss_mb": peak_rss_mb, "max_mb": max_mb})
+
+	def assert_cli_io_blocks_under(self, result: CLIResult, max_blocks: int) -> None:
+		io_blocks = self._require_metric(result, "io_blocks", result.io_blocks)
+		if io_blocks > max_blocks:
+			raise TestError(f"Block I/O {io_blocks} (in {result.io_blocks_in}, out {result.io_blocks_out}) "
+					  f"exceeds maximum {max_blocks}",
+					  context={"io_blocks": io_blocks, "max_blocks": max_blocks})
@@ -5,9 +5,10 @@ Validators Processor for the unified testing framework (generic)
 Coordinates CLI and file validations based on YAML assertions.
 """
 
-from typing import Dict, Any
+from typing import Dict, Any, Optional, Tuple
 from .executor import CLIResult
 from .validators import CLIValidator, OutputValidator, FileValidator
+from .assertion_plan import AssertionPlan, ValidationContext
 
 
 class ValidatorsProcessor:
@@ -16,49 +17,35 @@ class ValidatorsProcessor:
 		self.cli_validator = CLIValidator()
 		self.output_validator = OutputValidator()
 		self.file_validator = FileValidator()
+		# id(assertions) -> (assertions, plan); keeps the dict alive so ids stay unique
+		self._plans: Dict[int, Tuple[Dict[str, Any], AssertionPlan]] = {}
+
+	def compile(self, assertions: Dict[str, Any]) -> AssertionPlan:
+		"""Return the compiled plan for an assertions section (cached per dict)."""
+		cached = self._plans.get(id(assertions))
+		if cached is not None and cached[0] is assertions:
+			return cached[1]
+		plan = AssertionPlan.compile(assertions, self.cli_validator)
+		self._plans[id(assertions)] = (assertions, plan)
+		return plan
+
+	def discard(self, assertions: Optional[Dict[str, Any]]) -> None:
+		"""Drop the cached plan of a one-off assertions dict (e.g. a matrix case)."""
+		if assertions is not None:
+			self._plans.pop(id(assertions), None)
 
 	def process_assertions(self, assertions: Dict[str, Any], _model_data: Dict,
-						_puml_files: Dict[str, str], cli_result: CLIResult, _test_case) -> None:
-		# Execution assertions
-		if "execution" in assertions:
-			exec_a = assertions["execution"]
-			if "exit_code" in exec_a:
-				expected = exec_a["exit_code"]
-				if expected == 0:
-					self.cli_validator.assert_cli_success(cli_result)
-				else:
-					self.cli_validator.assert_cli_exit_code(cli_result, expected)
-			if "stdout_contains" in exec_a:
-				self.cli_validator.assert_cli_stdout_contains(cli_result, exec_a["stdout_contains"])
-			if "stderr_contains" in exec_a:
-				self.cli_validator.assert_cli_stderr_contains(cli_result, exec_a["stderr_contains"])
-			if "max_execution_time" in exec_a:
-				self.cli_validator.assert_cli_execution_time_under(cli_result, exec_a["max_execution_time"])
-			if exec_a.get("success_expected") is False:
-				self.cli_validator.assert_cli_failure(cli_result, exec_a.get("expected_error"))
+						_puml_files: Dict[str, str], cli_result: CLIResult, _test_case,
+						context: Optional[ValidationContext] = None) -> None:
+		"""Run all execution and file assertions, reporting every failure together.
 
-		# File assertions
-		if "files" in assertions:
-			files_a = assertions["files"]
-			if "output_dir_exists" in files_a:
-				self.output_validator.assert_output_dir_exists(files_a["output_dir_exists"])
-			for path in files_a.get("files_exist", []):
-				self.output_validator.assert_file_exists(path)
-			for path in files_a.get("files_not_exist", []):
-				self.output_validator.assert_file_not_exists(path)
-			for path in files_a.get("utf8_files", []):
-				self.file_validator.assert_file_valid_utf8(path)
-			# File content checks
-			for file_path, content_assertions in files_a.get("file_content", {}).items():
-				for expected in content_assertions.get("contains", []):
-					self.output_validator.assert_file_contains(file_path, expected)
-				for forbidden in content_assertions.get("not_contains", []):
-					self.output_validator.assert_file_not_contains(file_path, forbidden)
-				if "contains_lines" in content_assertions:
-					self.output_validator.assert_file_contains_lines(file_path, content_assertions["contains_lines"])
-				if "line_count" in content_assertions:
-					self.output_validator.assert_file_line_count(file_path, content_assertions["line_count"])
-				if content_assertions.get("empty"):
-					self.output_validator.assert_file_empty(file_path)
-				if content_assertions.get("not_empty"):
-					self.output_validator.assert_file_not_empty(file_path)
\ No newline at end of file
+		Relative paths resolve against context.base_dir; without an explicit context
+		the test case's current_validation_base_dir is used when set.
+		"""
+		if context is None:
+			context = ValidationContext(
+				base_dir=getattr(_test_case, "current_validation_base_dir", None),
+				output_dir=getattr(_test_case, "current_validation_output_dir", None),
+				cli_result=cli_result,
+			)
+		self.compile(assertions).run(context)
@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+Warm interpreter pool for the unified testing framework (generic)
+
+The ``pool`` executor backend starts the application's prefork render server
+(``main.py server``) once per test process: its workers have already imported
+python_sample_app, and every run is served by forking a fresh child from a warm
+worker, so runs stay isolated from each other without paying interpreter
+start-up and imports. stdout/stderr reach the test through pipes passed to the
+server; the exit code and the child's rusage come back in the response.
+
+The pool is shared by all executors of the process and stopped at exit. Where
+it cannot start (no fork/AF_UNIX, server failed to come up) ``shared_pool()``
+returns None and the executor falls back to plain subprocess runs.
+"""
+
+import atexit
+import importlib
+import os
+import shutil
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from types import SimpleNamespace
+from typing import Dict, List, Optional, Tuple
+
+POOL_WORKERS_ENV = "TEST_POOL_WORKERS"
+# Seconds to wait for the server socket to accept connections
+STARTUP_TIMEOUT = 15.0
+
+_POOL_LOCK = threading.Lock()
+# None: not started yet; False: start failed (do not retry)
+_shared = None
+
+
+def _read_all(fd: int, output: Dict[int, bytes]) -> None:
+	with os.fdopen(fd, "rb") as pipe:
+		output[fd] = pipe.read()
+
+
+class WarmPool:
+	"""A running render server plus the client calls to run the CLI through it."""
+	def __init__(self, main_command: List[str], src_dir: str, workers: int):
+		self.main_command = main_command
+		self.workers = workers
+		if src_dir not in sys.path:
+			sys.path.insert(0, src_dir)
+		# Self-contained module (no package imports), safe to load in the test process
+		self.client = importlib.import_module("python_sample_app.client")
+		self.directory = tempfile.mkdtemp(prefix="python_sample_app-pool-")
+		self.socket_path = os.path.join(self.directory, "server.sock")
+		self.process: Optional[subprocess.Popen] = None
+
+	def start(self) -> bool:
+		"""Start the server and wait until it accepts connections."""
+		command = self.main_command + ["server", "--socket", self.socket_path, "--workers", str(self.workers)]
+		try:
+			self.process = subprocess.Popen(command, stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL,
+											stderr=subprocess.DEVNULL)
+		except OSError:
+			return False
+		deadline = time.perf_counter() + STARTUP_TIMEOUT
+		while time.perf_counter() < deadline and self.process.poll() is None:
+			if os.path.exists(self.socket_path):
+				with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+					try:
+						probe.connect(self.socket_path)
+						return True
+					except OSError:
+						pass
+			time.sleep(0.01)
+		self.close()
+		return False
+
+	def run(self, args: List[str], working_dir: str, env: Dict[str, str],
+			timeout: Optional[float] = None) -> Tuple[Optional[int], str, str, Optional[SimpleNamespace]]:
+		"""Run the CLI once; return (exit_code, stdout, stderr, rusage).
+
+		exit_code is None when the run timed out (it is stopped on the server).
+		Raises client.ServerUnavailable when no server is listening and other OSErrors
+		(e.g. client.RunNotStarted for a missing working_dir) when the run fails.
+		"""
+		out_r, out_w = os.pipe()
+		err_r, err_w = os.pipe()
+		stdin = os.open(os.devnull, os.O_RDONLY)
+		output: Dict[int, bytes] = {}
+		readers = [threading.Thread(target=_read_all, args=(fd, output), daemon=True) for fd in (out_r, err_r)]
+		for reader in readers:
+			reader.start()
+		response = None
+		try:
+			response = self.client.request(args, self.socket_path, working_dir, env,
+										[stdin, out_w, err_w], timeout)
+		except socket.timeout:
+			pass
+		finally:
+			# The run's child holds its own copies; EOF follows once it exits
+			for fd in (stdin, out_w, err_w):
+				os.close(fd)
+			for reader in readers:
+				reader.join()
+		stdout = output.get(out_r, b"").decode("utf-8", errors="replace")
+		stderr = output.get(err_r, b"").decode("utf-8", errors="replace")
+		if response is None:
+			return None, stdout, stderr, None
+		usage = response.get("rusage")
+		return int(response["exit_code"]), stdout, stderr, SimpleNamespace(**usage) if usage else None
+
+	def close(self) -> None:
+		"""Stop the server (it stops its workers and removes the socket)."""
+		if self.process is not None and self.process.poll() is None:
+			self.process.terminate()
+			try:
+				self.process.wait(10)
+			except subprocess.TimeoutExpired:
+				self.process.kill()
+				self.process.wait()
+		shutil.rmtree(self.directory, ignore_errors=True)
+
+
+def shared_pool(main_command: List[str], src_dir: str) -> Optional[WarmPool]:
+	"""The process-wide pool, started on first use; None where it is unavailable."""
+	global _shared
+	with _POOL_LOCK:
+		if _shared is None:
+			_shared = False
+			if hasattr(os, "fork") and hasattr(socket, "AF_UNIX"):
+				workers = int(os.environ.get(POOL_WORKERS_ENV) or os.cpu_count() or 1)
+				pool = WarmPool(main_command, src_dir, workers)
+				if pool.start():
+					atexit.register(pool.close)
+					_shared = pool
+		return _shared or None
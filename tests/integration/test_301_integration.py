@@ -9,6 +9,7 @@ import unittest
 
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
 from tests.framework import UnifiedTestCase
+from tests.framework import executor
 
 
 class TestComprehensiveIntegrationCLI(UnifiedTestCase):
@@ -17,6 +18,20 @@ class TestComprehensiveIntegrationCLI(UnifiedTestCase):
         self.validate_execution_success(result)
         self.validate_test_output(result)
 
+    def test_many_configs_concurrently(self):
+        cases = self.run_matrix("301_integration_concurrent")
+        self.assertEqual(cases, 12)
+
+    def test_missing_working_dir_same_on_every_backend(self):
+        missing_dir = os.path.join(self.workspace_dir, "missing")
+        for backend in executor.BACKENDS:
+            with self.subTest(backend=backend):
+                results = executor.TestExecutor(backend=backend).run_many([missing_dir], timeout=60)
+                self.assertEqual(len(results), 1)
+                self.assertEqual(results[0].exit_code, -1)
+                self.assertEqual(results[0].stdout, "")
+                self.assertEqual(results[0].stderr, f"Command failed: [Errno 2] No such file or directory: '{missing_dir}'")
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,233 @@
+#!/usr/bin/env python3
+"""
+Integration tests for the prefork render server and its thin client
+"""
+
+import os
+import shutil
+import signal
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+from tests.framework import UnifiedTestCase
+from tests.framework.warm_pool import WarmPool
+from python_sample_app import client, server
+
+CLIENT_SCRIPT = os.path.join(os.path.dirname(__file__), '..', '..', 'src', 'python_sample_app', 'client.py')
+SRC_DIR = os.path.abspath(os.path.join(os.path.dirname(CLIENT_SCRIPT), '..'))
+MAIN_SCRIPT = os.path.join(SRC_DIR, '..', 'main.py')
+# A server whose workers fail straight away, as if accept() kept failing
+CRASHING_SERVER = (
+	"import logging, sys\n"
+	"from python_sample_app import server\n"
+	"def crash(listener):\n"
+	"    raise OSError('accept failed')\n"
+	"server._worker_loop = crash\n"
+	"logging.basicConfig(level=logging.INFO, stream=sys.stdout, format='%(message)s')\n"
+	"sys.exit(server.serve(sys.argv[1], 2))\n"
+)
+
+
+def _proc_stat(pid):
+	"""(state, parent pid) of a process from /proc, or None once it is gone."""
+	try:
+		with open(f"/proc/{pid}/stat", "r", encoding="ascii", errors="replace") as f:
+			fields = f.read().rsplit(")", 1)[1].split()
+	except OSError:
+		return None
+	return fields[0], int(fields[1])
+
+
+def _alive(pid: int) -> bool:
+	stat = _proc_stat(pid)
+	return stat is not None and stat[0] != "Z"
+
+
+def _children(pid: int):
+	"""Pids of the live (non-zombie) children of `pid`, from /proc."""
+	children = []
+	for entry in os.listdir("/proc"):
+		if entry.isdigit():
+			stat = _proc_stat(entry)
+			if stat is not None and stat[1] == pid and stat[0] != "Z":
+				children.append(int(entry))
+	return children
+
+
+def _wait_for(condition, timeout: float = 10.0):
+	deadline = time.monotonic() + timeout
+	while time.monotonic() < deadline:
+		value = condition()
+		if value:
+			return value
+		time.sleep(0.02)
+	return condition()
+
+
+@unittest.skipUnless(hasattr(os, "fork") and hasattr(socket, "AF_UNIX"), "render server requires fork and AF_UNIX")
+class TestRenderServer(UnifiedTestCase):
+	"""Test runs forwarded by client.py: served runs, fallback and failure handling"""
+
+	executor_backend = "subprocess"
+
+	@classmethod
+	def setUpClass(cls):
+		super().setUpClass()
+		cls.server = WarmPool([sys.executable, MAIN_SCRIPT], SRC_DIR, 1)
+		if not cls.server.start():
+			cls.server.close()
+			raise unittest.SkipTest("render server did not start")
+
+	@classmethod
+	def tearDownClass(cls):
+		cls.server.close()
+		super().tearDownClass()
+
+	def setUp(self):
+		super().setUp()
+		# Every scenario runs the client script instead of main.py
+		self.executor.main_script_command = [sys.executable, os.path.abspath(CLIENT_SCRIPT)]
+		self.use_socket(self.server.socket_path, fallback=False)
+
+	def use_socket(self, socket_path: str, fallback: bool) -> None:
+		environ = {client.SOCKET_ENV: socket_path}
+		patcher = mock.patch.dict(os.environ, environ)
+		patcher.start()
+		self.addCleanup(patcher.stop)
+		if fallback:
+			os.environ.pop(client.NO_FALLBACK_ENV, None)
+		else:
+			os.environ[client.NO_FALLBACK_ENV] = "1"
+
+	def socket_path(self, name: str) -> str:
+		"""Path for a socket in a short temp dir (AF_UNIX paths are limited to ~100 bytes)."""
+		directory = tempfile.mkdtemp(prefix="psa-")
+		self.addCleanup(shutil.rmtree, directory, True)
+		return os.path.join(directory, name)
+
+	def test_run_through_server(self):
+		result = self.run_test("302_render_server")
+		self.validate_execution_success(result)
+		self.validate_test_output(result)
+
+	def test_invalid_config_through_server(self):
+		result = self.run_test("302_render_server_invalid")
+		self.validate_test_output(result)
+
+	def test_fallback_without_server(self):
+		self.use_socket(self.socket_path("missing.sock"), fallback=True)
+		result = self.run_test("302_render_server")
+		self.validate_execution_success(result)
+		self.validate_test_output(result)
+
+	def test_no_fallback_reports_unavailable_server(self):
+		self.use_socket(self.socket_path("missing.sock"), fallback=False)
+		result = self.run_test("302_render_server")
+		self.assertEqual(result.cli_result.exit_code, 1)
+		self.assertIn("python_sample_app server unavailable", result.cli_result.stderr)
+		self.assertFalse(os.path.exists(os.path.join(result.test_dir, "output", "output.txt")))
+
+	def test_connection_lost_after_request_is_not_rerun(self):
+		# A server that accepts the request and drops the connection without running it
+		socket_path = self.socket_path("drop.sock")
+		listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+		self.addCleanup(listener.close)
+		listener.bind(socket_path)
+		listener.listen(1)
+		requests = []
+
+		def drop_after_request():
+			conn, _ = listener.accept()
+			with conn:
+				message, fds = client.recv_message(conn)
+				for fd in fds:
+					os.close(fd)
+				requests.append(message)
+
+		thread = threading.Thread(target=drop_after_request, daemon=True)
+		thread.start()
+		self.use_socket(socket_path, fallback=True)
+		result = self.run_test("302_render_server")
+		thread.join(10)
+
+		self.assertEqual(len(requests), 1)
+		self.assertEqual(result.cli_result.exit_code, 1)
+		self.assertIn("python_sample_app server request failed", result.cli_result.stderr)
+		# Not rerun locally: the fallback would have written the output
+		self.assertNotIn("Wrote output to", result.cli_result.stdout)
+		self.assertFalse(os.path.exists(os.path.join(result.test_dir, "output", "output.txt")))
+
+	def test_forwarded_server_command_is_refused(self):
+		nested_socket = self.socket_path("nested.sock")
+		proc = subprocess.run(
+			self.executor.main_script_command + ["server", "--socket", nested_socket, "--workers", "1"],
+			cwd=self.workspace_dir, stdin=subprocess.DEVNULL, capture_output=True, text=True, timeout=30
+		)
+		self.assertEqual(proc.returncode, 2, proc.stdout + proc.stderr)
+		self.assertIn("'server' cannot be forwarded to a running server", proc.stdout)
+		self.assertFalse(os.path.exists(nested_socket))
+		# The server keeps serving
+		self.assertIsNone(self.server.process.poll())
+		result = self.run_test("302_render_server")
+		self.validate_execution_success(result)
+
+	@unittest.skipUnless(os.path.isdir("/proc/self"), "finding worker processes requires /proc")
+	def test_worker_sigterm_stops_its_run(self):
+		pool = WarmPool([sys.executable, MAIN_SCRIPT], SRC_DIR, 1)
+		self.addCleanup(pool.close)
+		self.assertTrue(pool.start())
+		# A config folder holding a FIFO: the run blocks reading it until a writer opens it
+		config_dir = os.path.join(self.workspace_dir, "configs")
+		os.makedirs(config_dir)
+		os.mkfifo(os.path.join(config_dir, "config.json"))
+		env = dict(os.environ, **{client.SOCKET_ENV: pool.socket_path, client.NO_FALLBACK_ENV: "1"})
+		proc = subprocess.Popen(self.executor.main_script_command + ["--config", config_dir], cwd=self.workspace_dir,
+								env=env, stdin=subprocess.DEVNULL, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
+		self.addCleanup(proc.kill)
+		workers = _wait_for(lambda: _children(pool.process.pid))
+		self.assertEqual(len(workers), 1)
+		runs = _wait_for(lambda: _children(workers[0]))
+		self.assertEqual(len(runs), 1)
+		run_pid = runs[0]
+
+		os.kill(workers[0], signal.SIGTERM)
+
+		stopped = _wait_for(lambda: not _alive(run_pid))
+		if not stopped:
+			os.kill(run_pid, signal.SIGKILL)
+		self.assertTrue(stopped, "the run child outlived its worker")
+		_, stderr = proc.communicate(timeout=10)
+		self.assertEqual(proc.returncode, 1)
+		self.assertIn("python_sample_app server request failed", stderr)
+		# The worker is respawned and the server keeps serving
+		self.use_socket(pool.socket_path, fallback=False)
+		result = self.run_test("302_render_server")
+		self.validate_execution_success(result)
+
+	def test_crashing_workers_are_respawned_with_backoff(self):
+		socket_path = self.socket_path("crash.sock")
+		env = dict(os.environ, PYTHONPATH=SRC_DIR)
+		start = time.monotonic()
+		proc = subprocess.run([sys.executable, "-c", CRASHING_SERVER, socket_path], env=env,
+							stdin=subprocess.DEVNULL, capture_output=True, text=True, timeout=60)
+		elapsed = time.monotonic() - start
+		self.assertEqual(proc.returncode, 1, proc.stdout + proc.stderr)
+		self.assertEqual(proc.stdout.count("respawning in"), server.MAX_WORKER_CRASHES - 1)
+		self.assertIn(f"Workers keep exiting right after start ({server.MAX_WORKER_CRASHES} in a row); stopping",
+					proc.stdout)
+		delays = sum(min(server.RESPAWN_DELAY * 2 ** i, server.MAX_RESPAWN_DELAY)
+					for i in range(server.MAX_WORKER_CRASHES - 1))
+		self.assertGreaterEqual(elapsed, delays)
+		self.assertFalse(os.path.exists(socket_path))
+
+
+if __name__ == "__main__":
+	unittest.main()
@@ -0,0 +1,6 @@
+"""
+Performance tests for python_sample_app
+
+Timing-sensitive tests; run them alone and sequentially with
+`python scripts/run_all_tests.py --category performance`.
+"""
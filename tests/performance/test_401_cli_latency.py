@@ -0,0 +1,30 @@
+#!/usr/bin/env python3
+"""
+Performance test: end-to-end CLI latency
+"""
+
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+from tests.framework import UnifiedTestCase
+from tests.framework.perf import measured
+
+
+class TestCLILatency(UnifiedTestCase):
+	"""Measure a single CLI run including process start-up"""
+
+	def test_cli_latency(self):
+		with measured("401_cli_latency.run_test", {"test": self.id()}):
+			result = self.run_test("401_cli_latency")
+		self.validate_execution_success(result)
+		self.validate_test_output(result)
+
+	def test_cli_latency_benchmark(self):
+		result = self.run_benchmark("401_cli_latency")
+		self.validate_test_output(result)
+
+
+if __name__ == "__main__":
+	unittest.main()
@@ -9,17 +9,29 @@ import unittest
 
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
 from tests.framework import UnifiedTestCase
+from tests.framework import validators
 
 
 class TestBasicOutputGeneration(UnifiedTestCase):
 	"""Test class for basic output generation"""
 
+	# Unit scenarios run main() in-process; feature/integration tests keep the subprocess backend
+	executor_backend = "inprocess"
+
 	def test_basic_output_generation(self):
 		"""Run the test_101_gen_basic scenario through the CLI interface."""
 		result = self.run_test("101_gen_basic")
 		self.validate_execution_success(result)
 		self.validate_test_output(result)
 
+	def test_inprocess_peak_rss_not_recorded(self):
+		"""The test process's peak RSS says nothing about one in-process run."""
+		result = self.run_test("101_gen_basic")
+		self.validate_execution_success(result)
+		self.assertIsNone(result.cli_result.peak_rss_mb)
+		with self.assertRaisesRegex(validators.TestError, "peak_rss_mb was not recorded"):
+			self.cli_validator.assert_cli_peak_rss_under(result.cli_result, 100000)
+
 
 if __name__ == "__main__":
 	unittest.main()
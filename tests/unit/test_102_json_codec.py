@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the JSON decoding backends and the --json-backend option
+"""
+
+import json
+import os
+import sys
+import types
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+from tests.framework import UnifiedTestCase
+from python_sample_app.core import json_codec
+
+
+class TestJsonCodec(UnifiedTestCase):
+	"""Test backend selection, fallback order and decoding"""
+
+	executor_backend = "inprocess"
+
+	def setUp(self):
+		super().setUp()
+		# Backend selection is module state; restore it after each test
+		saved = (dict(json_codec._decoders), json_codec._active_name, json_codec._active_decoder)
+
+		def restore():
+			json_codec._decoders.clear()
+			json_codec._decoders.update(saved[0])
+			json_codec._active_name, json_codec._active_decoder = saved[1], saved[2]
+		self.addCleanup(restore)
+		json_codec._decoders.clear()
+		json_codec._active_name = json_codec._active_decoder = None
+
+	def _installed(self, *names):
+		"""Patch imports so that only the named third-party backends are importable."""
+		def import_module(name):
+			if name not in names:
+				raise ImportError(name)
+			return types.SimpleNamespace(loads=lambda data, _name=name: {"backend": _name})
+		return mock.patch.object(json_codec.importlib, "import_module", side_effect=import_module)
+
+	def test_decode_scenario(self):
+		result = self.run_test("102_json_codec")
+		self.validate_execution_success(result)
+		self.validate_test_output(result)
+
+	def test_auto_fallback_order(self):
+		for installed, expected in (
+			(("orjson", "ujson"), "orjson"),
+			(("ujson",), "ujson"),
+			((), "json"),
+		):
+			with self.subTest(installed=installed):
+				json_codec._decoders.clear()
+				with self._installed(*installed):
+					self.assertEqual(json_codec.set_backend(json_codec.AUTO), expected)
+					self.assertEqual(json_codec.available_backends(), list(installed) + ["json"])
+
+	def test_auto_imports_only_the_selected_backend(self):
+		with self._installed("orjson", "ujson") as import_module:
+			self.assertEqual(json_codec.set_backend(json_codec.AUTO), "orjson")
+		import_module.assert_called_once_with("orjson")
+		with self._installed("ujson") as import_module:
+			json_codec._decoders.clear()
+			self.assertEqual(json_codec.set_backend(json_codec.AUTO), "ujson")
+		self.assertEqual([call.args[0] for call in import_module.call_args_list], ["orjson", "ujson"])
+
+	def test_explicit_backend_errors(self):
+		with self._installed():
+			with self.assertRaises(ImportError):
+				json_codec.set_backend("orjson")
+		with self.assertRaises(ValueError):
+			json_codec.set_backend("yaml")
+
+	def test_loads_bytes_and_str(self):
+		document = {"test": "Grüße ✓", "nested": {"values": [1, 2.5, None, True]}}
+		text = json.dumps(document, ensure_ascii=False)
+		for backend in json_codec.available_backends():
+			with self.subTest(backend=backend):
+				json_codec.set_backend(backend)
+				self.assertEqual(json_codec.loads(text.encode("utf-8")), document)
+				self.assertEqual(json_codec.loads(text), document)
+
+	def test_json_backend_option(self):
+		config_path = os.path.join(self.workspace_dir, "config.json")
+		with open(config_path, "w", encoding="utf-8") as f:
+			json.dump({"test": "Backend Run", "output_dir": "./output"}, f)
+		missing = [name for name in json_codec.BACKENDS if name not in json_codec.available_backends()]
+		cases = [(name, 0) for name in json_codec.available_backends()] + [(name, 1) for name in missing]
+		for backend, exit_code in cases:
+			with self.subTest(backend=backend):
+				result = self.executor.run_full_pipeline(config_path, args=["--json-backend", backend])
+				self.assertEqual(result.exit_code, exit_code, result.stdout + result.stderr)
+				if exit_code:
+					self.assertIn(f"JSON backend '{backend}' is not installed", result.stdout)
+		result = self.executor.run_full_pipeline(config_path, args=["--json-backend", "yaml"])
+		self.assertEqual(result.exit_code, 2)
+		self.assertIn("invalid choice", result.stderr)
+
+
+if __name__ == "__main__":
+	unittest.main()
@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the group-commit OutputWriter
+"""
+
+import os
+import stat
+import sys
+import threading
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+from tests.framework import UnifiedTestCase
+from python_sample_app.core import output_writer
+from python_sample_app.core.output_writer import OutputWriter
+from python_sample_app.main import write_output
+
+
+class RecordingWriter(OutputWriter):
+	"""Records the size of every committed group; commits wait while `paused` is clear"""
+	def __init__(self, *args, **kwargs):
+		self.groups = []
+		self.committing = threading.Event()
+		self.paused = threading.Event()
+		self.paused.set()
+		super().__init__(*args, **kwargs)
+
+	def _commit(self, group):
+		self.groups.append(len(group))
+		self.committing.set()
+		self.paused.wait(10)
+		super()._commit(group)
+
+
+class TestOutputWriter(UnifiedTestCase):
+	"""Test group formation, failure isolation, backpressure and close()"""
+
+	executor_backend = "inprocess"
+
+	def setUp(self):
+		super().setUp()
+		self.writes_dir = os.path.join(self.workspace_dir, "writes")
+		os.makedirs(self.writes_dir)
+
+	def output_path(self, name: str) -> str:
+		return os.path.join(self.writes_dir, name)
+
+	def test_write_scenario(self):
+		result = self.run_test("103_output_writer")
+		self.validate_execution_success(result)
+		self.validate_test_output(result)
+
+	def test_groups_fill_up_to_group_size(self):
+		# A long interval: groups end only when full or at close()
+		writer = RecordingWriter(group_size=4, group_interval=10.0)
+		futures = [writer.submit(self.output_path(f"out_{i}.txt"), f"value {i}\n") for i in range(10)]
+		writer.close()
+		self.assertEqual(writer.groups, [4, 4, 2])
+		for i, future in enumerate(futures):
+			self.assertEqual(future.result(), self.output_path(f"out_{i}.txt"))
+			with open(future.result(), "r", encoding="utf-8") as f:
+				self.assertEqual(f.read(), f"value {i}\n")
+
+	def test_failed_write_does_not_affect_its_group(self):
+		missing_dir = os.path.join(self.writes_dir, "missing", "out.txt")
+		writer = RecordingWriter(group_size=3, group_interval=10.0)
+		first = writer.submit(self.output_path("first.txt"), "first\n")
+		failed = writer.submit(missing_dir, "lost\n")
+		last = writer.submit(self.output_path("last.txt"), b"last\n")
+		writer.close()
+		self.assertEqual(writer.groups, [3])
+		self.assertIsInstance(failed.exception(), FileNotFoundError)
+		self.assertEqual(first.result(), self.output_path("first.txt"))
+		with open(last.result(), "rb") as f:
+			self.assertEqual(f.read(), b"last\n")
+		# No temp files are left behind
+		self.assertEqual(sorted(os.listdir(self.writes_dir)), ["first.txt", "last.txt"])
+
+	def test_submit_blocks_while_queue_is_full(self):
+		writer = RecordingWriter(max_pending=2, group_size=1)
+		self.addCleanup(writer.close)
+		writer.paused.clear()
+		futures = [writer.submit(self.output_path("out_0.txt"), "0\n")]
+		self.assertTrue(writer.committing.wait(10))
+		# The writer is stuck committing the first write; two more fill the queue
+		futures += [writer.submit(self.output_path(f"out_{i}.txt"), f"{i}\n") for i in (1, 2)]
+		blocked = threading.Thread(
+			target=lambda: futures.append(writer.submit(self.output_path("out_3.txt"), "3\n")), daemon=True
+		)
+		blocked.start()
+		blocked.join(0.2)
+		self.assertTrue(blocked.is_alive())
+		self.assertEqual(len(futures), 3)
+		writer.paused.set()
+		blocked.join(10)
+		self.assertFalse(blocked.is_alive())
+		for future in futures:
+			future.result(10)
+		self.assertEqual(len(futures), 4)
+
+	def test_futures_resolved_after_close(self):
+		writer = OutputWriter(group_interval=10.0)
+		futures = [writer.submit(self.output_path(f"out_{i}.txt"), f"{i}\n") for i in range(5)]
+		writer.close()
+		self.assertTrue(all(future.done() for future in futures))
+		with self.assertRaises(RuntimeError):
+			writer.submit(self.output_path("late.txt"), "late\n")
+		# Closing again is a no-op
+		writer.close()
+		self.assertFalse(os.path.exists(self.output_path("late.txt")))
+
+	def test_submit_does_not_hold_the_lock_while_blocked(self):
+		writer = RecordingWriter(max_pending=1, group_size=1)
+		writer.paused.clear()
+		first = writer.submit(self.output_path("out_0.txt"), "0\n")
+		self.assertTrue(writer.committing.wait(10))
+		queued = writer.submit(self.output_path("out_1.txt"), "1\n")
+		# Two producers block on the full queue at the same time
+		blocked = [threading.Thread(target=writer.submit, args=(self.output_path(f"out_{i}.txt"), f"{i}\n"),
+									daemon=True) for i in (2, 3)]
+		for thread in blocked:
+			thread.start()
+		for thread in blocked:
+			thread.join(0.2)
+			self.assertTrue(thread.is_alive())
+		self.assertTrue(writer._lock.acquire(timeout=1))
+		writer._lock.release()
+		closer = threading.Thread(target=writer.close, daemon=True)
+		closer.start()
+		writer.paused.set()
+		closer.join(10)
+		self.assertFalse(closer.is_alive())
+		for thread in blocked:
+			self.assertFalse(thread.is_alive())
+		first.result(0)
+		queued.result(0)
+		# Writes blocked when close() was called are still committed
+		self.assertEqual(sorted(os.listdir(self.writes_dir)), [f"out_{i}.txt" for i in range(4)])
+
+	def test_unknown_encoding_leaves_nothing_behind(self):
+		fds_before = set(os.listdir("/proc/self/fd")) if os.path.isdir("/proc/self/fd") else None
+		with OutputWriter() as writer:
+			failed = writer.submit(self.output_path("bad.txt"), "text\n", encoding="no-such-codec")
+			ok = writer.submit(self.output_path("good.txt"), "text\n")
+		self.assertIsInstance(failed.exception(), LookupError)
+		ok.result()
+		self.assertEqual(os.listdir(self.writes_dir), ["good.txt"])
+		if fds_before is not None:
+			self.assertEqual(set(os.listdir("/proc/self/fd")) - fds_before, set())
+
+	def test_symlinked_target_is_written_through(self):
+		real = self.output_path("real.txt")
+		link = self.output_path("link.txt")
+		with open(real, "w", encoding="utf-8") as f:
+			f.write("old\n")
+		os.symlink("real.txt", link)
+		with OutputWriter() as writer:
+			self.assertEqual(writer.submit(link, "new\n").result(), link)
+		self.assertTrue(os.path.islink(link))
+		with open(real, "r", encoding="utf-8") as f:
+			self.assertEqual(f.read(), "new\n")
+		self.assertEqual(sorted(os.listdir(self.writes_dir)), ["link.txt", "real.txt"])
+
+	def test_existing_file_keeps_its_mode(self):
+		path = self.output_path("script.sh")
+		with open(path, "w", encoding="utf-8") as f:
+			f.write("old\n")
+		os.chmod(path, 0o751)
+		with OutputWriter() as writer:
+			writer.submit(path, "new\n").result()
+		self.assertEqual(stat.S_IMODE(os.stat(path).st_mode), 0o751)
+
+	def test_output_mode_follows_umask(self):
+		with OutputWriter() as writer:
+			path = writer.submit(self.output_path("mode.txt"), "mode\n").result()
+		self.assertEqual(stat.S_IMODE(os.stat(path).st_mode), output_writer._FILE_MODE)
+		umask = os.umask(0o022)
+		os.umask(umask)
+		self.assertEqual(output_writer._FILE_MODE, 0o666 & ~umask)
+
+	def test_write_output_uses_shared_writer(self):
+		writer = output_writer.shared_writer()
+		self.assertIs(output_writer.shared_writer(), writer)
+		threads = [threading.Thread(target=write_output, args=(self.output_path(f"shared_{i}.txt"), str(i)))
+				   for i in range(8)]
+		for thread in threads:
+			thread.start()
+		for thread in threads:
+			thread.join()
+		for i in range(8):
+			with open(self.output_path(f"shared_{i}.txt"), "r", encoding="utf-8") as f:
+				self.assertEqual(f.read(), f"{i}\n")
+		self.assertIs(output_writer.shared_writer(), writer)
+
+
+if __name__ == "__main__":
+	unittest.main()
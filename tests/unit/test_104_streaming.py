@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the streaming MultiPatternScanner and scan_file
+"""
+
+import os
+import random
+import sys
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+from tests.framework import UnifiedTestCase
+from tests.framework.streaming import FIND_THRESHOLD, STALE_MATCH_LIMIT, MultiPatternScanner, scan_file
+
+
+def _chunks(data, size):
+	return [data[i:i + size] for i in range(0, len(data), size)]
+
+
+def _line_count(data):
+	return data.count(b"\n") + (1 if data and not data.endswith(b"\n") else 0)
+
+
+class TestStreaming(UnifiedTestCase):
+	"""Compare the scanner with a brute-force `in` search over many chunkings"""
+
+	executor_backend = "inprocess"
+
+	def assert_scan(self, data, patterns, chunk_size):
+		scanner = MultiPatternScanner(patterns)
+		for chunk in _chunks(data, chunk_size):
+			scanner.feed(chunk)
+		self.assertEqual(scanner.found, {p for p in patterns if p in data})
+		self.assertEqual(scanner.done, all(p in data for p in patterns))
+		self.assertEqual(scanner.line_count, _line_count(data))
+		self.assertEqual(scanner.size, len(data))
+
+	def test_streaming_scenario(self):
+		result = self.run_test("104_streaming")
+		self.validate_execution_success(result)
+		self.validate_test_output(result)
+
+	def test_random_inputs_match_brute_force(self):
+		rng = random.Random(104)
+		for case in range(600):
+			data = bytes(rng.choice(b"ab\n") for _ in range(rng.randrange(0, 60)))
+			# Few patterns use one bytes search each, more use the alternation
+			count = rng.choice((1, FIND_THRESHOLD, 40))
+			patterns = {bytes(rng.choice(b"ab\n") for _ in range(rng.randrange(1, 7))) for _ in range(count)}
+			longest = max(len(p) for p in patterns)
+			for chunk_size in sorted({1, 2, max(1, longest - 1), max(1, len(data))}):
+				with self.subTest(case=case, chunk_size=chunk_size):
+					self.assert_scan(data, patterns, chunk_size)
+
+	def test_match_across_chunk_boundary(self):
+		patterns = {b"boundary", b"ndar", b"missing"}
+		for chunk_size in (1, 2, len(b"boundary") - 1):
+			with self.subTest(chunk_size=chunk_size):
+				self.assert_scan(b"xx boundary yy", patterns, chunk_size)
+
+	def test_prefixes_and_overlapping_matches(self):
+		# Patterns that are prefixes of, or overlap, a longer match found first
+		patterns = {b"abc", b"ab", b"a", b"bcd", b"cd", b"d"} | {f"absent{i}".encode() for i in range(FIND_THRESHOLD)}
+		for chunk_size in (1, 2, 5, 64):
+			with self.subTest(chunk_size=chunk_size):
+				self.assert_scan(b"zabcdz", patterns, chunk_size)
+
+	def test_found_patterns_matching_again(self):
+		# More stale matches than STALE_MATCH_LIMIT before the last pattern appears
+		patterns = {b"aa", b"a"} | {f"p{i:02d}".encode() for i in range(2 * FIND_THRESHOLD)}
+		data = b"a" * (4 * STALE_MATCH_LIMIT) + b"p07" + b"aa" * STALE_MATCH_LIMIT + b"p13"
+		for chunk_size in (1, 2, 7, len(data)):
+			with self.subTest(chunk_size=chunk_size):
+				self.assert_scan(data, patterns, chunk_size)
+
+	def test_line_count(self):
+		for data in (b"", b"one", b"one\n", b"one\ntwo", b"\n\n", b"a\r\nb\r\n"):
+			with self.subTest(data=data):
+				self.assert_scan(data, set(), 1)
+
+	def test_utf8_validation(self):
+		text = "Grüße ✓\n".encode("utf-8")
+		scanner = MultiPatternScanner([], validate_utf8=True)
+		for chunk in _chunks(text, 1):
+			scanner.feed(chunk)
+		scanner.finish()
+		self.assertIsNone(scanner.utf8_error)
+		scanner = MultiPatternScanner([], validate_utf8=True)
+		scanner.feed(text[:-3])
+		scanner.finish()
+		self.assertIsNotNone(scanner.utf8_error)
+
+	def test_scan_file_chunk_sizes(self):
+		path = os.path.join(self.workspace_dir, "scan.txt")
+		data = b"first line\nsecond line straddles\nthird"
+		with open(path, "wb") as f:
+			f.write(data)
+		patterns = {b"line\nsecond", b"straddles", b"third", b"fourth"}
+		for chunk_size in (1, 2, 10, 4096):
+			with self.subTest(chunk_size=chunk_size):
+				result = scan_file(path, patterns, chunk_size=chunk_size)
+				self.assertEqual(result.found, patterns - {b"fourth"})
+				self.assertEqual(result.line_count, 3)
+				self.assertEqual(result.size, len(data))
+
+
+if __name__ == "__main__":
+	unittest.main()
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the compiled config schema validator
+"""
+
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+from tests.framework import UnifiedTestCase
+from python_sample_app.core.schema import Field, compile_schema
+
+
+class TestConfigSchemaValidator(UnifiedTestCase):
+	"""Test types, nullable keys, choices and batch record indices"""
+
+	executor_backend = "inprocess"
+
+	def codes(self, errors):
+		return [(error.record, error.key, error.code) for error in errors]
+
+	def test_nullable_scenario(self):
+		result = self.run_test("105_config_schema")
+		self.validate_execution_success(result)
+		self.validate_test_output(result)
+
+	def test_validate_many_record_indices(self):
+		validator = compile_schema({"test": Field(str, required=True), "count": Field(int)})
+		configs = [{"test": "ok"}, {"count": 1}, ["not", "an", "object"], {"test": "ok", "count": "1"}, {"test": "ok"}]
+		self.assertEqual(self.codes(validator.validate_many(configs)), [
+			(1, "test", "missing"),
+			(2, None, "not_object"),
+			(3, "count", "type"),
+		])
+		self.assertEqual(sorted(validator.invalid_records(configs)), [1, 2, 3])
+		self.assertEqual(validator.validate_many(iter(configs[:1])), [])
+
+	def test_choices(self):
+		validator = compile_schema({
+			"mode": Field(str, choices=("fast", "safe")),
+			"items": Field(list, choices=([1], [2])),
+		})
+		self.assertEqual(validator.validate({"mode": "fast", "items": [2]}), [])
+		errors = validator.validate({"mode": "slow", "items": [3]})
+		self.assertEqual(self.codes(errors), [(0, "mode", "choice"), (0, "items", "choice")])
+		self.assertEqual(str(errors[0]), "Configuration 'mode' must be one of 'fast', 'safe'. Got: 'slow'")
+		# The type is checked before the choices
+		self.assertEqual(self.codes(validator.validate({"mode": 1})), [(0, "mode", "type")])
+
+	def test_nullable(self):
+		validator = compile_schema({
+			"optional": Field(str, nullable=True),
+			"strict": Field(str),
+			"needed": Field(str, required=True, nullable=True),
+		})
+		self.assertEqual(self.codes(validator.validate({"optional": None, "strict": None, "needed": None})), [
+			(0, "strict", "type"),
+			(0, "needed", "missing"),
+		])
+
+	def test_bool_is_not_a_number(self):
+		validator = compile_schema({"count": Field(int), "ratio": Field(float), "flag": Field(bool)})
+		self.assertEqual(validator.validate({"count": 3, "ratio": 0.5, "flag": False}), [])
+		errors = validator.validate({"count": True, "ratio": False, "flag": 1})
+		self.assertEqual(self.codes(errors), [(0, "count", "type"), (0, "ratio", "type"), (0, "flag", "type")])
+		self.assertEqual(str(errors[0]), "Configuration 'count' must be an integer. Got: <class 'bool'>")
+
+	def test_float_accepts_json_integers(self):
+		validator = compile_schema({"ratio": Field(float, choices=(1.0, 2.5))})
+		self.assertEqual(validator.validate({"ratio": 1}), [])
+		self.assertEqual(validator.validate({"ratio": 2.5}), [])
+		self.assertEqual(self.codes(validator.validate({"ratio": 2})), [(0, "ratio", "choice")])
+		self.assertEqual(str(validator.validate({"ratio": "1"})[0]),
+						"Configuration 'ratio' must be a number. Got: <class 'str'>")
+
+	def test_invalid_schema(self):
+		with self.assertRaises(TypeError):
+			compile_schema({"test": str})
+		with self.assertRaises(TypeError):
+			compile_schema({"test": Field("str")})
+
+
+if __name__ == "__main__":
+	unittest.main()
@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the scenario YAML catalog
+"""
+
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+from tests.framework import UnifiedTestCase
+from tests.framework import catalog as scenario_catalog
+
+
+class TestScenarioCatalog(UnifiedTestCase):
+	"""Test id resolution and duplicate detection"""
+
+	executor_backend = "inprocess"
+
+	def write_yaml(self, relative_path):
+		path = os.path.join(self.workspace_dir, "tests", relative_path)
+		os.makedirs(os.path.dirname(path), exist_ok=True)
+		with open(path, "w", encoding="utf-8") as f:
+			f.write("test:\n  id: x\n")
+		return path
+
+	def test_catalog_scenario(self):
+		result = self.run_test("106_test_catalog")
+		self.validate_execution_success(result)
+		self.validate_test_output(result)
+
+	def test_resolve_ids(self):
+		unit = self.write_yaml("unit/test_501_alpha.yml")
+		feature = self.write_yaml("feature/test_502_beta.yaml")
+		legacy = self.write_yaml("example/test-007.yml")
+		# Generated workspaces are not scanned
+		self.write_yaml("unit/test-501_alpha/test_503_stale.yml")
+		catalog = scenario_catalog.TestCatalog(os.path.join(self.workspace_dir, "tests"))
+		self.assertEqual(catalog.resolve("501_alpha"), unit)
+		self.assertEqual(catalog.resolve("502_beta"), feature)
+		self.assertEqual(catalog.resolve("7"), legacy)
+		self.assertIsNone(catalog.resolve("503_stale"))
+		# New files are found by rescanning
+		late = self.write_yaml("integration/test_504_late.yml")
+		self.assertEqual(catalog.resolve("504_late"), late)
+
+	def test_duplicate_ids_are_rejected(self):
+		first = self.write_yaml("feature/test_501_same.yml")
+		second = self.write_yaml("unit/test_501_same.yml")
+		catalog = scenario_catalog.TestCatalog(os.path.join(self.workspace_dir, "tests"))
+		with self.assertRaises(ValueError) as raised:
+			catalog.resolve("501_same")
+		self.assertIn("Duplicate test id '501_same'", str(raised.exception))
+		self.assertIn(first, str(raised.exception))
+		self.assertIn(second, str(raised.exception))
+
+
+if __name__ == "__main__":
+	unittest.main()
@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the fixture template cache and its eviction
+"""
+
+import io
+import os
+import sys
+import tarfile
+import time
+import unittest
+import zipfile
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+from tests.framework import UnifiedTestCase
+from tests.framework import fixtures
+
+DAY = 86400
+
+
+class TestFixtureCache(UnifiedTestCase):
+	"""Test template reuse, cloning, eviction and archive extraction"""
+
+	executor_backend = "inprocess"
+
+	def setUp(self):
+		super().setUp()
+		self.cache = fixtures.FixtureCache(os.path.join(self.workspace_dir, "cache"))
+		self.builds = []
+
+	def build(self, files):
+		def write(staging):
+			self.builds.append(staging)
+			for name, content in files.items():
+				path = os.path.join(staging, name)
+				os.makedirs(os.path.dirname(path), exist_ok=True)
+				with open(path, "w", encoding="utf-8") as f:
+					f.write(content)
+		return write
+
+	def read(self, path):
+		with open(path, "r", encoding="utf-8") as f:
+			return f.read()
+
+	def age(self, path, seconds):
+		stamp = time.time() - seconds
+		os.utime(path, (stamp, stamp))
+
+	def test_fixture_cache_scenario(self):
+		result = self.run_test("107_fixture_cache")
+		self.validate_execution_success(result)
+		self.validate_test_output(result)
+
+	def test_template_is_built_once_per_key(self):
+		first = self.cache.template("k1", self.build({"a.txt": "one"}))
+		self.age(first, DAY)
+		again = self.cache.template("k1", self.build({"a.txt": "changed"}))
+		other = self.cache.template("k2", self.build({"a.txt": "two"}))
+		self.assertEqual(first, again)
+		self.assertNotEqual(first, other)
+		self.assertEqual(len(self.builds), 2)
+		self.assertEqual(self.read(os.path.join(first, "a.txt")), "one")
+		# Reuse refreshes the last-use time that eviction goes by
+		self.assertLess(time.time() - os.stat(first).st_mtime, 60)
+		# Templates are read-only and no staging directory is left behind
+		self.assertFalse(os.stat(os.path.join(first, "a.txt")).st_mode & 0o222)
+		self.assertEqual(sorted(os.listdir(self.cache.root)), ["k1", "k2"])
+
+	def test_clone_copies_or_links_the_template(self):
+		template = self.cache.template("k", self.build({"a.txt": "one", "sub/b.txt": "two"}))
+		for can_link in (False, True):
+			with self.subTest(can_link=can_link):
+				self.cache._can_link = can_link
+				destination = os.path.join(self.workspace_dir, f"clone-{can_link}")
+				self.cache.clone(template, destination)
+				self.assertEqual(self.read(os.path.join(destination, "a.txt")), "one")
+				self.assertEqual(self.read(os.path.join(destination, "sub", "b.txt")), "two")
+				linked = os.path.samefile(os.path.join(destination, "a.txt"), os.path.join(template, "a.txt"))
+				self.assertEqual(linked, can_link)
+
+	def test_evict_by_age_then_size(self):
+		sizes = {"recent": 4000, "stale": 10, "old": 3000, "older": 2000}
+		for key, size in sizes.items():
+			self.cache.template(key, self.build({"data.bin": "x" * size}))
+		self.age(os.path.join(self.cache.root, "stale"), 10 * DAY)
+		self.age(os.path.join(self.cache.root, "older"), 3 * DAY)
+		self.age(os.path.join(self.cache.root, "old"), 2 * DAY)
+		# "stale" is past max_age; then the least recently used go until the rest fits,
+		# but "recent" is kept although it alone exceeds the limit
+		removed = self.cache.evict(max_bytes=3500, max_age=7 * DAY, min_idle=3600)
+		self.assertEqual(removed, ["stale", "older", "old"])
+		self.assertEqual(os.listdir(self.cache.root), ["recent"])
+
+	def test_evict_keeps_everything_within_limits(self):
+		for key in ("a", "b"):
+			self.cache.template(key, self.build({"data.bin": "x"}))
+			self.age(os.path.join(self.cache.root, key), DAY)
+		self.assertEqual(self.cache.evict(max_bytes=1 << 20, max_age=7 * DAY, min_idle=3600), [])
+		self.assertEqual(sorted(os.listdir(self.cache.root)), ["a", "b"])
+
+	def test_archive_is_extracted_once(self):
+		archive_path = os.path.join(self.workspace_dir, "fixtures.zip")
+		with zipfile.ZipFile(archive_path, "w") as archive:
+			archive.writestr("big/data.txt", "archived")
+		first = self.cache.archive(archive_path)
+		self.assertEqual(self.read(os.path.join(first, "big", "data.txt")), "archived")
+		self.assertEqual(self.cache.archive(archive_path), first)
+		destination = os.path.join(self.workspace_dir, "clone")
+		self.cache.clone(first, destination)
+		self.assertEqual(self.read(os.path.join(destination, "big", "data.txt")), "archived")
+
+	def test_archive_members_escaping_the_target_are_rejected(self):
+		archive_path = os.path.join(self.workspace_dir, "evil.tar")
+		with tarfile.open(archive_path, "w") as archive:
+			member = tarfile.TarInfo("../escaped.txt")
+			member.size = 4
+			archive.addfile(member, io.BytesIO(b"evil"))
+		with self.assertRaisesRegex(ValueError, "escapes the extraction directory"):
+			self.cache.archive(archive_path)
+		self.assertFalse(os.path.exists(os.path.join(self.cache.root, "escaped.txt")))
+		self.assertEqual([name for name in os.listdir(self.cache.root) if not name.startswith(".")], [])
+
+
+if __name__ == "__main__":
+	unittest.main()
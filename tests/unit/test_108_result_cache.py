@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the test result cache
+"""
+
+import os
+import shutil
+import sys
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+from tests.framework import UnifiedTestCase
+from tests.framework import catalog as scenario_catalog
+from tests.framework import data_loader, impact, result_cache
+
+SCENARIO = "108_result_cache"
+
+
+class TestResultCache(UnifiedTestCase):
+	"""Test cached passes, their invalidation and what is never cached"""
+
+	executor_backend = "inprocess"
+
+	def setUp(self):
+		super().setUp()
+		# Scenarios are resolved from a copy, so tests can edit the YAML
+		self.tests_dir = os.path.join(self.workspace_dir, "tests")
+		os.makedirs(os.path.join(self.tests_dir, "unit"))
+		self.yaml_path = os.path.join(self.tests_dir, "unit", f"test_{SCENARIO}.yml")
+		shutil.copyfile(os.path.join(os.path.dirname(__file__), f"test_{SCENARIO}.yml"), self.yaml_path)
+		self.cache_dir = os.path.join(self.workspace_dir, "results")
+		self.runs = []
+		self.fail_next = False
+
+	def make_case(self):
+		"""A scenario test run with its own unittest result, as the runner would."""
+		outer = self
+
+		class Scenario(UnifiedTestCase):
+			executor_backend = "inprocess"
+
+			def setUp(self):
+				super().setUp()
+				self.data_loader = data_loader.TestDataLoader(scenario_catalog.TestCatalog(outer.tests_dir))
+
+			def test_scenario(self):
+				result = self.run_test(SCENARIO)
+				outer.runs.append(result)
+				self.validate_execution_success(result)
+				self.validate_test_output(result)
+				if outer.fail_next:
+					self.fail("failing on purpose")
+
+		return Scenario("test_scenario")
+
+	def run_case(self, enabled="1"):
+		"""Run the scenario test; return its outcome ("passed", "failed" or the skip reason)."""
+		result = unittest.TestResult()
+		environ = {result_cache.RESULT_CACHE_ENV: enabled, result_cache.RESULT_CACHE_DIR_ENV: self.cache_dir}
+		with mock.patch.dict(os.environ, environ):
+			os.environ.pop(impact.IMPACT_RECORD_ENV, None)
+			self.make_case().run(result)
+		if result.skipped:
+			return result.skipped[0][1]
+		return "passed" if result.wasSuccessful() else "failed"
+
+	def test_result_cache_scenario(self):
+		result = self.run_test("108_result_cache")
+		self.validate_execution_success(result)
+		self.validate_test_output(result)
+
+	def test_pass_is_cached(self):
+		self.assertEqual(self.run_case(), "passed")
+		self.assertEqual(len(os.listdir(self.cache_dir)), 1)
+		self.assertEqual(self.run_case(), result_cache.CACHED_PASS)
+		self.assertEqual(self.run_case(), result_cache.CACHED_PASS)
+		# The CLI ran once
+		self.assertEqual(len(self.runs), 1)
+
+	def test_changed_scenario_invalidates_the_pass(self):
+		self.assertEqual(self.run_case(), "passed")
+		with open(self.yaml_path, "a", encoding="utf-8") as f:
+			f.write("        not_contains: [\"Traceback\"]\n")
+		self.assertEqual(self.run_case(), "passed")
+		self.assertEqual(self.run_case(), result_cache.CACHED_PASS)
+		self.assertEqual(len(self.runs), 2)
+
+	def test_changed_code_invalidates_the_pass(self):
+		self.assertEqual(self.run_case(), "passed")
+		with mock.patch.object(result_cache, "_code_fingerprint", "0" * 64):
+			self.assertEqual(self.run_case(), "passed")
+		self.assertEqual(len(self.runs), 2)
+
+	def test_failures_are_not_cached(self):
+		self.fail_next = True
+		self.assertEqual(self.run_case(), "failed")
+		self.assertFalse(os.path.exists(self.cache_dir) and os.listdir(self.cache_dir))
+		self.fail_next = False
+		self.assertEqual(self.run_case(), "passed")
+		self.assertEqual(len(self.runs), 2)
+
+	def test_disabled_cache_always_runs(self):
+		self.assertEqual(self.run_case(), "passed")
+		self.assertEqual(self.run_case(enabled="0"), "passed")
+		self.assertEqual(len(self.runs), 2)
+
+
+if __name__ == "__main__":
+	unittest.main()
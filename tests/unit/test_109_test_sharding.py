@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+Unit tests for duration-balanced sharding and shard report merging
+"""
+
+import os
+import subprocess
+import sys
+import unittest
+import xml.etree.ElementTree as ET
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'scripts'))
+from tests.framework import UnifiedTestCase
+import test_sharding
+
+NODE = "tests/unit/test_x.py::TestX::test_{}"
+
+
+def junit_report(path, cases, **totals):
+	"""Write a pytest-style junit report: cases are (name, time, skipped)."""
+	suites = ET.Element("testsuites")
+	suite = ET.SubElement(suites, "testsuite", {key: str(value) for key, value in totals.items()})
+	for name, time, skipped in cases:
+		case = ET.SubElement(suite, "testcase", classname="tests.unit.test_x.TestX", name=f"test_{name}",
+							time=str(time))
+		if skipped:
+			ET.SubElement(case, "skipped")
+	path.parent.mkdir(parents=True, exist_ok=True)
+	ET.ElementTree(suites).write(path, encoding="utf-8", xml_declaration=True)
+	return path
+
+
+class TestSharding(UnifiedTestCase):
+	"""Test shard planning, duration history and report merging"""
+
+	executor_backend = "inprocess"
+
+	def test_sharding_scenario(self):
+		result = self.run_test("109_test_sharding")
+		self.validate_execution_success(result)
+		self.validate_test_output(result)
+
+	def test_node_ids_match_junit_cases(self):
+		self.assertEqual(test_sharding.nodeid_key(NODE.format("a")),
+						test_sharding.case_key("tests.unit.test_x.TestX", "test_a"))
+		self.assertEqual(test_sharding.nodeid_key("tests/unit/test_x.py"), "tests.unit.test_x")
+
+	def test_partition_longest_first_then_round_robin(self):
+		durations = {"a": 8.0, "b": 5.0, "c": 4.0, "d": 3.0, "e": 1.0}
+		history = {test_sharding.nodeid_key(NODE.format(name)): time for name, time in durations.items()}
+		unknown = [NODE.format(name) for name in ("u1", "u2", "u3")]
+		tests = sorted([NODE.format(name) for name in durations] + unknown, reverse=True)
+
+		shards = test_sharding.partition(tests, history, 2)
+
+		# a -> 1 (8); b -> 2 (5); c -> 2 (9); d -> 1 (11); e -> 2 (10); then u1, u2, u3 round-robin
+		self.assertEqual(shards, [
+			[NODE.format("a"), NODE.format("d"), NODE.format("u1"), NODE.format("u3")],
+			[NODE.format("b"), NODE.format("c"), NODE.format("e"), NODE.format("u2")],
+		])
+		# The plan depends only on the tests and the history, not on their order
+		self.assertEqual(test_sharding.partition(sorted(tests), history, 2), shards)
+
+	def test_every_test_lands_in_exactly_one_shard(self):
+		tests = [NODE.format(i) for i in range(23)]
+		history = {test_sharding.nodeid_key(test): float(i % 5) for i, test in enumerate(tests) if i % 3}
+		for total in (1, 2, 4, 30):
+			with self.subTest(shards=total):
+				shards = test_sharding.partition(tests, history, total)
+				self.assertEqual(len(shards), total)
+				self.assertEqual(sorted(test for shard in shards for test in shard), sorted(tests))
+
+	def test_durations_are_averaged_over_reports(self):
+		reports = Path(self.workspace_dir, "reports")
+		first = junit_report(reports / "junit-1.xml", [("a", 1.0, False), ("b", 2.0, True)])
+		second = junit_report(reports / "junit-2.xml", [("a", 3.0, False)])
+		broken = reports / "junit-3.xml"
+		broken.write_text("<testsuites", encoding="utf-8")
+		durations = test_sharding.load_durations([first, second, broken])
+		# Skipped cases carry no duration
+		self.assertEqual(durations, {"tests.unit.test_x.TestX.test_a": 2.0})
+
+	def test_collect_uses_one_marker_expression(self):
+		completed = subprocess.CompletedProcess([], 0, stdout=f"{NODE.format('b')}\n{NODE.format('a')}\n\n2 tests\n")
+		cases = {("unit", "feature"): "unit or feature", (): "not performance"}
+		for markers, expression in cases.items():
+			with self.subTest(markers=markers), mock.patch.object(test_sharding.subprocess, "run",
+																return_value=completed) as run:
+				self.assertEqual(test_sharding.collect_tests(markers), [NODE.format("a"), NODE.format("b")])
+				cmd = run.call_args[0][0]
+				self.assertEqual(cmd.count("-m"), 2)
+				self.assertEqual(cmd[cmd.index("-m", cmd.index("pytest")) + 1], expression)
+
+	def test_merge_shard_reports(self):
+		report_dir = Path(self.workspace_dir, "test_reports")
+		with mock.patch.object(test_sharding, "REPORT_DIR", report_dir):
+			junit_report(test_sharding.shard_report_path(1, 3), [("a", 1.5, False), ("b", 0.5, False)],
+						tests=2, failures=1, errors=0, skipped=0, time=2.0)
+			junit_report(test_sharding.shard_report_path(3, 3), [("c", 0.25, True)],
+						tests=1, failures=0, errors=0, skipped=1, time=0.25)
+			reports, missing = test_sharding.shard_reports(3)
+			self.assertEqual(missing, [2])
+			self.assertEqual(reports, [report_dir / "junit-shard-1-of-3.xml", report_dir / "junit-shard-3-of-3.xml"])
+
+			output = report_dir / "merged" / "junit-merged.xml"
+			totals = test_sharding.merge_reports(reports, output)
+
+		self.assertEqual(totals, {"tests": 3, "failures": 1, "errors": 0, "skipped": 1, "time": 2.25})
+		root = ET.parse(output).getroot()
+		self.assertEqual(root.tag, "testsuites")
+		self.assertEqual(root.get("tests"), "3")
+		self.assertEqual(root.get("time"), "2.250")
+		self.assertEqual([case.get("name") for case in root.iter("testcase")], ["test_a", "test_b", "test_c"])
+
+
+if __name__ == "__main__":
+	unittest.main()